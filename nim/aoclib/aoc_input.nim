@@ -1,5 +1,5 @@
 # nim/aoclib/aoc_input.nim
-import std/[os, strformat, strutils]
+import std/[os, strformat, strutils, tables]
 
 proc readInput*(year: int; day: int; part: int = 1): string =
   ## Legge l'input AoC da data/{year}/day_{NN}/input_{part}.txt
@@ -31,3 +31,37 @@ proc readInput*(year: int; day: int; part: int = 1): string =
 proc readLines*(year: int; day: int; part: int = 1): string =
   ## Ritorna le righe come seq[string]
   readInput(year, day, part)
+
+proc readAnswers*(year: int): Table[(int, int), string] =
+  ## Legge il registro delle risposte accettate: data/{year}/answers.txt
+  ##
+  ## Formato (condiviso con Python e Rust), una riga per parte:
+  ##   {day} {part} {answer}
+  ## Righe vuote o che iniziano con '#' sono ignorate.
+  ## Se il file non esiste ritorna una tabella vuota.
+  result = initTable[(int, int), string]()
+
+  let candidates = @[
+    &"data/{year}/answers.txt",
+    &"../data/{year}/answers.txt",
+    &"../../data/{year}/answers.txt"
+  ]
+
+  for path in candidates:
+    if fileExists(path):
+      for raw in readFile(path).splitLines():
+        let line = raw.strip()
+        if line.len == 0 or line.startsWith("#"):
+          continue
+        let fields = line.splitWhitespace(maxsplit = 2)
+        if fields.len < 3:
+          continue
+        try:
+          result[(parseInt(fields[0]), parseInt(fields[1]))] = fields[2].strip()
+        except ValueError:
+          discard
+      return
+
+proc expectedAnswer*(year: int; day: int; part: int): string =
+  ## Risposta accettata per year/day/part, "" se non registrata
+  readAnswers(year).getOrDefault((day, part), "")
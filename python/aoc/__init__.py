@@ -0,0 +1,20 @@
+"""
+Tooling to run the Python solutions in bulk.
+
+Entry point:
+    cd python
+    python -m aoc run --years 2015,2016,2023-2025 --jobs 8
+"""
+from __future__ import annotations
+
+from aoc.discovery import SolutionModule, discover, parse_int_ranges
+from aoc.runner import Task, TaskResult, run_tasks
+
+__all__ = [
+    "SolutionModule",
+    "Task",
+    "TaskResult",
+    "discover",
+    "parse_int_ranges",
+    "run_tasks",
+]
@@ -0,0 +1,548 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+
+PYTHON_DIR = Path(__file__).resolve().parents[1]
+if str(PYTHON_DIR) not in sys.path:
+    sys.path.append(str(PYTHON_DIR))
+
+from aoc import bench
+from aoc.answers import CHECK_MISMATCH, AnswerRegistry, verify
+from aoc.langs import LANGS, LangResult, run_nim, run_rust
+from aoc.discovery import BOTH, discover, parse_int_ranges, part_label
+from aoc.imports import audit_imports, print_imports
+from aoc.profiling import MODES, PROFILE_DIR, profile_stem
+from aoc.report import export, format_seconds, print_allocations, print_summary, print_table
+from aoc.paths import SOCKET_PATH
+from aoc.runner import Task, TaskResult, build_tasks, prefer_both, run_tasks, split_both
+from aoc.server import SolverServer, request
+from aoc.store import DEFAULT_DB, ResultStore, split_incremental, with_hashes
+from aoclib.parallel import available_cpus
+
+
+# Budget di import per modulo nel bench: le librerie pesanti vanno importate
+# con aoclib.lazy.lazy_import, non in testa al file
+IMPORT_BUDGET_MS = 50.0
+
+
+def _add_selection_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-y", "--years",
+        type=parse_int_ranges,
+        default=None,
+        help="Anni da eseguire, es. 2015,2016,2023-2025 (default: tutti)",
+    )
+    parser.add_argument(
+        "-d", "--days",
+        type=parse_int_ranges,
+        default=None,
+        help="Giorni da eseguire, es. 1-5,12 (default: tutti)",
+    )
+    parser.add_argument(
+        "-p", "--parts",
+        type=parse_int_ranges,
+        default=[1, 2],
+        help="Parti da eseguire (default: 1,2)",
+    )
+
+
+def _add_execution_args(parser: argparse.ArgumentParser, jobs: int, timeout: float) -> None:
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=jobs,
+        help=f"Numero di processi in parallelo (default: {jobs})",
+    )
+    parser.add_argument(
+        "-t", "--timeout",
+        type=float,
+        default=timeout,
+        help="Timeout per singola parte, in secondi (0 = nessun timeout)",
+    )
+    parser.add_argument(
+        "--show-output",
+        action="store_true",
+        help="Non silenziare lo stdout delle soluzioni",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=MODES,
+        default=None,
+        help="Profila ogni parte: 'cprofile' (.pstats + .folded) o 'sample' (campionamento via segnali)",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=PROFILE_DIR,
+        help=f"Cartella per i profili (default: {PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=5.0,
+        help="Intervallo di campionamento in ms per --profile sample (default: 5)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Misura il picco con tracemalloc e i principali punti di allocazione (più lento)",
+    )
+    parser.add_argument(
+        "--memory-top",
+        type=int,
+        default=5,
+        help="Quanti punti di allocazione mostrare con --memory (default: 5)",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        default=None,
+        help="Budget di memoria per parte in MiB (picco tracemalloc se --memory, altrimenti max RSS)",
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc",
+        description="Strumenti per eseguire in blocco le soluzioni Python di Advent of Code.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Esegue le soluzioni in parallelo e stampa una tabella dei tempi.")
+    _add_selection_args(run)
+    _add_execution_args(run, jobs=available_cpus(), timeout=300.0)
+    run.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=None,
+        help="Esporta i risultati in .json o .csv",
+    )
+    run.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Riesegue solo le parti il cui codice (o helper importati) o input è cambiato",
+    )
+    run.add_argument(
+        "--store",
+        type=Path,
+        default=DEFAULT_DB,
+        help=f"Database SQLite dei risultati (default: {DEFAULT_DB})",
+    )
+
+    bn = sub.add_parser(
+        "bench",
+        help="Benchmark con warmup e ripetizioni, confrontato con la baseline della macchina.",
+    )
+    _add_selection_args(bn)
+    # default 1 job: i benchmark in parallelo si disturbano a vicenda
+    _add_execution_args(bn, jobs=1, timeout=600.0)
+    bn.add_argument(
+        "-i", "--inputs",
+        type=lambda s: [x.strip() for x in s.split(",") if x.strip()],
+        default=[bench.INPUT_REAL],
+        help="Input da usare: 'input' (data/), 'test' (stringhe test nel __main__) o 'input,test'",
+    )
+    bn.add_argument("-w", "--warmup", type=int, default=1, help="Esecuzioni di warmup (default: 1)")
+    bn.add_argument("-n", "--repeat", type=int, default=5, help="Ripetizioni misurate (default: 5)")
+    bn.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Regressione se la mediana peggiora oltre questa frazione (default: 0.10)",
+    )
+    bn.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.005,
+        help="Differenza minima in secondi per considerare una regressione (default: 0.005)",
+    )
+    bn.add_argument("--machine", default=bench.machine_name(), help="Nome della baseline")
+    bn.add_argument("--baseline", type=Path, default=None, help="File baseline esplicito")
+    bn.add_argument("--save", action="store_true", help="Aggiorna la baseline con questi risultati")
+    bn.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disabilita input_cache (misura anche il parsing a ogni ripetizione)",
+    )
+    bn.add_argument("-o", "--output", type=Path, default=None, help="Esporta i risultati grezzi")
+    bn.add_argument(
+        "--import-budget",
+        type=float,
+        default=IMPORT_BUDGET_MS,
+        help=f"Tempo massimo di import per modulo, in ms (default: {IMPORT_BUDGET_MS:g}, 0 = nessun controllo)",
+    )
+
+    im = sub.add_parser(
+        "imports",
+        help="Misura il tempo di import di ogni modulo (python -X importtime).",
+    )
+    _add_selection_args(im)
+    im.add_argument("-n", "--repeat", type=int, default=3, help="Import ripetuti, tiene il più veloce (default: 3)")
+    im.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="Segnala (ed esce con 1) i moduli oltre questo tempo di import, in ms",
+    )
+    im.add_argument("--top", type=int, default=3, help="Import più pesanti da mostrare per modulo (default: 3)")
+
+    vf = sub.add_parser(
+        "verify",
+        help="Confronta le risposte (Python, Rust, Nim) con data/{year}/answers.txt",
+    )
+    _add_selection_args(vf)
+    vf.add_argument(
+        "-l", "--langs",
+        type=lambda s: [x.strip() for x in s.split(",") if x.strip()],
+        default=list(LANGS),
+        help="Linguaggi da eseguire (default: python,rust,nim)",
+    )
+    vf.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=available_cpus(),
+        help="Processi in parallelo per le soluzioni Python",
+    )
+    vf.add_argument("-t", "--timeout", type=float, default=300.0, help="Timeout per programma/parte")
+    vf.add_argument(
+        "--accept",
+        action="store_true",
+        help="Registra le risposte mancanti quando tutti i linguaggi eseguiti concordano",
+    )
+
+    sv = sub.add_parser(
+        "serve",
+        help="Demone che tiene moduli e input caldi e risponde su un socket Unix.",
+    )
+    sv.add_argument("--socket", type=Path, default=SOCKET_PATH, help=f"Path del socket (default: {SOCKET_PATH})")
+    sv.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=available_cpus(),
+        help="Processi worker (default: numero di CPU)",
+    )
+    sv.add_argument("--show-output", action="store_true", help="Non silenziare lo stdout delle soluzioni")
+
+    ask = sub.add_parser("ask", help="Chiede una soluzione al demone di `serve`.")
+    ask.add_argument("year", type=int)
+    ask.add_argument("day", type=int)
+    ask.add_argument(
+        "-p", "--parts",
+        type=parse_int_ranges,
+        default=[1, 2],
+        help="Parti da chiedere (default: 1,2)",
+    )
+    ask.add_argument("--test", type=Path, default=None, help="File da passare come test_string invece dell'input")
+    ask.add_argument("--socket", type=Path, default=SOCKET_PATH, help=f"Path del socket (default: {SOCKET_PATH})")
+
+    return parser.parse_args(argv)
+
+
+def _import_budget(ms: float | None) -> float | None:
+    return ms / 1000.0 if ms else None
+
+
+def _configure(tasks: list[Task], args: argparse.Namespace) -> list[Task]:
+    """Apply the profiling / memory options shared by run and bench."""
+    out: list[Task] = []
+    for t in tasks:
+        if args.profile is not None:
+            t = dataclasses.replace(
+                t,
+                profile=args.profile,
+                profile_stem=profile_stem(args.profile_dir, t.year, t.day, t.part, t.input_label),
+                sample_interval=args.sample_interval / 1000.0,
+            )
+        if args.memory:
+            t = dataclasses.replace(t, trace_memory=True, memory_top=args.memory_top)
+        out.append(t)
+    return out
+
+
+def _budget_kb(args: argparse.Namespace) -> int | None:
+    return None if args.memory_budget is None else int(args.memory_budget * 1024)
+
+
+def _progress(result: TaskResult) -> None:
+    print(
+        f"  {result.year} day {result.day:02d} part {part_label(result.part)} "
+        f"[{result.input_label}]: {result.status}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    modules = discover(args.years, args.days)
+    tasks, skipped = build_tasks(modules, args.parts)
+
+    store = ResultStore(args.store)
+    input_paths = {(m.year, m.day): m.input_path for m in modules}
+    to_run, cached, hashes = split_incremental(tasks, store, input_paths)
+    if not args.incremental:
+        to_run, cached = tasks, []
+    # days with solve_both answer both parts with one call
+    to_run = _configure(prefer_both(to_run, modules), args)
+
+    merged = sum(1 for t in to_run if t.part == BOTH)
+    print(
+        f"[RUN] {len(to_run) + merged} parti da {len(modules)} moduli ({len(skipped)} saltate, "
+        f"{len(cached)} invariate, {merged} giorni con solve_both), jobs={args.jobs}",
+        file=sys.stderr,
+    )
+
+    t0 = time.perf_counter()
+    results = split_both(run_tasks(
+        to_run,
+        jobs=args.jobs,
+        timeout=args.timeout or None,
+        quiet=not args.show_output,
+        memory_budget_kb=_budget_kb(args),
+        on_result=_progress,
+    ))
+    wall = time.perf_counter() - t0
+
+    # profiled / traced runs are slower than normal: don't record their timings
+    if args.profile is None and not args.memory:
+        store.save(with_hashes(results, hashes))
+    store.close()
+
+    results.extend(cached)
+    results.extend(skipped)
+    verify(results, AnswerRegistry())
+    print_table(results, sys.stdout)
+    print_allocations(results, sys.stdout)
+    print_summary(results, wall, sys.stdout)
+
+    if args.output is not None:
+        export(results, args.output)
+        print(f"[OK] Scritto {args.output}", file=sys.stderr)
+    if args.profile is not None:
+        print(f"[OK] Profili in {args.profile_dir}", file=sys.stderr)
+
+    failed = sum(1 for r in results if r.status in ("error", "timeout", "crashed"))
+    over = sum(1 for r in results if r.over_budget)
+    mismatches = sum(1 for r in results if r.check == CHECK_MISMATCH)
+    return 1 if (failed or over or mismatches) else 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    if args.no_cache:
+        os.environ["AOC_CACHE"] = "0"
+
+    modules = discover(args.years, args.days)
+    tasks, skipped = bench.build_bench_tasks(
+        modules, args.parts, args.inputs, warmup=args.warmup, repeat=args.repeat
+    )
+    tasks = _configure(tasks, args)
+    print(
+        f"[BENCH] {len(tasks)} benchmark ({len(skipped)} saltati), "
+        f"warmup={args.warmup} repeat={args.repeat} jobs={args.jobs}",
+        file=sys.stderr,
+    )
+
+    results = run_tasks(
+        tasks,
+        jobs=args.jobs,
+        timeout=args.timeout or None,
+        quiet=not args.show_output,
+        memory_budget_kb=_budget_kb(args),
+        on_result=_progress,
+    )
+
+    path = args.baseline or bench.baseline_path(args.machine)
+    comparisons = bench.compare(
+        results, bench.load_baseline(path), args.threshold, args.min_delta
+    )
+    bench.print_comparisons(comparisons, sys.stdout)
+    bench.print_both_savings(results, sys.stdout)
+    bench.print_failures(results, sys.stdout)
+    print_allocations(results, sys.stdout)
+
+    if args.output is not None:
+        export(results + skipped, args.output)
+        print(f"[OK] Scritto {args.output}", file=sys.stderr)
+
+    if args.profile is not None:
+        print(f"[OK] Profili in {args.profile_dir}", file=sys.stderr)
+
+    if args.save:
+        bench.save_baseline(path, args.machine, results)
+        print(f"[OK] Baseline aggiornata: {path}", file=sys.stderr)
+
+    slow_imports = []
+    if args.import_budget:
+        benched = {(t.year, t.day) for t in tasks}
+        reports = audit_imports(
+            [m for m in modules if (m.year, m.day) in benched],
+            budget=_import_budget(args.import_budget),
+        )
+        slow_imports = [r for r in reports if r.over_budget or r.status != "ok"]
+        if slow_imports:
+            print(f"\nImport oltre il budget di {args.import_budget:g} ms:")
+            print_imports(slow_imports, sys.stdout)
+
+    regressions = [c for c in comparisons if c.regressed]
+    failed = [r for r in results if r.status in ("error", "timeout", "crashed")]
+    over = [r for r in results if r.over_budget]
+    if regressions:
+        print(f"\n{len(regressions)} regressioni oltre il {args.threshold:.0%}", file=sys.stderr)
+    if over:
+        print(f"{len(over)} parti oltre il budget di memoria", file=sys.stderr)
+    if slow_imports:
+        print(f"{len(slow_imports)} moduli oltre il budget di import", file=sys.stderr)
+    return 1 if (regressions or failed or over or slow_imports) else 0
+
+
+def cmd_imports(args: argparse.Namespace) -> int:
+    modules = discover(args.years, args.days)
+    print(f"[IMPORTS] {len(modules)} moduli, repeat={args.repeat}", file=sys.stderr)
+    reports = audit_imports(modules, repeat=args.repeat, budget=_import_budget(args.budget))
+    reports.sort(key=lambda r: (r.year, r.day))
+    print_imports(reports, sys.stdout, top=args.top)
+
+    ok = [r for r in reports if r.seconds is not None]
+    if ok:
+        slowest = max(ok, key=lambda r: r.seconds or 0.0)
+        print(
+            f"\n{len(ok)} moduli, totale {format_seconds(sum(r.seconds or 0.0 for r in ok))}, "
+            f"il più lento {slowest.year}/{slowest.day:02d} ({format_seconds(slowest.seconds)})"
+        )
+    bad = [r for r in reports if r.over_budget or r.status != "ok"]
+    return 1 if bad else 0
+
+
+def _cell(answer: str | None, expected: str | None, seconds: float | None, status: str) -> str:
+    if status != "ok":
+        return status
+    if answer is None:
+        return "-"
+    mark = "" if expected is None else (" ok" if answer == expected else " MISMATCH")
+    return f"{answer}{mark} ({format_seconds(seconds)})"
+
+
+def cmd_verify(args: argparse.Namespace) -> int:
+    unknown = set(args.langs) - set(LANGS)
+    if unknown:
+        print(f"[ERRORE] Linguaggi sconosciuti: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    registry = AnswerRegistry()
+    modules = discover(args.years, args.days)
+    years = args.years or sorted({m.year for m in modules})
+    timeout = args.timeout or None
+
+    # (year, day, part) -> lang -> (answer, seconds, status)
+    table: dict[tuple[int, int, int], dict[str, tuple[str | None, float | None, str]]] = {}
+
+    if "python" in args.langs:
+        tasks, _skipped = build_tasks(modules, args.parts)
+        tasks = prefer_both(tasks, modules)
+        for r in split_both(run_tasks(tasks, jobs=args.jobs, timeout=timeout, on_result=_progress)):
+            table.setdefault((r.year, r.day, r.part), {})["python"] = (r.answer, r.seconds, r.status)
+
+    other: list[LangResult] = []
+    if "rust" in args.langs:
+        other += run_rust(years, args.days, timeout)
+    if "nim" in args.langs:
+        other += run_nim(years, args.days, timeout)
+    for lr in other:
+        for part in args.parts:
+            table.setdefault((lr.year, lr.day, part), {})[lr.lang] = (
+                lr.answers.get(part), lr.seconds, lr.status
+            )
+
+    langs = [lang for lang in LANGS if lang in args.langs]
+    header = ["Year", "Day", "Part", "Expected", *langs]
+    rows: list[list[str]] = []
+    mismatches = missing = accepted = 0
+
+    for (year, day, part), by_lang in sorted(table.items()):
+        expected = registry.expected(year, day, part)
+        answers = {a for a, _s, st in by_lang.values() if st == "ok" and a is not None}
+        if expected is None:
+            missing += 1
+            if args.accept and len(answers) == 1:
+                registry.record(year, day, part, answers.pop())
+                accepted += 1
+        else:
+            mismatches += sum(1 for a in answers if a != expected)
+
+        cells = [
+            _cell(by_lang[lang][0], expected, by_lang[lang][1], by_lang[lang][2])
+            if lang in by_lang else ""
+            for lang in langs
+        ]
+        rows.append([str(year), f"{day:02d}", str(part), expected or "-", *cells])
+
+    widths = [max(len(h), *(len(r[i]) for r in rows)) if rows else len(h) for i, h in enumerate(header)]
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)).rstrip())
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)).rstrip())
+
+    print(f"\n{len(rows)} parti: {mismatches} mismatch, {missing} senza risposta registrata")
+    print("Tempi: Python = solo solve_N (solve_both: stesso tempo su entrambe le parti); Rust/Nim = intero processo")
+    if accepted:
+        for path in registry.save():
+            print(f"[OK] Aggiornato {path}", file=sys.stderr)
+
+    return 1 if mismatches else 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    server = SolverServer(args.socket, workers=args.jobs, quiet=not args.show_output)
+    print(f"[SERVE] {args.socket} ({server.workers} worker)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except RuntimeError as exc:
+        print(f"[ERRORE] {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def cmd_ask(args: argparse.Namespace) -> int:
+    test_string = None if args.test is None else args.test.read_text(encoding="utf-8")
+    failed = 0
+    for part in args.parts:
+        payload = {"year": args.year, "day": args.day, "part": part, "test": test_string}
+        try:
+            response = request(payload, args.socket)
+        except OSError as exc:
+            print(f"[ERRORE] Server non raggiungibile su {args.socket}: {exc}", file=sys.stderr)
+            return 2
+        if response["ok"]:
+            warm = "" if response["reloaded"] else ", caldo"
+            print(f"Part {part}: {response['answer']} ({format_seconds(response['seconds'])}{warm})")
+        else:
+            failed += 1
+            print(f"Part {part}: {response['status']} - {response['error']}")
+    return 1 if failed else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.command == "run":
+        return cmd_run(args)
+    if args.command == "bench":
+        return cmd_bench(args)
+    if args.command == "verify":
+        return cmd_verify(args)
+    if args.command == "imports":
+        return cmd_imports(args)
+    if args.command == "serve":
+        return cmd_serve(args)
+    if args.command == "ask":
+        return cmd_ask(args)
+    raise AssertionError(f"Unknown command {args.command!r}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+from aoc.paths import REPO_ROOT
+from aoc.runner import TaskResult
+
+ANSWERS_FILE = "answers.txt"
+
+# Result of checking an answer against the registry
+CHECK_OK = "ok"
+CHECK_MISMATCH = "MISMATCH"
+CHECK_MISSING = "missing"
+
+
+def answers_path(year: int, root: Path = REPO_ROOT) -> Path:
+    """data/{year}/answers.txt, next to the inputs (shared with Rust and Nim)."""
+    return root / "data" / str(year) / ANSWERS_FILE
+
+
+def normalize(answer: object) -> str:
+    return str(answer).strip()
+
+
+class AnswerRegistry:
+    """
+    Accepted answers, one plain-text file per year:
+
+        # day part answer
+        1 1 280
+        1 2 1797
+
+    The format is deliberately trivial so that `aoclib` (Rust) and
+    `aoclib/aoc_input.nim` can read it without extra dependencies.
+    """
+
+    def __init__(self, root: Path = REPO_ROOT) -> None:
+        self.root = root
+        self._years: dict[int, dict[tuple[int, int], str]] = {}
+        self._dirty: set[int] = set()
+
+    def _load(self, year: int) -> dict[tuple[int, int], str]:
+        if year in self._years:
+            return self._years[year]
+
+        answers: dict[tuple[int, int], str] = {}
+        path = answers_path(year, self.root)
+        if path.exists():
+            for raw in path.read_text(encoding="utf-8").splitlines():
+                line = raw.strip()
+                if not line or line.startswith("#"):
+                    continue
+                fields = line.split(maxsplit=2)
+                if len(fields) < 3:
+                    continue
+                try:
+                    answers[(int(fields[0]), int(fields[1]))] = fields[2].strip()
+                except ValueError:
+                    continue
+        self._years[year] = answers
+        return answers
+
+    def expected(self, year: int, day: int, part: int) -> str | None:
+        return self._load(year).get((day, part))
+
+    def check(self, year: int, day: int, part: int, answer: object) -> str:
+        expected = self.expected(year, day, part)
+        if expected is None:
+            return CHECK_MISSING
+        return CHECK_OK if normalize(answer) == expected else CHECK_MISMATCH
+
+    def record(self, year: int, day: int, part: int, answer: object) -> None:
+        self._load(year)[(day, part)] = normalize(answer)
+        self._dirty.add(year)
+
+    def save(self) -> list[Path]:
+        written: list[Path] = []
+        for year in sorted(self._dirty):
+            path = answers_path(year, self.root)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            lines = ["# day part answer"]
+            lines += [
+                f"{day} {part} {answer}"
+                for (day, part), answer in sorted(self._years[year].items())
+            ]
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            written.append(path)
+        self._dirty.clear()
+        return written
+
+
+def verify(results: Iterable[TaskResult], registry: AnswerRegistry) -> None:
+    """Fill `check` / `expected` on real-input results."""
+    for r in results:
+        if r.input_label != "input" or r.status != "ok":
+            continue
+        r.expected = registry.expected(r.year, r.day, r.part)
+        r.check = registry.check(r.year, r.day, r.part, r.answer)
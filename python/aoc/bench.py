@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import json
+import platform
+import re
+import statistics
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, TextIO
+
+from aoc.discovery import BOTH, PARTS, SolutionModule, inline_tests, part_label, test_parts
+from aoc.paths import BENCH_DIR
+from aoc.report import format_seconds
+from aoc.runner import Task, TaskResult
+
+# Baselines are committed: one JSON per machine
+BASELINE_DIR = BENCH_DIR / "baselines"
+
+INPUT_REAL = "input"
+
+
+@dataclass(frozen=True, slots=True)
+class Stats:
+    min: float
+    median: float
+    stdev: float
+    repeat: int
+
+    @staticmethod
+    def of(samples: list[float]) -> Stats:
+        return Stats(
+            min=min(samples),
+            median=statistics.median(samples),
+            stdev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            repeat=len(samples),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    key: str
+    current: Stats
+    baseline: Stats | None
+    threshold: float
+    min_delta: float
+
+    @property
+    def ratio(self) -> float | None:
+        if self.baseline is None or self.baseline.median == 0:
+            return None
+        return self.current.median / self.baseline.median
+
+    @property
+    def regressed(self) -> bool:
+        if self.baseline is None:
+            return False
+        delta = self.current.median - self.baseline.median
+        return delta > self.min_delta and delta > self.baseline.median * self.threshold
+
+
+def machine_name() -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", platform.node() or "unknown")
+
+
+def baseline_path(machine: str) -> Path:
+    return BASELINE_DIR / f"{machine}.json"
+
+
+def result_key(r: TaskResult) -> str:
+    return f"{r.year}/{r.day:02d}/{part_label(r.part)}/{r.input_label}"
+
+
+def build_bench_tasks(
+    modules: Iterable[SolutionModule],
+    parts: Iterable[int],
+    inputs: Iterable[str],
+    warmup: int,
+    repeat: int,
+) -> tuple[list[Task], list[TaskResult]]:
+    """
+    One task per (day, part, input). `inputs` may contain "input" (the real
+    file under data/) and/or "test" (inline test strings from `__main__`).
+    Days with `solve_both` also get a BOTH task when both parts are
+    benchmarked, to compare it with solve_1 + solve_2.
+    """
+    wanted_parts = set(parts)
+    wanted_inputs = set(inputs)
+    tasks: list[Task] = []
+    skipped: list[TaskResult] = []
+
+    for mod in modules:
+        runnable = [p for p in sorted(wanted_parts) if p in mod.parts]
+        if mod.has_both and all(p in runnable for p in PARTS):
+            runnable.append(BOTH)
+        for part in sorted(wanted_parts):
+            if part in mod.skipped:
+                skipped.append(
+                    TaskResult(mod.year, mod.day, part, "skipped", detail=mod.skipped[part])
+                )
+
+        if INPUT_REAL in wanted_inputs:
+            for part in runnable:
+                if mod.input_path.exists():
+                    tasks.append(Task(
+                        mod.year, mod.day, part, mod.path, mod.module_name,
+                        warmup=warmup, repeat=repeat,
+                    ))
+                else:
+                    skipped.append(TaskResult(
+                        mod.year, mod.day, part, "no-input", detail=str(mod.input_path)
+                    ))
+
+        if "test" in wanted_inputs:
+            for name, text in inline_tests(mod.path).items():
+                for part in runnable:
+                    if part not in test_parts(name) and not (part == BOTH and test_parts(name) == PARTS):
+                        continue
+                    tasks.append(Task(
+                        mod.year, mod.day, part, mod.path, mod.module_name,
+                        input_label=name, test_string=text,
+                        warmup=warmup, repeat=repeat,
+                    ))
+
+    return tasks, skipped
+
+
+def load_baseline(path: Path) -> dict[str, Stats]:
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        key: Stats(min=v["min"], median=v["median"], stdev=v["stdev"], repeat=v["repeat"])
+        for key, v in data.get("results", {}).items()
+    }
+
+
+def save_baseline(path: Path, machine: str, results: Iterable[TaskResult]) -> None:
+    """Merge the successful results into the machine's baseline file."""
+    existing: dict[str, dict] = {}
+    if path.exists():
+        existing = json.loads(path.read_text(encoding="utf-8")).get("results", {})
+
+    for r in results:
+        if r.status != "ok" or not r.samples:
+            continue
+        st = Stats.of(r.samples)
+        existing[result_key(r)] = {
+            "min": st.min,
+            "median": st.median,
+            "stdev": st.stdev,
+            "repeat": st.repeat,
+            "answer": r.answer,
+        }
+
+    payload = {
+        "machine": machine,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "updated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": dict(sorted(existing.items())),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def compare(
+    results: Iterable[TaskResult],
+    baseline: dict[str, Stats],
+    threshold: float,
+    min_delta: float,
+) -> list[Comparison]:
+    out: list[Comparison] = []
+    for r in sorted(results, key=lambda r: r.key):
+        if r.status != "ok" or not r.samples:
+            continue
+        key = result_key(r)
+        out.append(Comparison(key, Stats.of(r.samples), baseline.get(key), threshold, min_delta))
+    return out
+
+
+def print_comparisons(comparisons: list[Comparison], out: TextIO) -> None:
+    header = ("Benchmark", "min", "median", "stdev", "n", "baseline", "change")
+    rows: list[tuple[str, ...]] = []
+    for c in comparisons:
+        if c.baseline is None:
+            base, change = "-", "new"
+        else:
+            base = format_seconds(c.baseline.median)
+            ratio = c.ratio
+            change = "-" if ratio is None else f"{(ratio - 1) * 100:+.1f}%"
+            if c.regressed:
+                change += "  REGRESSION"
+        rows.append((
+            c.key,
+            format_seconds(c.current.min),
+            format_seconds(c.current.median),
+            format_seconds(c.current.stdev),
+            str(c.current.repeat),
+            base,
+            change,
+        ))
+
+    widths = [max(len(h), *(len(r[i]) for r in rows)) if rows else len(h)
+              for i, h in enumerate(header)]
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)).rstrip(), file=out)
+    print("  ".join("-" * w for w in widths), file=out)
+    for row in rows:
+        print("  ".join(
+            cell.ljust(w) if i == 0 or i == len(row) - 1 else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip(), file=out)
+
+
+def print_failures(results: Iterable[TaskResult], out: TextIO = sys.stdout) -> None:
+    for r in sorted(results, key=lambda r: r.key):
+        if r.status in ("error", "timeout", "crashed"):
+            print(f"[{r.status.upper()}] {result_key(r)}: {r.detail}", file=out)
+
+
+def print_both_savings(results: Iterable[TaskResult], out: TextIO = sys.stdout) -> None:
+    """Median of solve_both against the sum of the solve_1 and solve_2 medians."""
+    medians: dict[tuple[int, int, str], dict[int, float]] = {}
+    for r in results:
+        if r.status == "ok" and r.samples:
+            key = (r.year, r.day, r.input_label)
+            medians.setdefault(key, {})[r.part] = statistics.median(r.samples)
+
+    rows: list[tuple[str, ...]] = []
+    for (year, day, label), by_part in sorted(medians.items()):
+        if BOTH not in by_part or not all(p in by_part for p in PARTS):
+            continue
+        separate = sum(by_part[p] for p in PARTS)
+        both = by_part[BOTH]
+        saving = "-" if separate == 0 else f"{(1 - both / separate) * 100:+.1f}%"
+        rows.append((
+            f"{year}/{day:02d}/{label}",
+            format_seconds(separate),
+            format_seconds(both),
+            format_seconds(separate - both),
+            saving,
+        ))
+    if not rows:
+        return
+
+    header = ("solve_both", "1 + 2", "both", "saved", "saving")
+    widths = [max(len(h), *(len(r[i]) for r in rows)) for i, h in enumerate(header)]
+    print("", file=out)
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)).rstrip(), file=out)
+    print("  ".join("-" * w for w in widths), file=out)
+    for row in rows:
+        print("  ".join(
+            cell.ljust(w) if i == 0 else cell.rjust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip(), file=out)
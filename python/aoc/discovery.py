@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import ast
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from aoc.paths import SOLUTIONS_DIR
+from get_input import GetInput
+
+DAY_FILE_RE = re.compile(r"^day_(\d{2})(?:_not_mine)?\.py$")
+PARTS: tuple[int, ...] = (1, 2)
+# Task part for a single `solve_both()` call that answers parts 1 and 2
+BOTH = 0
+
+
+def part_label(part: int) -> str:
+    return "both" if part == BOTH else str(part)
+
+
+@dataclass(frozen=True, slots=True)
+class SolutionModule:
+    """
+    A `day_NN.py` file found under python/aoc_solutions/{year}/.
+
+    `parts` holds the parts whose `solve_N` can be called with no arguments
+    (i.e. reads the real input through GetInput); `skipped` maps the other
+    parts to a short reason, so the runner can still list them. `has_both`
+    is set when the module also defines `solve_both(test_string=None) ->
+    (part1, part2)`, which computes the shared work once.
+    """
+
+    year: int
+    day: int
+    path: Path
+    parts: tuple[int, ...]
+    skipped: dict[int, str]
+    has_both: bool = False
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_solutions_{self.year}_{self.path.stem}"
+
+    @property
+    def input_path(self) -> Path:
+        return GetInput.input_path(self.year, self.day)
+
+
+def parse_int_ranges(spec: str) -> list[int]:
+    """Parse strings like '2015,2016,2023-2025' into a sorted list of ints."""
+    values: set[int] = set()
+    for chunk in spec.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        if "-" in chunk:
+            lo_s, hi_s = chunk.split("-", 1)
+            lo, hi = int(lo_s), int(hi_s)
+            if lo > hi:
+                raise ValueError(f"Invalid range {chunk!r}: {lo} > {hi}")
+            values.update(range(lo, hi + 1))
+        else:
+            values.add(int(chunk))
+    return sorted(values)
+
+
+def _callable_without_args(fn: ast.FunctionDef) -> bool:
+    args = fn.args
+    required = len(args.posonlyargs) + len(args.args) - len(args.defaults)
+    required_kw = sum(1 for d in args.kw_defaults if d is None)
+    return required == 0 and required_kw == 0
+
+
+def _inspect_file(path: Path) -> tuple[tuple[int, ...], dict[int, str], bool]:
+    """Look for solve_1/solve_2/solve_both without importing (no input I/O, no heavy imports)."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except SyntaxError as exc:
+        return (), {p: f"syntax error (line {exc.lineno})" for p in PARTS}, False
+
+    functions = {
+        node.name: node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef)
+    }
+
+    parts: list[int] = []
+    skipped: dict[int, str] = {}
+    for part in PARTS:
+        fn = functions.get(f"solve_{part}")
+        if fn is None:
+            skipped[part] = "missing"
+        elif not _callable_without_args(fn):
+            skipped[part] = "needs arguments"
+        else:
+            parts.append(part)
+    both = functions.get("solve_both")
+    return tuple(parts), skipped, both is not None and _callable_without_args(both)
+
+
+def discover(
+    years: Iterable[int] | None = None,
+    days: Iterable[int] | None = None,
+    *,
+    solutions_dir: Path = SOLUTIONS_DIR,
+) -> list[SolutionModule]:
+    """Every `day_NN.py` exposing `solve_1` and/or `solve_2`, ordered by (year, day)."""
+    year_filter = set(years) if years is not None else None
+    day_filter = set(days) if days is not None else None
+
+    found: list[SolutionModule] = []
+    for year_dir in sorted(solutions_dir.iterdir()):
+        if not year_dir.is_dir() or not year_dir.name.isdigit():
+            continue
+        year = int(year_dir.name)
+        if year_filter is not None and year not in year_filter:
+            continue
+
+        for path in sorted(year_dir.glob("day_*.py")):
+            m = DAY_FILE_RE.match(path.name)
+            if m is None:
+                continue
+            day = int(m.group(1))
+            if day_filter is not None and day not in day_filter:
+                continue
+
+            parts, skipped, has_both = _inspect_file(path)
+            if not parts and all(r == "missing" for r in skipped.values()):
+                continue
+            found.append(SolutionModule(
+                year=year, day=day, path=path, parts=parts, skipped=skipped, has_both=has_both
+            ))
+
+    return found
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    names = [n.id for n in ast.walk(node.test) if isinstance(n, ast.Name)]
+    consts = [n.value for n in ast.walk(node.test) if isinstance(n, ast.Constant)]
+    return "__name__" in names and "__main__" in consts
+
+
+def inline_tests(path: Path) -> dict[str, str]:
+    """
+    Inline example inputs from the `if __name__ == "__main__":` block:
+    string literals assigned to names starting with `test` (test, test_1, test2, ...).
+    """
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except SyntaxError:
+        return {}
+
+    tests: dict[str, str] = {}
+    for node in tree.body:
+        if not _is_main_guard(node):
+            continue
+        for stmt in ast.walk(node):
+            if not isinstance(stmt, ast.Assign):
+                continue
+            if not (isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str)):
+                continue
+            for target in stmt.targets:
+                if isinstance(target, ast.Name) and target.id.startswith("test"):
+                    tests[target.id] = stmt.value.value
+    return tests
+
+
+def test_parts(name: str) -> tuple[int, ...]:
+    """`test_2` / `test2` only apply to part 2, `test_1` / `test1` to part 1, the rest to both."""
+    if name.endswith("2"):
+        return (2,)
+    if name.endswith("1"):
+        return (1,)
+    return PARTS
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, TextIO
+
+from aoc.discovery import SolutionModule
+from aoc.report import format_seconds
+
+# "import time:       412 |       1234 |     numpy.core"
+_LINE = re.compile(r"^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S.*)$")
+
+
+@dataclass(frozen=True, slots=True)
+class ImportEntry:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(slots=True)
+class ImportReport:
+    year: int
+    day: int
+    status: str  # ok | error | timeout
+    seconds: float | None = None
+    # direct imports of the day module, heaviest first
+    heaviest: list[ImportEntry] = field(default_factory=list)
+    detail: str = ""
+    over_budget: bool = False
+
+
+def parse_importtime(stderr: str) -> list[ImportEntry]:
+    """Parse the `-X importtime` log (children are printed before their parent)."""
+    entries: list[ImportEntry] = []
+    for line in stderr.splitlines():
+        m = _LINE.match(line)
+        if m is None:
+            continue
+        self_us, cumulative_us, indent, name = m.groups()
+        # top-level imports are indented by one space, each level adds two
+        entries.append(
+            ImportEntry(name.strip(), int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+        )
+    return entries
+
+
+def module_imports(entries: list[ImportEntry], name: str) -> tuple[ImportEntry, list[ImportEntry]]:
+    """Entry for `name` and its direct children, heaviest first."""
+    for i in range(len(entries) - 1, -1, -1):
+        if entries[i].name == name:
+            break
+    else:
+        raise LookupError(f"{name} not found in the importtime log")
+
+    root = entries[i]
+    children: list[ImportEntry] = []
+    for entry in reversed(entries[:i]):
+        if entry.depth <= root.depth:
+            break
+        if entry.depth == root.depth + 1:
+            children.append(entry)
+    children.sort(key=lambda e: e.cumulative_us, reverse=True)
+    return root, children
+
+
+def _import_once(mod: SolutionModule, timeout: float | None) -> tuple[ImportEntry, list[ImportEntry]]:
+    name = mod.path.stem
+    code = f"import sys; sys.path.insert(0, {str(mod.path.parent)!r}); import {name}"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=mod.path.parent,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if proc.returncode != 0:
+        last = (proc.stderr.strip().splitlines() or ["?"])[-1]
+        raise RuntimeError(last)
+    return module_imports(parse_importtime(proc.stderr), name)
+
+
+def audit_module(mod: SolutionModule, *, repeat: int = 3, timeout: float | None = 60.0) -> ImportReport:
+    """
+    Import the day module in `repeat` fresh interpreters and keep the fastest
+    run (import time is noisy, mostly because of the disk cache).
+    """
+    best: tuple[ImportEntry, list[ImportEntry]] | None = None
+    try:
+        for _ in range(max(1, repeat)):
+            root, children = _import_once(mod, timeout)
+            if best is None or root.cumulative_us < best[0].cumulative_us:
+                best = (root, children)
+    except subprocess.TimeoutExpired:
+        return ImportReport(mod.year, mod.day, "timeout", detail=f"killed after {timeout:g}s")
+    except (RuntimeError, LookupError) as exc:
+        return ImportReport(mod.year, mod.day, "error", detail=str(exc))
+
+    assert best is not None
+    return ImportReport(mod.year, mod.day, "ok", best[0].cumulative_us / 1e6, best[1])
+
+
+def audit_imports(
+    modules: Iterable[SolutionModule],
+    *,
+    repeat: int = 3,
+    budget: float | None = None,
+    timeout: float | None = 60.0,
+) -> list[ImportReport]:
+    """Import time of every module; `budget` (seconds) flags the slow ones."""
+    reports: list[ImportReport] = []
+    for mod in modules:
+        report = audit_module(mod, repeat=repeat, timeout=timeout)
+        if budget is not None and report.seconds is not None:
+            report.over_budget = report.seconds > budget
+        reports.append(report)
+    return reports
+
+
+def print_imports(reports: list[ImportReport], out: TextIO, top: int = 3) -> None:
+    header = ["Year", "Day", "Import", "Heaviest imports"]
+    rows: list[list[str]] = []
+    for r in reports:
+        if r.status != "ok":
+            heaviest = r.detail
+        else:
+            heaviest = ", ".join(
+                f"{e.name} {format_seconds(e.cumulative_us / 1e6)}" for e in r.heaviest[:top]
+            )
+        took = format_seconds(r.seconds) if r.status == "ok" else r.status
+        if r.over_budget:
+            took += " (over budget)"
+        rows.append([str(r.year), f"{r.day:02d}", took, heaviest])
+
+    widths = [max(len(h), *(len(row[i]) for row in rows)) if rows else len(h) for i, h in enumerate(header)]
+    print("  ".join(h.ljust(w) for h, w in zip(header, widths)).rstrip(), file=out)
+    print("  ".join("-" * w for w in widths), file=out)
+    for row in rows:
+        print("  ".join(c.ljust(w) for c, w in zip(row, widths)).rstrip(), file=out)
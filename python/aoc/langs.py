@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from aoc.paths import REPO_ROOT
+
+RUST_DIR: Path = REPO_ROOT / "rust"
+NIM_DIR: Path = REPO_ROOT / "nim"
+LANGS: tuple[str, ...] = ("python", "rust", "nim")
+
+PART_LINE_RE = re.compile(r"^\s*Part\s+(\d+)\s*:\s*(.*?)\s*$")
+DAY_RE = re.compile(r"^day_(\d{2})$")
+
+
+@dataclass(slots=True)
+class LangResult:
+    """One Rust/Nim program run: both parts come from the same process."""
+
+    lang: str
+    year: int
+    day: int
+    status: str  # ok | error | timeout | build-error | unavailable
+    answers: dict[int, str] = field(default_factory=dict)
+    seconds: float | None = None  # whole process wall time (startup + both parts)
+    detail: str = ""
+
+
+def parse_parts(stdout: str) -> dict[int, str]:
+    """`Part 1: 123` lines, as printed by every template in this repo."""
+    answers: dict[int, str] = {}
+    for line in stdout.splitlines():
+        m = PART_LINE_RE.match(line)
+        if m is not None:
+            answers[int(m.group(1))] = m.group(2)
+    return answers
+
+
+def _days_in(directory: Path, suffix: str, days: set[int] | None) -> list[int]:
+    if not directory.is_dir():
+        return []
+    found: list[int] = []
+    for path in sorted(directory.glob(f"day_*{suffix}")):
+        m = DAY_RE.match(path.stem)
+        if m is not None and (days is None or int(m.group(1)) in days):
+            found.append(int(m.group(1)))
+    return found
+
+
+def _last_line(text: str) -> str:
+    lines = [ln for ln in text.strip().splitlines() if ln.strip()]
+    return lines[-1][:200] if lines else ""
+
+
+def _run_program(
+    cmd: list[str], lang: str, year: int, day: int, timeout: float | None
+) -> LangResult:
+    env = dict(os.environ, AOC_ROOT=str(REPO_ROOT))
+    t0 = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return LangResult(lang, year, day, "timeout", seconds=timeout, detail=f"killed after {timeout:g}s")
+    elapsed = time.perf_counter() - t0
+
+    if proc.returncode != 0:
+        return LangResult(lang, year, day, "error", seconds=elapsed, detail=_last_line(proc.stderr))
+    return LangResult(lang, year, day, "ok", parse_parts(proc.stdout), seconds=elapsed)
+
+
+def run_rust(
+    years: Iterable[int], days: Iterable[int] | None = None, timeout: float | None = None
+) -> list[LangResult]:
+    """Build each `y{year}` crate in release mode, then time every `day_NN` binary."""
+    day_filter = set(days) if days is not None else None
+    cargo = shutil.which("cargo")
+    results: list[LangResult] = []
+
+    for year in years:
+        bins = _days_in(RUST_DIR / "crates" / f"y{year}" / "src" / "bin", ".rs", day_filter)
+        if not bins:
+            continue
+        if cargo is None:
+            results += [LangResult("rust", year, d, "unavailable", detail="cargo not found") for d in bins]
+            continue
+
+        # Build one crate at a time: bin names (day_NN) repeat across years
+        build = subprocess.run(
+            [cargo, "build", "--release", "--quiet", "-p", f"y{year}"],
+            cwd=RUST_DIR, capture_output=True, text=True,
+        )
+        if build.returncode != 0:
+            detail = _last_line(build.stderr)
+            results += [LangResult("rust", year, d, "build-error", detail=detail) for d in bins]
+            continue
+
+        for day in bins:
+            exe = RUST_DIR / "target" / "release" / f"day_{day:02d}"
+            results.append(_run_program([str(exe)], "rust", year, day, timeout))
+
+    return results
+
+
+def run_nim(
+    years: Iterable[int], days: Iterable[int] | None = None, timeout: float | None = None
+) -> list[LangResult]:
+    """Compile each `nim/aoc_solutions/{year}/day_NN.nim` with -d:release and time it."""
+    day_filter = set(days) if days is not None else None
+    nim = shutil.which("nim")
+    results: list[LangResult] = []
+
+    with tempfile.TemporaryDirectory(prefix="aoc-nim-") as out_dir:
+        for year in years:
+            source_dir = NIM_DIR / "aoc_solutions" / str(year)
+            for day in _days_in(source_dir, ".nim", day_filter):
+                if nim is None:
+                    results.append(LangResult("nim", year, day, "unavailable", detail="nim not found"))
+                    continue
+
+                exe = Path(out_dir) / f"y{year}_day_{day:02d}"
+                build = subprocess.run(
+                    [nim, "c", "-d:release", "--hints:off", f"--out:{exe}",
+                     str(source_dir / f"day_{day:02d}.nim")],
+                    cwd=NIM_DIR, capture_output=True, text=True,
+                )
+                if build.returncode != 0:
+                    results.append(LangResult(
+                        "nim", year, day, "build-error", detail=_last_line(build.stderr or build.stdout)
+                    ))
+                    continue
+                results.append(_run_program([str(exe)], "nim", year, day, timeout))
+
+    return results
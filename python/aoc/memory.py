@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from types import TracebackType
+
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _format_site(stat: tracemalloc.Statistic) -> str:
+    frame = stat.traceback[0]
+    size_kib = stat.size / 1024
+    size = f"{size_kib / 1024:.1f} MiB" if size_kib >= 1024 else f"{size_kib:.0f} KiB"
+    return f"{size} in {stat.count} blocks at {os.path.basename(frame.filename)}:{frame.lineno}"
+
+
+@dataclass(slots=True)
+class PeakTracker:
+    """
+    tracemalloc peak of a block of code, plus its top allocation sites.
+
+    tracemalloc only gives the peak *size*: to know *where* the memory was at
+    that moment, a background thread polls the traced size every `interval`
+    seconds and takes a new snapshot whenever it grows by more than `growth`
+    over the last one. The sites are therefore those of the highest sampled
+    point, which for long-running parts is close to the real peak.
+    """
+
+    top: int = 5
+    interval: float = 0.05
+    growth: float = 1.10
+
+    peak_bytes: int = 0
+    sites: list[str] = field(default_factory=list)
+
+    _snapshot: tracemalloc.Snapshot | None = None
+    _snapshot_size: int = 0
+    _stop: threading.Event = field(default_factory=threading.Event)
+    _thread: threading.Thread | None = None
+
+    def _take_snapshot(self, current: int) -> None:
+        self._snapshot = tracemalloc.take_snapshot()
+        self._snapshot_size = current
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self._snapshot_size * self.growth:
+                self._take_snapshot(current)
+
+    def __enter__(self) -> PeakTracker:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._thread = threading.Thread(target=self._poll, name="aoc-peak-tracker", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        current, peak = tracemalloc.get_traced_memory()
+        # short parts may finish before the first poll
+        if self._snapshot is None or current > self._snapshot_size:
+            self._take_snapshot(current)
+        tracemalloc.stop()
+
+        self.peak_bytes = peak
+        assert self._snapshot is not None
+        stats = self._snapshot.filter_traces(_IGNORED).statistics("lineno")
+        self.sites = [_format_site(s) for s in stats[: self.top]]
+        self._snapshot = None
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from get_input import GetInput
+
+REPO_ROOT: Path = GetInput.default_root()
+SOLUTIONS_DIR: Path = REPO_ROOT / "python" / "aoc_solutions"
+
+# Benchmark baselines (committed), profiles and other reports
+BENCH_DIR: Path = REPO_ROOT / "benchmarks"
+
+# Unix socket of `python -m aoc serve` (next to the other local caches, outside git)
+SOCKET_PATH: Path = REPO_ROOT / "data" / ".cache" / "aoc.sock"
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import signal
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Iterator
+
+from aoc.discovery import part_label
+from aoc.paths import BENCH_DIR
+
+# Written next to the benchmark baselines, one folder per year
+PROFILE_DIR = BENCH_DIR / "profiles"
+
+MODES: tuple[str, ...] = ("cprofile", "sample")
+
+FuncKey = tuple[str, int, str]  # (filename, lineno, funcname) as in pstats
+
+
+def profile_stem(directory: Path, year: int, day: int, part: int, label: str) -> Path:
+    """e.g. benchmarks/profiles/2024/day_06_part_1_input (extension added by the writer)."""
+    return directory / str(year) / f"day_{day:02d}_part_{part_label(part)}_{label}"
+
+
+def _frame_label(filename: str, lineno: int, funcname: str) -> str:
+    if filename == "~":  # builtins in pstats, e.g. <built-in method builtins.len>
+        return funcname
+    return f"{funcname} ({os.path.basename(filename)}:{lineno})"
+
+
+def write_folded(stacks: Counter[tuple[str, ...]], path: Path) -> None:
+    """Collapsed-stack format (`a;b;c 123`), as consumed by flamegraph.pl / speedscope."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        for stack, weight in sorted(stacks.items()):
+            if weight > 0:
+                fh.write(f"{';'.join(stack)} {weight}\n")
+
+
+# -----------------------------
+# cProfile -> collapsed stacks
+# -----------------------------
+def pstats_to_folded(stats: pstats.Stats, max_depth: int = 64) -> Counter[tuple[str, ...]]:
+    """
+    Approximate collapsed stacks (weights in µs) from cProfile data.
+
+    cProfile only keeps caller -> callee edges, not whole stacks, so each
+    function's own time is spread over its call paths proportionally to the
+    cumulative time recorded on every edge (same idea as flameprof). Use the
+    `sample` mode when exact stacks matter.
+    """
+    raw: dict[FuncKey, tuple[int, int, float, float, dict[FuncKey, tuple]]] = stats.stats  # type: ignore[attr-defined]
+
+    callees: dict[FuncKey, list[tuple[FuncKey, float]]] = {}
+    for func, (_cc, _nc, _tt, _ct, callers) in raw.items():
+        for caller, edge in callers.items():
+            edge_ct = edge[3] if isinstance(edge, tuple) else 0.0
+            callees.setdefault(caller, []).append((func, edge_ct))
+
+    roots = [func for func, entry in raw.items() if not entry[4]]
+    folded: Counter[tuple[str, ...]] = Counter()
+
+    def visit(func: FuncKey, stack: tuple[str, ...], on_path: frozenset[FuncKey], share: float) -> None:
+        _cc, _nc, tt, ct, _callers = raw[func]
+        label = _frame_label(*func)
+        here = stack + (label,)
+        folded[here] += int(round(tt * share * 1e6))
+        if len(here) >= max_depth:
+            return
+        for callee, edge_ct in callees.get(func, ()):
+            if callee in on_path or edge_ct <= 0:
+                continue
+            callee_ct = raw[callee][3]
+            if callee_ct <= 0:
+                continue
+            visit(callee, here, on_path | {callee}, share * min(1.0, edge_ct / callee_ct))
+
+    for root in roots:
+        visit(root, (), frozenset({root}), 1.0)
+    return folded
+
+
+# -----------------------------
+# Signal-based stack sampler
+# -----------------------------
+class StackSampler:
+    """
+    Low-overhead sampling profiler: SIGPROF fires every `interval` seconds of
+    CPU time and the current Python stack of the main thread is counted.
+    Weights in the folded output are sample counts. Unix only.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("Sampling profiler needs signal.setitimer (Unix only)")
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self._skip_files = {os.path.abspath(__file__)}
+
+    def _handler(self, _signum: int, frame: FrameType | None) -> None:
+        labels: list[str] = []
+        while frame is not None:
+            code = frame.f_code
+            if os.path.abspath(code.co_filename) not in self._skip_files:
+                labels.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        if labels:
+            self.stacks[tuple(reversed(labels))] += 1
+
+    def start(self) -> None:
+        signal.signal(signal.SIGPROF, self._handler)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+
+@contextmanager
+def profiled(mode: str | None, stem: Path | None, interval: float = 0.005) -> Iterator[None]:
+    """
+    Profile the body and write the results next to `stem`:
+    - cprofile: {stem}.pstats + {stem}.folded
+    - sample:   {stem}.sample.folded
+    """
+    if mode is None or stem is None:
+        yield
+        return
+    if mode not in MODES:
+        raise ValueError(f"Unknown profile mode {mode!r}, expected one of {MODES}")
+
+    stem.parent.mkdir(parents=True, exist_ok=True)
+
+    if mode == "cprofile":
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            yield
+        finally:
+            prof.disable()
+            prof.dump_stats(str(stem.with_name(stem.name + ".pstats")))
+            stats = pstats.Stats(prof, stream=sys.stderr)
+            write_folded(pstats_to_folded(stats), stem.with_name(stem.name + ".folded"))
+        return
+
+    sampler = StackSampler(interval)
+    sampler.start()
+    try:
+        yield
+    finally:
+        sampler.stop()
+        write_folded(sampler.stacks, stem.with_name(stem.name + ".sample.folded"))
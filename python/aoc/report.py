@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterable, TextIO
+
+from aoc.runner import TaskResult
+
+ANSWER_WIDTH = 24
+
+
+def format_seconds(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_kib(kib: int | None) -> str:
+    if kib is None:
+        return "-"
+    if kib < 1024:
+        return f"{kib} KiB"
+    if kib < 1024 * 1024:
+        return f"{kib / 1024:.1f} MiB"
+    return f"{kib / (1024 * 1024):.2f} GiB"
+
+
+def _clip(text: str, width: int) -> str:
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def print_table(results: Iterable[TaskResult], out: TextIO) -> None:
+    rows = sorted(results, key=lambda r: r.key)
+    traced = any(r.traced_peak_kb is not None for r in rows)
+    checked = any(r.check for r in rows)
+
+    header: tuple[str, ...] = ("Year", "Day", "Part", "Status", "Time", "Peak RSS")
+    if traced:
+        header += ("Traced peak",)
+    if checked:
+        header += ("Check",)
+    header += ("Answer / detail",)
+
+    body: list[tuple[str, ...]] = []
+    for r in rows:
+        row: tuple[str, ...] = (
+            str(r.year),
+            f"{r.day:02d}",
+            str(r.part),
+            r.status
+            + (" (both)" if r.shared else "")
+            + (" (cached)" if r.cached else "")
+            + (" (over budget)" if r.over_budget else ""),
+            format_seconds(r.seconds),
+            format_kib(r.peak_rss_kb),
+        )
+        if traced:
+            row += (format_kib(r.traced_peak_kb),)
+        if checked:
+            row += (r.check or "-",)
+        text = r.answer if r.status == "ok" and r.answer is not None else r.detail
+        if r.check == "MISMATCH":
+            text = f"{r.answer} (expected {r.expected})"
+        row += (_clip(text, ANSWER_WIDTH),)
+        body.append(row)
+
+    widths = [max(len(h), *(len(row[i]) for row in body)) if body else len(h)
+              for i, h in enumerate(header)]
+    right = {1, 2, 4, 5, 6} if traced else {1, 2, 4, 5}
+
+    def fmt(row: tuple[str, ...]) -> str:
+        return "  ".join(
+            cell.rjust(w) if i in right else cell.ljust(w)
+            for i, (cell, w) in enumerate(zip(row, widths))
+        ).rstrip()
+
+    print(fmt(header), file=out)
+    print("  ".join("-" * w for w in widths), file=out)
+    last_year: int | None = None
+    for r, row in zip(rows, body):
+        if last_year is not None and r.year != last_year:
+            print("", file=out)
+        last_year = r.year
+        print(fmt(row), file=out)
+
+
+def print_allocations(results: Iterable[TaskResult], out: TextIO) -> None:
+    """Top allocation sites per part (only when run with tracemalloc)."""
+    rows = [r for r in sorted(results, key=lambda r: r.key) if r.top_allocations]
+    if not rows:
+        return
+    print("\nTop allocation sites (at the traced peak):", file=out)
+    for r in rows:
+        flag = "  OVER BUDGET" if r.over_budget else ""
+        print(
+            f"  {r.year} day {r.day:02d} part {r.part} [{r.input_label}] "
+            f"peak {format_kib(r.traced_peak_kb)}{flag}",
+            file=out,
+        )
+        for site in r.top_allocations:
+            print(f"      {site}", file=out)
+
+
+def print_summary(results: Iterable[TaskResult], wall: float, out: TextIO) -> None:
+    rows = list(results)
+    counts: dict[str, int] = {}
+    for r in rows:
+        counts[r.status] = counts.get(r.status, 0) + 1
+
+    # a solve_both time is shown on both parts but spent once
+    cpu = sum(
+        r.seconds for r in rows
+        if r.status == "ok" and r.seconds is not None and not (r.shared and r.part != 1)
+    )
+    slowest = max(
+        (r for r in rows if r.status == "ok" and r.seconds is not None),
+        key=lambda r: r.seconds or 0.0,
+        default=None,
+    )
+
+    status_str = ", ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+    over = sum(1 for r in rows if r.over_budget)
+    cached = sum(1 for r in rows if r.cached)
+    checks: dict[str, int] = {}
+    for r in rows:
+        if r.check:
+            checks[r.check] = checks.get(r.check, 0) + 1
+    if cached:
+        status_str += f" ({cached} from the incremental store)"
+    if over:
+        status_str += f", over-budget={over}"
+    print(f"\n{len(rows)} parts: {status_str}", file=out)
+    if checks:
+        print("Answers: " + ", ".join(f"{k}={v}" for k, v in sorted(checks.items())), file=out)
+    print(f"Wall time: {format_seconds(wall)}   sum of solve times: {format_seconds(cpu)}", file=out)
+    if slowest is not None:
+        print(
+            f"Slowest: {slowest.year} day {slowest.day:02d} part {slowest.part} "
+            f"({format_seconds(slowest.seconds)})",
+            file=out,
+        )
+
+
+def export(results: Iterable[TaskResult], path: Path) -> None:
+    """Write results as .json or .csv depending on the file extension."""
+    rows = [asdict(r) for r in sorted(results, key=lambda r: r.key)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.suffix.lower() == ".csv":
+        fields = list(TaskResult.__dataclass_fields__)
+        with path.open("w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        path.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
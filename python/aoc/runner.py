@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import dataclasses
+import importlib.util
+import os
+import sys
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable
+
+from aoc.discovery import BOTH, PARTS, SolutionModule, part_label
+from aoc.memory import PeakTracker
+from aoc.profiling import profiled
+from aoclib.parallel import WORKERS_ENV, available_cpus, cpu_share
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True, slots=True)
+class Task:
+    year: int
+    day: int
+    # 1, 2 or BOTH (one `solve_both` call for both parts)
+    part: int
+    path: Path
+    module_name: str
+    # "input" = real input via GetInput, otherwise the name of an inline test string
+    input_label: str = "input"
+    test_string: str | None = None
+    warmup: int = 0
+    repeat: int = 1
+    # profiling: "cprofile" | "sample", output written to {profile_stem}.*
+    profile: str | None = None
+    profile_stem: Path | None = None
+    sample_interval: float = 0.005
+    # tracemalloc peak + top allocation sites (slows the solve down)
+    trace_memory: bool = False
+    memory_top: int = 5
+
+    @property
+    def key(self) -> tuple[int, int, int, str]:
+        return (self.year, self.day, self.part, self.input_label)
+
+
+@dataclass(slots=True)
+class TaskResult:
+    year: int
+    day: int
+    part: int
+    status: str  # ok | error | timeout | crashed | skipped | no-input
+    answer: str | None = None
+    seconds: float | None = None
+    peak_rss_kb: int | None = None
+    detail: str = ""
+    input_label: str = "input"
+    samples: list[float] = field(default_factory=list)
+    traced_peak_kb: int | None = None
+    top_allocations: list[str] = field(default_factory=list)
+    over_budget: bool = False
+    # reused from the result store (run --incremental), not executed
+    cached: bool = False
+    # comparison with the answer registry (data/{year}/answers.txt)
+    check: str = ""
+    expected: str | None = None
+    # part == BOTH: the answers of parts 1 and 2
+    answers: list[str] = field(default_factory=list)
+    # answered by a solve_both call: `seconds` is the time of both parts together
+    shared: bool = False
+
+    @property
+    def key(self) -> tuple[int, int, int, str]:
+        return (self.year, self.day, self.part, self.input_label)
+
+    @staticmethod
+    def for_task(task: Task, status: str, **kwargs: Any) -> TaskResult:
+        return TaskResult(
+            year=task.year, day=task.day, part=task.part, status=status,
+            input_label=task.input_label, **kwargs,
+        )
+
+
+def build_tasks(
+    modules: Iterable[SolutionModule],
+    parts: Iterable[int] = (1, 2),
+) -> tuple[list[Task], list[TaskResult]]:
+    """
+    Split discovered modules into runnable tasks and results that are already
+    known without starting a process (missing input, unsupported signature, ...).
+    """
+    wanted = set(parts)
+    tasks: list[Task] = []
+    skipped: list[TaskResult] = []
+
+    for mod in modules:
+        has_input = mod.input_path.exists()
+        for part in sorted(wanted):
+            if part in mod.skipped:
+                skipped.append(
+                    TaskResult(mod.year, mod.day, part, "skipped", detail=mod.skipped[part])
+                )
+            elif not has_input:
+                skipped.append(
+                    TaskResult(mod.year, mod.day, part, "no-input", detail=str(mod.input_path))
+                )
+            else:
+                tasks.append(Task(mod.year, mod.day, part, mod.path, mod.module_name))
+
+    return tasks, skipped
+
+
+def prefer_both(tasks: Iterable[Task], modules: Iterable[SolutionModule]) -> list[Task]:
+    """
+    Merge the part 1 and part 2 tasks of the same day and input into a single
+    `solve_both` task when the module defines it (see `split_both`).
+    """
+    with_both = {(m.year, m.day) for m in modules if m.has_both}
+    out: list[Task] = []
+    pairs: dict[tuple[int, int, str], Task] = {}
+    for task in tasks:
+        if (task.year, task.day) not in with_both or task.part not in PARTS:
+            out.append(task)
+            continue
+        key = (task.year, task.day, task.input_label)
+        other = pairs.pop(key, None)
+        if other is None:
+            pairs[key] = task
+        else:
+            out.append(dataclasses.replace(min(task, other, key=lambda t: t.part), part=BOTH))
+    out.extend(pairs.values())
+    return out
+
+
+def split_both(results: Iterable[TaskResult]) -> list[TaskResult]:
+    """Turn every BOTH result into one result per part (sharing time and memory)."""
+    out: list[TaskResult] = []
+    for r in results:
+        if r.part != BOTH:
+            out.append(r)
+            continue
+        for i, part in enumerate(PARTS):
+            answer = r.answers[i] if i < len(r.answers) else None
+            out.append(dataclasses.replace(
+                r, part=part, answer=answer, answers=[], shared=True,
+                samples=list(r.samples), top_allocations=list(r.top_allocations),
+            ))
+    return out
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+def peak_rss_kb() -> int | None:
+    """Max resident set size of the current process, in KiB."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def load_solution(path: Path, module_name: str) -> ModuleType:
+    """Import a day_NN.py by path (solutions are not a package)."""
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def short_error(exc: BaseException) -> str:
+    line = traceback.format_exception_only(type(exc), exc)[-1].strip()
+    return line if len(line) <= 200 else line[:197] + "..."
+
+
+def time_solve(solve: Callable[..., Any], task: Task) -> tuple[Any, list[float]]:
+    """Call `solve` warmup + repeat times; the answer comes from the first call."""
+    args: tuple[Any, ...] = () if task.test_string is None else (task.test_string,)
+    answer: Any = None
+    samples: list[float] = []
+
+    for i in range(task.warmup + max(1, task.repeat)):
+        t0 = time.perf_counter()
+        result = solve(*args)
+        elapsed = time.perf_counter() - t0
+        if i == 0:
+            answer = result
+        if i >= task.warmup:
+            samples.append(elapsed)
+
+    return answer, samples
+
+
+def _execute(task: Task, conn: Connection, quiet: bool, workers: int) -> None:
+    # Pools started by the solution (aoclib.hashmine) stay within this task's
+    # share of the CPUs; an AOC_WORKERS set by the user wins.
+    os.environ.setdefault(WORKERS_ENV, str(workers))
+    if quiet:
+        devnull = open(os.devnull, "w")
+        sys.stdout = devnull
+
+    try:
+        # Same working dir as `cd python/aoc_solutions/{year}; python day_NN.py`
+        os.chdir(task.path.parent)
+        module = load_solution(task.path, task.module_name)
+        name = "solve_both" if task.part == BOTH else f"solve_{task.part}"
+        solve: Callable[..., Any] = getattr(module, name)
+
+        tracker: PeakTracker | None = None
+        with profiled(task.profile, task.profile_stem, task.sample_interval):
+            if task.trace_memory:
+                with PeakTracker(top=task.memory_top) as tracker:
+                    answer, samples = time_solve(solve, task)
+            else:
+                answer, samples = time_solve(solve, task)
+
+        payload: dict[str, Any] = {
+            "seconds": min(samples),
+            "samples": samples,
+            "peak_rss_kb": peak_rss_kb(),
+        }
+        if task.part == BOTH:
+            if not isinstance(answer, (tuple, list)) or len(answer) != len(PARTS):
+                raise TypeError(f"solve_both must return (part1, part2), got {answer!r}")
+            payload["answers"] = [str(a) for a in answer]
+        else:
+            payload["answer"] = str(answer)
+        if tracker is not None:
+            payload["traced_peak_kb"] = tracker.peak_bytes // 1024
+            payload["top_allocations"] = tracker.sites
+        conn.send(("ok", payload))
+    except BaseException as exc:  # noqa: BLE001 - report anything to the parent
+        conn.send(("error", {"peak_rss_kb": peak_rss_kb(), "detail": short_error(exc)}))
+    finally:
+        conn.close()
+
+
+# -----------------------------
+# Scheduler
+# -----------------------------
+@dataclass(slots=True)
+class _Running:
+    task: Task
+    process: Any
+    conn: Connection
+    deadline: float | None
+
+
+def apply_memory_budget(result: TaskResult, budget_kb: int | None) -> None:
+    """Flag parts above the budget: tracemalloc peak when traced, else max RSS."""
+    if budget_kb is None:
+        return
+    used = result.traced_peak_kb if result.traced_peak_kb is not None else result.peak_rss_kb
+    result.over_budget = used is not None and used > budget_kb
+
+
+def run_tasks(
+    tasks: Iterable[Task],
+    *,
+    jobs: int | None = None,
+    timeout: float | None = None,
+    quiet: bool = True,
+    memory_budget_kb: int | None = None,
+    on_result: Callable[[TaskResult], None] | None = None,
+) -> list[TaskResult]:
+    """
+    Run every task in its own process, at most `jobs` at a time.
+
+    One process per (year, day, part) keeps peak RSS per part meaningful and
+    lets a task that exceeds `timeout` seconds be killed without affecting
+    the others. Results are returned sorted by (year, day, part).
+    """
+    ctx = get_context()
+    jobs = max(1, jobs or available_cpus())
+
+    pending: deque[Task] = deque(tasks)
+    running: list[_Running] = []
+    results: list[TaskResult] = []
+    workers = cpu_share(min(jobs, len(pending)))
+
+    def finish(run: _Running, result: TaskResult) -> None:
+        run.conn.close()
+        run.process.join(timeout=1)
+        running.remove(run)
+        apply_memory_budget(result, memory_budget_kb)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    try:
+        while pending or running:
+            while pending and len(running) < jobs:
+                task = pending.popleft()
+                parent_conn, child_conn = ctx.Pipe(duplex=False)
+                proc = ctx.Process(
+                    target=_execute,
+                    args=(task, child_conn, quiet, workers),
+                    name=f"aoc-{task.year}-{task.day:02d}-{part_label(task.part)}",
+                )
+                proc.start()
+                child_conn.close()
+                deadline = None if timeout is None else time.monotonic() + timeout
+                running.append(_Running(task, proc, parent_conn, deadline))
+
+            deadlines = [r.deadline for r in running if r.deadline is not None]
+            wait_for = None
+            if deadlines:
+                wait_for = max(0.0, min(deadlines) - time.monotonic())
+
+            handles: list[Any] = [r.conn for r in running] + [r.process.sentinel for r in running]
+            ready = set(wait(handles, timeout=wait_for))
+
+            for run in list(running):
+                if run.conn in ready:
+                    try:
+                        status, payload = run.conn.recv()
+                    except EOFError:
+                        run.process.join(timeout=1)
+                        finish(run, TaskResult.for_task(
+                            run.task, "crashed", detail=f"exit code {run.process.exitcode}"
+                        ))
+                        continue
+                    finish(run, TaskResult.for_task(run.task, status, **payload))
+                elif run.process.sentinel in ready and not run.conn.poll():
+                    run.process.join(timeout=1)
+                    finish(run, TaskResult.for_task(
+                        run.task, "crashed", detail=f"exit code {run.process.exitcode}"
+                    ))
+                elif run.deadline is not None and time.monotonic() >= run.deadline:
+                    run.process.kill()
+                    finish(run, TaskResult.for_task(
+                        run.task, "timeout", seconds=timeout, detail=f"killed after {timeout:g}s"
+                    ))
+    finally:
+        for run in running:
+            run.process.kill()
+            run.process.join(timeout=1)
+
+    results.sort(key=lambda r: r.key)
+    return results
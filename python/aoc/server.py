@@ -0,0 +1,241 @@
+"""
+Long-lived solver daemon (`python -m aoc serve`) and its client.
+
+Requests are JSON lines on a Unix domain socket, one response line each:
+
+    {"year": 2024, "day": 17, "part": 1}                  real input
+    {"year": 2024, "day": 17, "part": 1, "test": "..."}   inline test string
+    {"op": "ping"} / {"op": "shutdown"}
+
+    {"ok": true, "answer": "4,6,3", "seconds": 0.0004, "reloaded": false, "worker": 4242}
+    {"ok": false, "status": "error", "error": "ValueError: ..."}
+
+Solves run on a pool of worker processes, so a slow day does not block the
+fast ones. Every worker keeps the day modules it has imported (and with them
+numpy & co., GetInput's input text and input_cache's parsed values): a module
+is imported again only when its file, or its input file, changes mtime.
+Changes to shared helpers (aoclib, get_input.py, ...) need a restart.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.discovery import discover
+from aoc.paths import SOCKET_PATH
+from aoc.runner import load_solution, short_error
+from aoclib.parallel import WORKERS_ENV, available_cpus, cpu_share
+from get_input import GetInput
+
+Response = dict[str, Any]
+
+# Requests (and test strings) larger than this are rejected
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+# path -> ((solution mtime, input mtime), module)
+_MODULES: dict[Path, tuple[tuple[int, int], ModuleType]] = {}
+
+
+def _worker_init(quiet: bool, workers: int) -> None:
+    os.environ.setdefault(WORKERS_ENV, str(workers))
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def _warm_module(path: Path, module_name: str, input_path: Path) -> tuple[ModuleType, bool]:
+    """(module, reloaded): re-import only if the solution or its input changed."""
+    signature = (_mtime_ns(path), _mtime_ns(input_path))
+    cached = _MODULES.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1], False
+    if cached is not None and cached[0][1] != signature[1]:
+        # the text of every input read so far is cached per process
+        GetInput.clear_cache()
+    module = load_solution(path, module_name)
+    _MODULES[path] = (signature, module)
+    return module, True
+
+
+def solve_in_worker(
+    path: str, module_name: str, input_path: str, part: int, test_string: str | None
+) -> Response:
+    try:
+        # Same working dir as `cd python/aoc_solutions/{year}; python day_NN.py`
+        os.chdir(Path(path).parent)
+        module, reloaded = _warm_module(Path(path), module_name, Path(input_path))
+        solve = getattr(module, f"solve_{part}", None)
+        if solve is None:
+            return {"ok": False, "status": "error", "error": f"solve_{part} not found in {path}"}
+
+        args: tuple[Any, ...] = () if test_string is None else (test_string,)
+        t0 = time.perf_counter()
+        answer = solve(*args)
+        seconds = time.perf_counter() - t0
+    except BaseException as exc:  # noqa: BLE001 - report anything to the client
+        return {"ok": False, "status": "error", "error": short_error(exc), "worker": os.getpid()}
+
+    return {
+        "ok": True,
+        "answer": str(answer),
+        "seconds": seconds,
+        "reloaded": reloaded,
+        "worker": os.getpid(),
+    }
+
+
+# -----------------------------
+# Server
+# -----------------------------
+class BadRequest(ValueError):
+    pass
+
+
+def _int_field(request: dict[str, Any], name: str) -> int:
+    value = request.get(name)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise BadRequest(f"{name!r} must be an integer, got {value!r}")
+    return value
+
+
+class SolverServer:
+    def __init__(self, socket_path: Path = SOCKET_PATH, workers: int | None = None, quiet: bool = True) -> None:
+        self.socket_path = socket_path
+        self.workers = max(1, workers or available_cpus())
+        self.quiet = quiet
+        self._pool = self._new_pool()
+        self._stop: asyncio.Event | None = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            self.workers, mp_context=get_context(), initializer=_worker_init,
+            initargs=(self.quiet, cpu_share(self.workers)),
+        )
+
+    async def _solve(self, request: dict[str, Any]) -> Response:
+        year, day, part = (_int_field(request, k) for k in ("year", "day", "part"))
+        test_string = request.get("test")
+        if test_string is not None and not isinstance(test_string, str):
+            raise BadRequest("'test' must be a string")
+
+        modules = discover([year], [day])
+        if not modules:
+            raise BadRequest(f"No solution for {year} day {day:02d}")
+        mod = modules[0]
+
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+        try:
+            return await loop.run_in_executor(
+                pool, solve_in_worker,
+                str(mod.path), mod.module_name, str(mod.input_path), part, test_string,
+            )
+        except BrokenProcessPool:
+            # a worker died (segfault, OOM kill, os._exit): start a fresh pool
+            if pool is self._pool:
+                self._pool = self._new_pool()
+            return {"ok": False, "status": "crashed", "error": "worker process died"}
+
+    async def _dispatch(self, line: bytes) -> Response:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise BadRequest("request must be a JSON object")
+            op = request.get("op", "solve")
+            if op == "ping":
+                return {"ok": True, "pid": os.getpid(), "workers": self.workers}
+            if op == "shutdown":
+                assert self._stop is not None
+                self._stop.set()
+                return {"ok": True}
+            if op != "solve":
+                raise BadRequest(f"Unknown op {op!r}")
+            return await self._solve(request)
+        except (BadRequest, json.JSONDecodeError, UnicodeDecodeError) as exc:
+            return {"ok": False, "status": "bad-request", "error": str(exc)}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                response = await self._dispatch(line)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            # client gone, or a line over MAX_REQUEST_BYTES
+            pass
+        except asyncio.CancelledError:
+            # server shutting down with the connection still open
+            pass
+        finally:
+            writer.close()
+
+    def _claim_socket(self) -> None:
+        """Remove a stale socket file, refuse to start if a daemon is already listening."""
+        if not self.socket_path.exists():
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            return
+        try:
+            request({"op": "ping"}, self.socket_path, timeout=1.0)
+        except OSError:
+            self.socket_path.unlink()
+        else:
+            raise RuntimeError(f"A server is already listening on {self.socket_path}")
+
+    async def _main(self) -> None:
+        self._stop = asyncio.Event()
+        self._claim_socket()
+        server = await asyncio.start_unix_server(
+            self._handle, path=str(self.socket_path), limit=MAX_REQUEST_BYTES
+        )
+        try:
+            async with server:
+                await self._stop.wait()
+        finally:
+            self.socket_path.unlink(missing_ok=True)
+
+    def serve_forever(self) -> None:
+        try:
+            asyncio.run(self._main())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # queued solves are dropped, running ones are waited for
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+# -----------------------------
+# Client
+# -----------------------------
+def request(payload: dict[str, Any], socket_path: Path = SOCKET_PATH, timeout: float | None = None) -> Response:
+    """Send one request to a running server and wait for its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as fh:
+            line = fh.readline()
+    if not line:
+        raise ConnectionError(f"No response from {socket_path}")
+    return json.loads(line)
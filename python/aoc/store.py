@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable
+
+from aoc.paths import REPO_ROOT
+from aoc.runner import Task, TaskResult
+
+PYTHON_DIR: Path = REPO_ROOT / "python"
+
+# Machine-local (not committed), next to the parse cache
+DEFAULT_DB: Path = REPO_ROOT / "data" / ".cache" / "results.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    year        INTEGER NOT NULL,
+    day         INTEGER NOT NULL,
+    part        INTEGER NOT NULL,
+    input_label TEXT    NOT NULL,
+    hash        TEXT    NOT NULL,
+    status      TEXT    NOT NULL,
+    answer      TEXT,
+    seconds     REAL,
+    peak_rss_kb INTEGER,
+    updated     REAL    NOT NULL,
+    PRIMARY KEY (year, day, part, input_label)
+)
+"""
+
+
+# -----------------------------
+# Content hashing
+# -----------------------------
+def _local_module_file(name: str) -> Path | None:
+    """Map an import name to a file under python/ (helpers), or None for stdlib/3rd party."""
+    rel = Path(*name.split("."))
+    for candidate in (PYTHON_DIR / rel.with_suffix(".py"), PYTHON_DIR / rel / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_names(tree: ast.AST) -> set[str]:
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module)
+            # `from aoclib import grid` imports the submodule aoclib.grid
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return names
+
+
+def local_dependencies(path: Path) -> list[Path]:
+    """The file itself plus every helper module under python/ it (transitively) imports."""
+    seen: dict[Path, None] = {}
+    stack = [path.resolve()]
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen[current] = None
+        try:
+            tree = ast.parse(current.read_text(encoding="utf-8"))
+        except (SyntaxError, OSError):
+            continue
+        for name in _imported_names(tree):
+            dep = _local_module_file(name)
+            if dep is not None:
+                stack.append(dep.resolve())
+    return sorted(seen)
+
+
+def code_hash(path: Path) -> str:
+    """sha256 over a solution file and the local helpers it imports."""
+    h = hashlib.sha256()
+    for dep in local_dependencies(path):
+        h.update(str(dep.relative_to(REPO_ROOT)).encode("utf-8") + b"\0")
+        h.update(dep.read_bytes() + b"\0")
+    return h.hexdigest()
+
+
+def task_hash(task: Task, input_path: Path | None, code: str | None = None) -> str:
+    """sha256 over the solution code hash and the input (real file or test string)."""
+    h = hashlib.sha256((code or code_hash(task.path)).encode("ascii"))
+    if task.test_string is not None:
+        h.update(b"test\0" + task.test_string.encode("utf-8"))
+    elif input_path is not None and input_path.exists():
+        h.update(b"input\0" + input_path.read_bytes())
+    return h.hexdigest()
+
+
+# -----------------------------
+# Result store
+# -----------------------------
+class ResultStore:
+    """
+    Content-addressed store of answers and timings (SQLite in WAL mode, so
+    several runner invocations can read and write it at the same time).
+    """
+
+    def __init__(self, path: Path = DEFAULT_DB) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def lookup(self, task: Task, digest: str) -> TaskResult | None:
+        """Previous successful result for the same task and content hash."""
+        row = self._conn.execute(
+            "SELECT answer, seconds, peak_rss_kb FROM results "
+            "WHERE year=? AND day=? AND part=? AND input_label=? AND hash=? AND status='ok'",
+            (task.year, task.day, task.part, task.input_label, digest),
+        ).fetchone()
+        if row is None:
+            return None
+        answer, seconds, rss = row
+        return TaskResult.for_task(
+            task, "ok", answer=answer, seconds=seconds, peak_rss_kb=rss, cached=True
+        )
+
+    def save(self, results: Iterable[tuple[TaskResult, str]]) -> None:
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results "
+                "(year, day, part, input_label, hash, status, answer, seconds, peak_rss_kb, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (r.year, r.day, r.part, r.input_label, digest, r.status,
+                     r.answer, r.seconds, r.peak_rss_kb, now)
+                    for r, digest in results
+                    if not r.cached
+                ],
+            )
+
+
+def split_incremental(
+    tasks: Iterable[Task],
+    store: ResultStore,
+    input_path_of: dict[tuple[int, int], Path],
+) -> tuple[list[Task], list[TaskResult], dict[tuple[int, int, int, str], str]]:
+    """
+    Returns (tasks to execute, cached results, hash per task key).
+    Hashes are returned for every task so fresh results can be stored.
+    """
+    to_run: list[Task] = []
+    cached: list[TaskResult] = []
+    hashes: dict[tuple[int, int, int, str], str] = {}
+
+    code_hashes: dict[Path, str] = {}
+    for task in tasks:
+        if task.path not in code_hashes:
+            code_hashes[task.path] = code_hash(task.path)
+        digest = task_hash(task, input_path_of.get((task.year, task.day)), code_hashes[task.path])
+        hashes[task.key] = digest
+        hit = store.lookup(task, digest)
+        if hit is not None:
+            cached.append(hit)
+        else:
+            to_run.append(task)
+
+    return to_run, cached, hashes
+
+
+def with_hashes(
+    results: Iterable[TaskResult],
+    hashes: dict[tuple[int, int, int, str], str],
+) -> list[tuple[TaskResult, str]]:
+    return [(r, hashes[r.key]) for r in results if r.key in hashes]
+
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from hashlib import md5
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +10,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.hashmine import find_prefixed
 
 
 GI = GetInput()
@@ -20,12 +20,8 @@ def _find_lowest_number(salt: str, prefix: str) -> int:
     """Trova il più piccolo intero n tale che
     md5(f"{salt}{n}") inizi con `prefix`.
     """
-    n = 0
-    while True:
-        digest = md5(f"{salt}{n}".encode("utf-8")).hexdigest()
-        if digest.startswith(prefix):
-            return n
-        n += 1
+    n, _ = next(find_prefixed(salt, prefix))
+    return n
 
 
 def solve_1(test_string: Optional[str] = None) -> int:
@@ -5,13 +5,14 @@ from typing import Iterable, Optional, Tuple
 
 import sys
 
-import numpy as np
-
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 
 GI = GetInput()
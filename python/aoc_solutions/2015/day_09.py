@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from itertools import permutations
 from pathlib import Path
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import sys
 
@@ -11,6 +10,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.tsp import held_karp
 
 
 GI = GetInput()
@@ -36,34 +36,28 @@ def _parse_distances(raw: str) -> Tuple[DistanceMap, Set[str]]:
     return distances, places
 
 
-def _route_distance(route: Tuple[str, ...], dist: DistanceMap) -> int:
-    return sum(dist[(route[i], route[i + 1])] for i in range(len(route) - 1))
+def _distance_matrix(raw: str) -> List[List[int]]:
+    distances, places = _parse_distances(raw)
+    names = sorted(places)
+    return [[0 if a == b else distances[(a, b)] for b in names] for a in names]
 
 
+# Percorso aperto con partenza libera: Held-Karp (O(2^n * n^2)) invece di
+# provare tutte le n! permutazioni.
 def solve_1(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
-    distances, places = _parse_distances(raw)
-
-    best = float("inf")
-    for route in permutations(places, len(places)):
-        d = _route_distance(route, distances)
-        if d < best:
-            best = d
-
-    return int(best)
+    return held_karp(_distance_matrix(raw), objective="min").cost
 
 
 def solve_2(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
-    distances, places = _parse_distances(raw)
+    return held_karp(_distance_matrix(raw), objective="max").cost
 
-    worst = 0
-    for route in permutations(places, len(places)):
-        d = _route_distance(route, distances)
-        if d > worst:
-            worst = d
 
-    return int(worst)
+def solve_both(test_string: Optional[str] = None) -> Tuple[int, int]:
+    raw = GI.input if test_string is None else test_string
+    matrix = _distance_matrix(raw)
+    return held_karp(matrix, objective="min").cost, held_karp(matrix, objective="max").cost
 
 
 if __name__ == "__main__":
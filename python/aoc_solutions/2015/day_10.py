@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import sys
 
@@ -42,18 +43,145 @@ def _iterate_look_and_say(start: str, times: int) -> str:
     return value
 
 
+# ---------------------------------------------------------------------------
+# Decadimento in "elementi" (Conway): lunghezza dopo N iterazioni senza
+# costruire la stringa
+# ---------------------------------------------------------------------------
+# Una sequenza LR si "spezza" in L.R se da lì in poi le due parti evolvono
+# indipendentemente: look_and_say(L + R) == look_and_say(L) + look_and_say(R)
+# a ogni passo. Succede finché l'ultima cifra di L (che non cambia mai: ogni
+# gruppo "conteggio + cifra" finisce con la cifra) è diversa dalla prima cifra
+# dei discendenti di R. Spezzando ovunque si può, i pezzi sono gli elementi di
+# Conway (92 per le sequenze di sole cifre 1-3): basta contare quanti ce ne
+# sono di ciascuno, passo dopo passo.
+
+# Prefisso dei discendenti di R osservato per decidere un taglio, e per quanti passi
+WINDOW = 32
+HORIZON = 64
+
+
+def _drop_last_run(s: str) -> str:
+    """`s` senza il suo ultimo gruppo di cifre uguali (forse troncato)."""
+    return s.rstrip(s[-1])
+
+
+@lru_cache(maxsize=None)
+def _first_digits(tail: str, complete: bool) -> frozenset[str]:
+    """
+    Prime cifre dei discendenti di `tail` (il prefisso di R) per HORIZON passi.
+
+    Se `tail` è solo un prefisso, il suo ultimo gruppo potrebbe continuare:
+    lo si scarta, e il resto genera un prefisso esatto del discendente.
+    """
+    digits: set[str] = set()
+    for _ in range(HORIZON):
+        digits.add(tail[0])
+        core = tail if complete else _drop_last_run(tail)
+        if not core:
+            break
+        nxt = look_and_say(core)
+        complete = complete and len(nxt) <= WINDOW
+        tail = nxt[:WINDOW]
+    return frozenset(digits)
+
+
+def split_elements(s: str) -> List[str]:
+    """Spezza `s` in tutti i punti in cui le due parti restano indipendenti."""
+    pieces = []
+    start = 0
+    for i in range(1, len(s)):
+        if s[i - 1] == s[i]:
+            continue
+        tail = s[i:i + WINDOW]
+        if s[i - 1] not in _first_digits(tail, len(s) - i <= WINDOW):
+            pieces.append(s[start:i])
+            start = i
+    pieces.append(s[start:])
+    return pieces
+
+
+class Decay:
+    """
+    Gli elementi raggiungibili da `seed`, ognuno con i suoi prodotti di
+    decadimento (indici), e quante copie di ciascuno ci sono in `seed`.
+    """
+
+    def __init__(self, seed: str) -> None:
+        self.sequences: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.products: List[List[int]] = []
+
+        start = [self._element(piece) for piece in split_elements(seed)]
+        done = 0
+        while done < len(self.sequences):
+            seq = self.sequences[done]
+            self.products.append([self._element(p) for p in split_elements(look_and_say(seq))])
+            done += 1
+        self._check_adjacent(start)
+
+        self.counts = [0] * len(self.sequences)
+        for e in start:
+            self.counts[e] += 1
+
+    def _element(self, seq: str) -> int:
+        e = self.index.get(seq)
+        if e is None:
+            e = self.index[seq] = len(self.sequences)
+            self.sequences.append(seq)
+        return e
+
+    def _check_adjacent(self, start: List[int]) -> None:
+        """
+        Prova che i tagli reggono per sempre (non solo per HORIZON passi): ogni
+        coppia di elementi che potrà mai trovarsi adiacente (a, b) deve avere
+        ultima cifra di a != prima cifra di b. Se (a, b) sono vicini, al passo
+        dopo lo sono l'ultimo prodotto di a e il primo di b.
+        """
+        pairs = set(zip(start, start[1:]))
+        for products in self.products:
+            pairs.update(zip(products, products[1:]))
+        todo = list(pairs)
+        while todo:
+            a, b = todo.pop()
+            if self.sequences[a][-1] == self.sequences[b][0]:
+                raise ValueError(f"Taglio non valido tra {self.sequences[a]} e {self.sequences[b]}")
+            pair = (self.products[a][-1], self.products[b][0])
+            if pair not in pairs:
+                pairs.add(pair)
+                todo.append(pair)
+
+    def length(self, times: int) -> int:
+        """
+        Lunghezza dopo `times` passi. Matrice di decadimento sparsa (pochi
+        prodotti per elemento): O(times * prodotti) somme tra interi.
+        """
+        counts = self.counts
+        for _ in range(times):
+            nxt = [0] * len(counts)
+            for e, c in enumerate(counts):
+                if c:
+                    for p in self.products[e]:
+                        nxt[p] += c
+            counts = nxt
+        return sum(c * len(seq) for c, seq in zip(counts, self.sequences))
+
+
 def solve_1(test_string: Optional[str] = None) -> int:
     start = (GI.input if test_string is None else test_string).strip()
-    result = _iterate_look_and_say(start, 40)
-    return len(result)
+    return Decay(start).length(40)
 
 
 def solve_2(test_string: Optional[str] = None) -> int:
     start = (GI.input if test_string is None else test_string).strip()
-    result = _iterate_look_and_say(start, 50)
-    return len(result)
+    return Decay(start).length(50)
 
 
 if __name__ == "__main__":
     print(f"Part 1: {solve_1()}")
     print(f"Part 2: {solve_2()}")
+
+    # verifica con le stringhe vere, per pochi passi
+    seed = GI.input.strip()
+    decay = Decay(seed)
+    assert all(decay.length(n) == len(_iterate_look_and_say(seed, n)) for n in range(25))
+    print(f"{len(decay.sequences)} elementi, verifica su 25 passi: ok")
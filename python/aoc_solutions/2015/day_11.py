@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 import re
 import string
 import sys
+import time
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
@@ -69,25 +71,134 @@ def string_is_ok(source: str) -> bool:
     return True
 
 
-def solve_1(test_string: Optional[str] = None) -> str:
-    """Restituisce la prossima password valida secondo le regole del giorno 11."""
-    raw = GI.input if test_string is None else test_string
-    password = raw.strip()
-
+def next_by_increment(password: str) -> str:
+    """Prossima password valida provando ogni stringa (riferimento per il benchmark)."""
     candidate = alphabetically_increment(password)
     while not string_is_ok(candidate):
         candidate = alphabetically_increment(candidate)
     return candidate
 
 
+# ---------------------------------------------------------------------------
+# Generatore costruttivo
+# ---------------------------------------------------------------------------
+# Invece di provare i candidati uno a uno: per ogni posizione k, da destra,
+# si prova ad alzare la lettera k tenendo il prefisso, e si controlla se il
+# resto può ancora soddisfare le regole; il primo k che funziona dà il
+# risultato, con il suffisso più piccolo costruito lettera per lettera.
+# Un prefisso con i/o/l non viene mai tenuto: tutto il blocco che lo
+# contiene è saltato in un colpo solo.
+
+LETTERS = string.ascii_lowercase
+FORBIDDEN = {LETTERS.index(ch) for ch in "iol"}
+ALLOWED = [c for c in range(len(LETTERS)) if c not in FORBIDDEN]
+# "aabcc": 5 lettere nuove bastano sempre per scala + due coppie diverse
+ALWAYS_ENOUGH = 5
+
+# (ultima lettera, lunghezza della scala finale (max 2), scala trovata, lettere delle coppie)
+State = Tuple[int, int, bool, FrozenSet[int]]
+START: State = (-2, 0, False, frozenset())
+
+
+def _step(state: State, c: int) -> State:
+    last, run, straight, pairs = state
+    run = run + 1 if c == last + 1 else 1
+    if c == last and len(pairs) < 2:
+        pairs = pairs | {c}
+    return c, min(run, 2), straight or run >= 3, pairs
+
+
+def _is_valid(state: State) -> bool:
+    return state[2] and len(state[3]) >= 2
+
+
+@lru_cache(maxsize=None)
+def _can_finish(state: State, remaining: int) -> bool:
+    """Con `remaining` lettere si possono ancora soddisfare le regole?"""
+    if _is_valid(state) or remaining >= ALWAYS_ENOUGH:
+        return True
+    if remaining == 0:
+        return False
+    return any(_can_finish(_step(state, c), remaining - 1) for c in ALLOWED)
+
+
+def _smallest_suffix(state: State, remaining: int) -> List[int]:
+    suffix: List[int] = []
+    for left in range(remaining - 1, -1, -1):
+        c = next(c for c in ALLOWED if _can_finish(_step(state, c), left))
+        state = _step(state, c)
+        suffix.append(c)
+    return suffix
+
+
+def next_password(password: str) -> str:
+    """
+    La più piccola password valida > `password`, della stessa lunghezza
+    (dopo "zz...z" si riparte da "aa...a", come con l'incremento).
+    """
+    letters = [LETTERS.index(ch) for ch in password]
+    n = len(letters)
+
+    # stato dopo ogni prefisso pulito (senza i/o/l)
+    states = [START]
+    for c in letters:
+        if c in FORBIDDEN:
+            break
+        states.append(_step(states[-1], c))
+
+    for k in range(min(n, len(states)) - 1, -1, -1):
+        for c in ALLOWED:
+            if c <= letters[k]:
+                continue
+            state = _step(states[k], c)
+            if _can_finish(state, n - k - 1):
+                tail = _smallest_suffix(state, n - k - 1)
+                return "".join(LETTERS[i] for i in letters[:k] + [c] + tail)
+
+    if not _can_finish(START, n):
+        raise ValueError(f"Nessuna password valida di {n} lettere")
+    return "".join(LETTERS[i] for i in _smallest_suffix(START, n))
+
+
+def passwords_after(password: str) -> Iterator[str]:
+    """Le password valide successive a `password`, in ordine, calcolate una per volta."""
+    while True:
+        password = next_password(password)
+        yield password
+
+
+def benchmark(password: str) -> Dict[str, float]:
+    """Secondi per trovare la prossima password: incremento vs costruzione."""
+    runners: Dict[str, Callable[[str], str]] = {
+        "increment": next_by_increment,
+        "constructive": next_password,
+    }
+    timings: Dict[str, float] = {}
+    for name, runner in runners.items():
+        start = time.perf_counter()
+        runner(password)
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def solve_1(test_string: Optional[str] = None) -> str:
+    """Restituisce la prossima password valida secondo le regole del giorno 11."""
+    raw = GI.input if test_string is None else test_string
+    return next_password(raw.strip())
+
+
 def solve_2(test_string: Optional[str] = None) -> str:
     """Restituisce la password valida successiva a quella di part 1."""
     raw = GI.input if test_string is None else test_string
-    first = solve_1(raw)
-    second = solve_1(first)
-    return second
+    passwords = passwords_after(raw.strip())
+    next(passwords)
+    return next(passwords)
 
 
 if __name__ == "__main__":
     print(f"Part 1: {solve_1()}")
     print(f"Part 2: {solve_2()}")
+
+    if "--bench" in sys.argv:
+        for name, seconds in benchmark(GI.input.strip()).items():
+            print(f"{name:>12}: {seconds * 1000:,.2f} ms")
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
 import json
+import mmap
+import re
 import sys
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
@@ -10,24 +13,39 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 
 GI = GetInput()
 
+# Sopra questa dimensione niente json.loads (l'albero in memoria costa molte
+# volte il testo): si legge in streaming il file mappato in memoria.
+STREAM_BYTES = 32 * 1024 * 1024
+# Blocchi della somma in streaming della parte 1
+CHUNK_BYTES = 8 * 1024 * 1024
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+# ---------------------------------------------------------------------------
+# json.loads (input normali)
+# ---------------------------------------------------------------------------
 
 def _parse_numbers(node: Any) -> Iterable[int]:
-    """Visita ricorsivamente il JSON e restituisce tutti gli int trovati."""
+    """Visita ricorsivamente il JSON e restituisce tutti gli int trovati (true/false esclusi)."""
     if isinstance(node, dict):
         for value in node.values():
             if isinstance(value, (dict, list)):
                 yield from _parse_numbers(value)
-            elif isinstance(value, int):
+            elif isinstance(value, int) and not isinstance(value, bool):
                 yield value
     elif isinstance(node, list):
         for value in node:
             if isinstance(value, (dict, list)):
                 yield from _parse_numbers(value)
-            elif isinstance(value, int):
+            elif isinstance(value, int) and not isinstance(value, bool):
                 yield value
 
 
@@ -39,26 +57,190 @@ def _parse_numbers_without_red(node: Any) -> Iterable[int]:
         for value in node.values():
             if isinstance(value, (dict, list)):
                 yield from _parse_numbers_without_red(value)
-            elif isinstance(value, int):
+            elif isinstance(value, int) and not isinstance(value, bool):
                 yield value
     elif isinstance(node, list):
         for value in node:
             if isinstance(value, (dict, list)):
                 yield from _parse_numbers_without_red(value)
-            elif isinstance(value, int):
+            elif isinstance(value, int) and not isinstance(value, bool):
                 yield value
 
 
-def solve_1(test_string: Optional[str] = None) -> int:
-    raw = GI.input if test_string is None else test_string
-    data = json.loads(raw)
-    return sum(_parse_numbers(data))
+# ---------------------------------------------------------------------------
+# Streaming (file grandi): memoria limitata, un solo passaggio sul testo
+# ---------------------------------------------------------------------------
+# Stringa JSON completa (saltata in blocco: i numeri dentro non contano)
+_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+# Parte 1: interi (gruppo 1), stringhe e numeri non interi danno ''
+INTS = re.compile(_STRING + rb'|(-?\d++)(?![.eE])|-?\d[\d.eE+-]*')
+# Il prefisso più lungo fatto di testo fuori stringa e stringhe complete:
+# finisce alla fine del blocco o sulle virgolette di una stringa troncata
+WHOLE_STRINGS = re.compile(rb'(?:[^"]++|' + _STRING + rb')*+')
+NUMBER_CHARS = frozenset(b"0123456789-+.eE")
+QUOTE, SPACE = ord('"'), ord(" ")
+# cifre e segno restano, ". e E +" diventano "x", il resto spazio
+_NUMBER_TOKENS = bytes(
+    ch if ch in b"0123456789-" else ord("x") if ch in b".eE+" else ord(" ")
+    for ch in range(256)
+)
+
+# Parte 2, token nell'ordine delle alternative (gruppo = lastindex):
+#   1. una parentesi aperta { [
+#   2. una parentesi chiusa } ]
+#   3. il valore "red" di una chiave (i due punti lo distinguono da una chiave)
+#   -  una stringa qualunque, o un numero non intero (ignorati)
+#   4. un intero
+TOKEN = re.compile(
+    rb'([{\[])'
+    rb'|([}\]])'
+    rb'|(:\s*"red")'
+    rb'|' + _STRING +
+    rb'|(-?\d++)(?![.eE])'
+    rb'|-?\d[\d.eE+-]*'
+)
+OPEN, CLOSE, RED, INT = 1, 2, 3, 4
+OBJECT = ord("{")
+
+
+def _ints_escaped(buf: bytes, last: bool) -> Tuple[int, int]:
+    """(somma, byte consumati) di un blocco con sequenze di escape: con le regex."""
+    end = WHOLE_STRINGS.match(buf).end()  # type: ignore[union-attr]
+    if last and end != len(buf):
+        raise ValueError("JSON troncato: stringa non chiusa")
+    if not last:
+        while end and buf[end - 1] in NUMBER_CHARS:
+            end -= 1
+    return sum(map(int, filter(None, INTS.findall(buf, 0, end)))), end
+
+
+def _ints_plain(buf: bytes, last: bool) -> Tuple[int, int]:
+    """
+    (somma, byte consumati) di un blocco senza escape: sei dentro una stringa
+    se hai visto un numero dispari di virgolette (xor cumulativo con NumPy).
+    Le stringhe diventano spazi e il resto una lista di numeri con
+    translate + split: tutto in C, niente regex.
+    """
+    end = len(buf)
+    if not last:
+        while end and buf[end - 1] in NUMBER_CHARS:
+            end -= 1
+    cells = np.frombuffer(buf, dtype=np.uint8, count=end)
+    quotes = (cells == QUOTE).view(np.uint8)
+    inside = np.bitwise_xor.accumulate(quotes)
+    if end and inside[-1]:
+        if last:
+            raise ValueError("JSON troncato: stringa non chiusa")
+        # si riparte dalle virgolette della stringa troncata
+        end = buf.rindex(b'"', 0, end)
+        cells, quotes, inside = cells[:end], quotes[:end], inside[:end]
+    inside |= quotes  # anche le virgolette di chiusura
+
+    outside = cells.copy()
+    outside[inside.view(bool)] = SPACE
+    tokens = outside.tobytes().translate(_NUMBER_TOKENS)
+    if b"x" not in tokens:
+        return sum(map(int, tokens.split())), end
+    # "x": parte decimale / esponente, o la "e" di true / false
+    return sum(map(int, [t for t in tokens.split() if b"x" not in t])), end
+
+
+def sum_ints(data: Buffer, chunk: int = CHUNK_BYTES) -> int:
+    """
+    Somma di tutti gli interi, a blocchi di `chunk` byte. Un blocco si chiude
+    prima di una stringa o di un numero troncati, che passano al successivo.
+    """
+    total = 0
+    carry = b""
+    size = len(data)
+    for pos in range(0, size, chunk):
+        buf = carry + data[pos:pos + chunk]
+        last = pos + chunk >= size
+        ints = _ints_escaped if b"\\" in buf else _ints_plain
+        subtotal, end = ints(buf, last)
+        total += subtotal
+        carry = buf[end:]
+    return total
+
+
+def sum_without_red(data: Buffer) -> int:
+    """
+    Somma senza gli oggetti con un valore "red", in un solo passaggio.
+
+    Per ogni contenitore aperto si tiene la somma parziale, se è un oggetto e
+    se ha un valore "red": alla chiusura la somma passa al genitore, o viene
+    scartata. La memoria dipende solo dalla profondità di annidamento.
+    """
+    sums = [0]
+    is_object = [False]
+    red = [False]
+
+    for m in TOKEN.finditer(data):
+        kind = m.lastindex
+        if kind == INT:
+            sums[-1] += int(m[INT])
+        elif kind == OPEN:
+            sums.append(0)
+            is_object.append(m[OPEN][0] == OBJECT)
+            red.append(False)
+        elif kind == CLOSE:
+            if len(sums) == 1:
+                raise ValueError(f"Parentesi chiusa senza apertura alla posizione {m.start()}")
+            subtotal = sums.pop()
+            is_object.pop()
+            if not red.pop():
+                sums[-1] += subtotal
+        elif kind == RED and is_object[-1]:
+            red[-1] = True
+
+    if len(sums) != 1:
+        raise ValueError(f"JSON troncato: {len(sums) - 1} contenitori non chiusi")
+    return sums[0]
+
+
+@contextmanager
+def _buffer(test_string: Optional[str]) -> Iterator[Buffer]:
+    """Il testo come byte: il file di input è mappato in memoria, non letto."""
+    if test_string is not None:
+        yield test_string.encode("utf-8")
+        return
+    with open(GI.path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            # lettura sequenziale: il kernel può scartare le pagine già viste
+            data.madvise(mmap.MADV_SEQUENTIAL)
+        yield data
+
+
+def _streaming(test_string: Optional[str], stream: Optional[bool]) -> bool:
+    if stream is not None:
+        return stream
+    size = len(test_string) if test_string is not None else GI.path.stat().st_size
+    return size >= STREAM_BYTES
+
+
+def solve_1(test_string: Optional[str] = None, stream: Optional[bool] = None) -> int:
+    if not _streaming(test_string, stream):
+        raw = GI.input if test_string is None else test_string
+        return sum(_parse_numbers(json.loads(raw)))
+    with _buffer(test_string) as data:
+        return sum_ints(data)
+
+
+def solve_2(test_string: Optional[str] = None, stream: Optional[bool] = None) -> int:
+    if not _streaming(test_string, stream):
+        raw = GI.input if test_string is None else test_string
+        return sum(_parse_numbers_without_red(json.loads(raw)))
+    with _buffer(test_string) as data:
+        return sum_without_red(data)
 
 
-def solve_2(test_string: Optional[str] = None) -> int:
-    raw = GI.input if test_string is None else test_string
-    data = json.loads(raw)
-    return sum(_parse_numbers_without_red(data))
+def solve_both(test_string: Optional[str] = None) -> Tuple[int, int]:
+    if not _streaming(test_string, None):
+        raw = GI.input if test_string is None else test_string
+        data = json.loads(raw)
+        return sum(_parse_numbers(data)), sum(_parse_numbers_without_red(data))
+    with _buffer(test_string) as buffer:
+        return sum_ints(buffer), sum_without_red(buffer)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import permutations
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 import sys
@@ -11,6 +10,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.tsp import held_karp
 
 
 GI = GetInput()
@@ -75,18 +75,19 @@ class Table:
 
 
 def _max_happiness(table: Table) -> int:
-    """Calcola la massima felicità possibile fissando una persona per rompere la simmetria circolare."""
+    """
+    Massima felicità di una disposizione circolare: ciclo hamiltoniano di
+    peso massimo (Held-Karp), con peso di una coppia = felicità di entrambi.
+    """
     people = sorted(table.people)
-    first = people[0]
-    others = [p for p in people if p != first]
-
-    best = -10**9
-    for perm in permutations(others):
-        seating = (first,) + perm
-        score = table.calc_happiness(seating)
-        if score > best:
-            best = score
-    return best
+    weights = [
+        [
+            0 if a == b else table.persons[a].happiness_to[b] + table.persons[b].happiness_to[a]
+            for b in people
+        ]
+        for a in people
+    ]
+    return held_karp(weights, objective="max", cycle=True).cost
 
 
 def solve_1(test_string: Optional[str] = None) -> int:
@@ -26,7 +26,10 @@ class _LegacyAOC:
 aoc = _LegacyAOC()
 
 from pathlib import Path
-import pygame as pg
+from aoclib.lazy import lazy_import
+
+# pygame serve solo per la visualizzazione
+pg = lazy_import("pygame")
 
 CURRENT_DAY = int(Path(__file__).stem.replace('day_',''))
 
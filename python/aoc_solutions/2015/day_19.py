@@ -10,6 +10,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.search import PriorityHeap
 
 CURRENT_YEAR = 2015
 
@@ -26,7 +27,6 @@ class _LegacyAOC:
 aoc = _LegacyAOC()
 
 from pathlib import Path
-from queue import PriorityQueue
 
 CURRENT_DAY = int(Path(__file__).stem.replace('day_',''))
 
@@ -153,16 +153,18 @@ def solve_2(test_string = None) -> int:
     source_map = new_mapping
     print(source_map)
     
-    molecule_queue = PriorityQueue()
-    molecule_queue.put([1,target_molecule,0])
-    while True:
-        lenght, current_molecule, cycle = molecule_queue.get()
-        print(lenght, current_molecule, cycle)
+    # Best-first sulle molecole più corte; la priorità (lunghezza, molecola, cicli)
+    # mantiene lo stesso ordine di estrazione della vecchia PriorityQueue
+    molecule_queue = PriorityHeap()
+    molecule_queue.push((1, target_molecule, 0), target_molecule)
+    while molecule_queue:
+        (_, _, cycle), current_molecule = molecule_queue.pop()
         for mol in reverse_step(source_map, current_molecule):
             if mol == "e":
                 print(current_molecule, mol)
                 return cycle
-            molecule_queue.put([len(mol), mol, cycle+1])
+            molecule_queue.push((len(mol), mol, cycle + 1), mol)
+    raise RuntimeError("no reduction to 'e' found")
 
 
 
@@ -26,7 +26,6 @@ class _LegacyAOC:
 aoc = _LegacyAOC()
 
 from pathlib import Path
-from queue import PriorityQueue
 from typing import List, Self
 from itertools import combinations, product
 
@@ -233,22 +232,25 @@ def solve_1(test_string = None) -> int:
     boss_damage = int(inputs_1.splitlines()[1].replace("Damage: ", ""))
     boss_armor  = int(inputs_1.splitlines()[2].replace("Armor: ", ""))
     base_char = Character(0,0,100)
-    characters=PriorityQueue()
+    characters = []
     for purchase in all_combinations():
         new_char = Character(clone = base_char)
         new_char.equip(purchase)
-        characters.put([new_char.build_cost, new_char])
-    # each character in characters is :
-    # [cost, character] tuple
+        characters.append(new_char)
+    # Tutti i personaggi sono noti subito: basta un ordinamento per costo
+    # (niente coda con priorità)
+    characters.sort(key=lambda char: char.build_cost)
 
-    while True:
+    for character in characters:
         boss = Boss(boss_damage, boss_armor, boss_hp)
-        cost,character = characters.get()
+        cost = character.build_cost
         game = Game(character, boss)
         result = game.play()
         if result == 1:
             break
-    
+    else:
+        raise RuntimeError("no equipment beats the boss")
+
     print(character)
     return cost
     
@@ -259,20 +261,23 @@ def solve_2(test_string = None) -> int:
     boss_damage = int(inputs_1.splitlines()[1].replace("Damage: ", ""))
     boss_armor  = int(inputs_1.splitlines()[2].replace("Armor: ", ""))
     base_char = Character(0,0,100)
-    characters=PriorityQueue()
+    characters = []
     for purchase in all_combinations():
         new_char = Character(clone = base_char)
         new_char.equip(purchase)
-        characters.put([-new_char.build_cost, new_char])
+        characters.append(new_char)
+    # Dal più costoso al più economico
+    characters.sort(key=lambda char: char.build_cost, reverse=True)
 
-    while True:
+    for character in characters:
         boss = Boss(boss_damage, boss_armor, boss_hp)
-        cost,character = characters.get()
         game = Game(character, boss)
         result = game.play()
         if result == 0:
             break
-        
+    else:
+        raise RuntimeError("no equipment loses to the boss")
+
     print(character, character.items)
     return character.build_cost
 
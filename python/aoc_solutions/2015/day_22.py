@@ -10,6 +10,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.search import PriorityHeap
 
 CURRENT_YEAR = 2015
 
@@ -27,7 +28,6 @@ aoc = _LegacyAOC()
 
 from pathlib import Path
 from typing import Self, Dict, Set, List
-from queue import PriorityQueue
 
 DEBUG = 0
 
@@ -307,8 +307,8 @@ SPELLS = {
                                                  duration = 5, manaboost = 101)
 }
 
-def generate_sequences(N: int, boss_hp_initial: int, mana: int = 500) -> PriorityQueue:
-    sequences = PriorityQueue()
+def generate_sequences(N: int, boss_hp_initial: int, mana: int = 500) -> PriorityHeap:
+    sequences = PriorityHeap()
 
     def can_cast(spell: Spell, active_effects: Dict[str, int]) -> bool:
         # Non si può lanciare uno spell se l'effetto è ancora attivo
@@ -340,7 +340,7 @@ def generate_sequences(N: int, boss_hp_initial: int, mana: int = 500) -> Priorit
         # Verifica se il boss è stato sconfitto
         if boss_hp <= 0:
             total_cost = sum(spell.cost for spell in sequence)
-            sequences.put((total_cost, sequence.copy()))
+            sequences.push(total_cost, sequence.copy())
             return
 
         # PRUNING: Se il mana è negativo, interrompi l'esplorazione
@@ -388,7 +388,7 @@ def generate_sequences(N: int, boss_hp_initial: int, mana: int = 500) -> Priorit
                 # Verifica se il boss è stato sconfitto dopo il lancio dello spell
                 if new_boss_hp <= 0:
                     total_cost = sum(spell.cost for spell in new_sequence)
-                    sequences.put((total_cost, new_sequence.copy()))
+                    sequences.push(total_cost, new_sequence.copy())
                     return
 
                 # Avanza al turno successivo (turno del boss)
@@ -420,14 +420,14 @@ def solve_1(test_string = None, char_string: str = None) -> int:
     print(f"Sequences generates")
 
     while True:
-        if all_sequences.empty():
+        if not all_sequences:
             print(f"No valid sequence for {N} spells")
             cost = 0
             break
         boss = Boss(boss_dmg, 0, boss_hp)
         char = Character(hp=char_hp, mana=char_mana)
         
-        cost, spells = all_sequences.get()
+        cost, spells = all_sequences.pop()
         char.spells = list(spells)
     
         game = Game(char, boss)
@@ -468,14 +468,14 @@ def solve_2(test_string = None, char_string: str = None) -> int:
     print(f"Sequences generates")
 
     while True:
-        if all_sequences.empty():
+        if not all_sequences:
             print(f"No valid sequence for {N} spells")
             cost = 0
             break
         boss = Boss(boss_dmg, 0, boss_hp)
         char = Character(hp=char_hp, mana=char_mana)
         
-        cost, spells = all_sequences.get()
+        cost, spells = all_sequences.pop()
         char.spells = list(spells)
     
         game = Game(char, boss, True)
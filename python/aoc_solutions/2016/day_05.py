@@ -4,13 +4,14 @@ from pathlib import Path
 from typing import Optional
 
 import sys
-from hashlib import md5
+from itertools import islice
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.hashmine import find_prefixed
 
 
 GI = GetInput()
@@ -28,33 +29,23 @@ class AlreadyEvaluated(Exception):
 def solve_1(test_string: Optional[str] = None) -> str:
     inputs_1 = GI.input if test_string is None else test_string
     seed = inputs_1.strip()
-    i = 0
     code = ""
 
-    while True:
-        res = md5(f"{seed}{i}".encode()).hexdigest()
-        if res.startswith("00000"):
-            code += res[5]
-            print(f"Trovato! {code}")
-            if len(code) == 8:
-                return code
-        i += 1
+    # i primi 8 hash che iniziano con 00000, in ordine di indice
+    for _, digest in islice(find_prefixed(seed, "00000"), 8):
+        code += digest.hex()[5]
+        print(f"Trovato! {code}")
+    return code
 
 
 def solve_2(test_string: Optional[str] = None) -> str:
     inputs_1 = GI.input if test_string is None else test_string
     seed = inputs_1.strip()
-    i = 0
     found = 0
     code: list[Optional[str]] = [None] * 8
 
-    while True:
-        res = md5(f"{seed}{i}".encode()).hexdigest()
-        i += 1
-
-        if not res.startswith("00000"):
-            continue
-
+    for _, digest in find_prefixed(seed, "00000"):
+        res = digest.hex()
         print(f"Found a good hash: {res}")
         try:
             pos = int(res[5])
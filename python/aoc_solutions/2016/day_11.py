@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from collections import Counter, deque
 from itertools import chain, combinations
 from pathlib import Path
-from typing import Deque, Iterator, List, Set, Tuple
+from typing import Iterator, List, Set, Tuple
 import re
 import sys
 
@@ -12,13 +11,15 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.state import StateLayout
 
 
 GI = GetInput()
 
 Floor = Set[Tuple[str, str]]
 Floors = List[Floor]
-State = Tuple[int, int, Floors]  # (moves, elevator, floors)
+# (piano del microchip, piano del generatore) di un elemento
+Pair = Tuple[int, int]
 
 
 def parse_floors(src: str) -> Floors:
@@ -30,72 +31,94 @@ def parse_floors(src: str) -> Floors:
     return floors
 
 
-def is_valid_transition(floor: Floor) -> bool:
-    """Un piano è valido se nessun microchip è esposto a generatori estranei."""
-    kinds = {kind for _, kind in floor}
-    if len(kinds) < 2:
-        return True
-    # ci sono sia microchip che generatori: ogni microchip deve avere il suo generatore
-    return all((obj, "generator") in floor for (obj, kind) in floor if kind == "microchip")
+def to_pairs(floors: Floors) -> List[Pair]:
+    """Per ogni elemento la coppia (piano microchip, piano generatore)."""
+    chips: dict[str, int] = {}
+    generators: dict[str, int] = {}
+    for idx, floor in enumerate(floors):
+        for element, kind in floor:
+            (chips if kind == "microchip" else generators)[element] = idx
+    if chips.keys() != generators.keys():
+        raise ValueError("Ogni microchip deve avere il suo generatore (e viceversa).")
+    return [(chips[el], generators[el]) for el in chips]
 
 
-def next_states(state: State) -> Iterator[State]:
-    moves, elevator, floors = state
-    # possiamo spostare uno o due oggetti dal piano corrente
-    possible_moves = chain(
-        combinations(floors[elevator], 2),
-        combinations(floors[elevator], 1),
-    )
-
-    for move in possible_moves:
-        for direction in (-1, 1):
-            next_elevator = elevator + direction
-            if not 0 <= next_elevator < len(floors):
-                continue
-
-            next_floors = floors.copy()
-            next_floors[elevator] = next_floors[elevator].difference(move)
-            next_floors[next_elevator] = next_floors[next_elevator].union(move)
-
-            if is_valid_transition(next_floors[elevator]) and is_valid_transition(next_floors[next_elevator]):
-                yield (moves + 1, next_elevator, next_floors)
-
+def is_valid(pairs: List[Pair]) -> bool:
+    """Nessun microchip può stare su un piano con generatori estranei senza il suo."""
+    generator_floors = {gen for _, gen in pairs}
+    return all(chip == gen or chip not in generator_floors for chip, gen in pairs)
 
-def is_all_top_level(floors: Floors) -> bool:
-    """True se tutti gli oggetti sono sull'ultimo piano."""
-    last_index = len(floors) - 1
-    return all(not floor for idx, floor in enumerate(floors) if idx < last_index)
 
+class Building:
+    """
+    Stato = (ascensore, coppie) impacchettato in un int.
 
-def count_floor_objects(state: State) -> Tuple[int, Tuple[Tuple[Tuple[str, int], ...], ...]]:
-    """Condensa lo stato in una forma hashabile che ignora le etichette degli elementi.
-
-    Questo sfrutta la simmetria del problema (nomi degli elementi irrilevanti).
+    I nomi degli elementi sono irrilevanti: ordinando le coppie
+    (microchip, generatore) stati simmetrici hanno la stessa codifica.
     """
-    _, elevator, floors = state
-    summary = []
-    for floor in floors:
-        c = Counter(kind for _, kind in floor)
-        summary.append(tuple(c.most_common()))
-    return elevator, tuple(summary)
+
+    def __init__(self, n_floors: int, n_pairs: int) -> None:
+        self.n_floors = n_floors
+        top = n_floors - 1
+        # ogni coppia è codificata come chip * n_floors + gen
+        self.layout = StateLayout(
+            elevator=top, **{f"pair_{i}": n_floors * n_floors - 1 for i in range(n_pairs)}
+        )
+        self.goal = self.encode(top, [(top, top)] * n_pairs)
+
+    def encode(self, elevator: int, pairs: List[Pair]) -> int:
+        n = self.n_floors
+        return self.layout.pack(elevator, *sorted(chip * n + gen for chip, gen in pairs))
+
+    def decode(self, state: int) -> Tuple[int, List[Pair]]:
+        elevator, *codes = self.layout.unpack(state)
+        return elevator, [divmod(code, self.n_floors) for code in codes]
+
+    def next_states(self, state: int) -> Iterator[int]:
+        elevator, pairs = self.decode(state)
+        # oggetti al piano dell'ascensore: (indice coppia, 0 = microchip / 1 = generatore)
+        here = [(i, k) for i, pair in enumerate(pairs) for k in (0, 1) if pair[k] == elevator]
+        lowest = min(min(pair) for pair in pairs)
+
+        # possiamo spostare uno o due oggetti dal piano corrente
+        for move in chain(combinations(here, 2), combinations(here, 1)):
+            for direction in (-1, 1):
+                next_elevator = elevator + direction
+                if not 0 <= next_elevator < self.n_floors:
+                    continue
+                # inutile scendere se sotto non c'è più niente
+                if direction < 0 and elevator <= lowest:
+                    continue
+
+                next_pairs = [list(pair) for pair in pairs]
+                for i, k in move:
+                    next_pairs[i][k] = next_elevator
+                candidate = [(chip, gen) for chip, gen in next_pairs]
+                if is_valid(candidate):
+                    yield self.encode(next_elevator, candidate)
 
 
 def min_moves_to_top_level(floors: Floors) -> int:
-    seen: Set[Tuple[int, Tuple[Tuple[Tuple[str, int], ...], ...]]] = set()
-    queue: Deque[State] = deque([(0, 0, floors)])
+    pairs = to_pairs(floors)
+    building = Building(len(floors), len(pairs))
+    start = building.encode(0, pairs)
 
-    while queue:
-        state = queue.popleft()
-        moves, _, floors = state
+    # BFS livello per livello sugli stati impacchettati
+    seen: Set[int] = {start}
+    frontier = [start]
+    moves = 0
 
-        if is_all_top_level(floors):
+    while frontier:
+        if building.goal in seen:
             return moves
-
-        for next_state in next_states(state):
-            key = count_floor_objects(next_state)
-            if key not in seen:
-                seen.add(key)
-                queue.append(next_state)
+        next_frontier: List[int] = []
+        for state in frontier:
+            for next_state in building.next_states(state):
+                if next_state not in seen:
+                    seen.add(next_state)
+                    next_frontier.append(next_state)
+        frontier = next_frontier
+        moves += 1
 
     raise RuntimeError("Nessuna soluzione trovata")
 
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from functools import cache
-from hashlib import md5
+from collections import deque
+from itertools import takewhile
 from pathlib import Path
 from typing import Optional
-import re
 import sys
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
@@ -12,53 +11,57 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.hashmine import HexRun, find_prefixed
 
 
 GI = GetInput()
 
 
-@cache
-def _md5_once(s: str) -> str:
-    return md5(s.encode()).hexdigest()
+TRIPLE = HexRun(3)
+# Hash "stretched": dopo il primo, altri 2016 md5 sull'hexdigest
+STRETCH = 2016
 
 
-@cache
-def _md5_stretched(s: str) -> str:
-    for _ in range(2017):
-        s = md5(s.encode()).hexdigest()
-    return s
-
-
-def _find_64th_key(salt: str, hasher) -> int:
-    triple_re = re.compile(r"(\w)\1\1")
+def _find_64th_key(salt: str, stretch: int = 0) -> int:
+    """
+    Una chiave è un indice il cui hash contiene una tripla xxx, seguito entro
+    1000 indici da un hash con la cinquina xxxxx. Ogni cinquina è anche una
+    tripla: basta scorrere (in ordine) solo gli hash con una tripla, tenendo
+    un buffer dei successivi 1000 indici.
+    """
+    triples = find_prefixed(salt, TRIPLE, stretch=stretch)
+    # (indice, digest) delle triple già calcolate ma non ancora valutate
+    ahead: deque[tuple[int, bytes]] = deque()
     keys_found = 0
-    i = 0
+
+    def pull() -> None:
+        ahead.append(next(triples))
 
     while True:
-        h = hasher(f"{salt}{i}")
-        m = triple_re.search(h)
-        if m:
-            ch = m.group(1)
-            pattern = ch * 5
-            for j in range(i + 1, i + 1001):
-                if pattern in hasher(f"{salt}{j}"):
-                    keys_found += 1
-                    if keys_found == 64:
-                        return i
-                    break
-        i += 1
+        if not ahead:
+            pull()
+        i, digest = ahead.popleft()
+        while not ahead or ahead[-1][0] <= i + 1000:
+            pull()
+
+        pattern = TRIPLE.first(digest) * 5  # type: ignore[operator]
+        window = takewhile(lambda item: item[0] <= i + 1000, ahead)
+        if any(pattern in dj.hex() for _, dj in window):
+            keys_found += 1
+            if keys_found == 64:
+                return i
 
 
 def solve_1(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
     salt = raw.strip()
-    return _find_64th_key(salt, _md5_once)
+    return _find_64th_key(salt)
 
 
 def solve_2(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
     salt = raw.strip()
-    return _find_64th_key(salt, _md5_stretched)
+    return _find_64th_key(salt, STRETCH)
 
 
 if __name__ == "__main__":
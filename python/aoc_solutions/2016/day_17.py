@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-from hashlib import md5
 from pathlib import Path
-from queue import PriorityQueue
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 import sys
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
@@ -11,6 +9,8 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.hashmine import hasher
+from aoclib.search import PriorityHeap
 
 
 GI = GetInput()
@@ -22,11 +22,8 @@ D = {
     "L": (-1, 0),
 }
 
-OPEN_CHARS = "bcdef"
-
-
-def _md5_hex(s: str) -> str:
-    return md5(s.encode()).hexdigest()
+# Una porta è aperta se il suo carattere esadecimale è b, c, d, e oppure f
+OPEN_NIBBLE = 0xB
 
 
 def move(pos: Tuple[int, int], direction: str) -> Tuple[int, int]:
@@ -34,22 +31,23 @@ def move(pos: Tuple[int, int], direction: str) -> Tuple[int, int]:
     return pos[0] + dx, pos[1] + dy
 
 
-def find_open_doors(md5sum: str) -> List[str]:
+def find_open_doors(digest: bytes) -> List[str]:
+    """Porte aperte dai primi 4 nibble del digest md5 (U, D, L, R)."""
     res: List[str] = []
-    if md5sum[0] in OPEN_CHARS:
+    if digest[0] >> 4 >= OPEN_NIBBLE:
         res.append("U")
-    if md5sum[1] in OPEN_CHARS:
+    if digest[0] & 0xF >= OPEN_NIBBLE:
         res.append("D")
-    if md5sum[2] in OPEN_CHARS:
+    if digest[1] >> 4 >= OPEN_NIBBLE:
         res.append("L")
-    if md5sum[3] in OPEN_CHARS:
+    if digest[1] & 0xF >= OPEN_NIBBLE:
         res.append("R")
     return res
 
 
-def around_me(code: str, x: int, y: int) -> List[str]:
+def around_me(digest: bytes, x: int, y: int) -> List[str]:
     res: List[str] = []
-    open_doors = find_open_doors(_md5_hex(code))
+    open_doors = find_open_doors(digest)
     # UP
     if y > 0 and "U" in open_doors:
         res.append("U")
@@ -67,43 +65,46 @@ def around_me(code: str, x: int, y: int) -> List[str]:
 
 def solve_1(test_string: str | None = None) -> str:
     raw = GI.input if test_string is None else test_string
-    passcode = raw.strip()
+    # md5(passcode + percorso): il passcode è sempre lo stesso prefisso
+    door_hash: Callable[[bytes], bytes] = hasher(raw.strip())
 
-    q: PriorityQueue[Tuple[int, Tuple[int, int], str]] = PriorityQueue()
-    q.put((0, (0, 0), ""))
+    # Priorità (passi, posizione, percorso): stesso ordine della vecchia PriorityQueue
+    q: PriorityHeap[Tuple[int, Tuple[int, int], str], None] = PriorityHeap()
+    q.push((0, (0, 0), ""), None)
 
-    while not q.empty():
-        steps, pos, path = q.get()
+    while q:
+        (steps, pos, path), _ = q.pop()
         x, y = pos
-        for direction in around_me(f"{passcode}{path}", x, y):
+        for direction in around_me(door_hash(path.encode()), x, y):
             new_pos = move(pos, direction)
             new_path = path + direction
             if new_pos == (3, 3):
                 return new_path
-            q.put((steps + 1, new_pos, new_path))
+            q.push((steps + 1, new_pos, new_path), None)
 
     raise RuntimeError("Nessun percorso trovato")
 
 
 def solve_2(test_string: str | None = None) -> int:
     raw = GI.input if test_string is None else test_string
-    passcode = raw.strip()
+    # md5(passcode + percorso): il passcode è sempre lo stesso prefisso
+    door_hash: Callable[[bytes], bytes] = hasher(raw.strip())
 
-    q: PriorityQueue[Tuple[int, Tuple[int, int], str]] = PriorityQueue()
-    q.put((0, (0, 0), ""))
+    # Serve esplorare tutti i percorsi: l'ordine non conta, basta una pila
+    stack: List[Tuple[Tuple[int, int], str]] = [((0, 0), "")]
     max_steps = 0
 
-    while not q.empty():
-        steps, pos, path = q.get()
+    while stack:
+        pos, path = stack.pop()
         x, y = pos
-        for direction in around_me(f"{passcode}{path}", x, y):
+        for direction in around_me(door_hash(path.encode()), x, y):
             new_pos = move(pos, direction)
             new_path = path + direction
             if new_pos == (3, 3):
-                if steps + 1 > max_steps:
-                    max_steps = steps + 1
+                if len(new_path) > max_steps:
+                    max_steps = len(new_path)
             else:
-                q.put((steps + 1, new_pos, new_path))
+                stack.append((new_pos, new_path))
 
     return max_steps
 
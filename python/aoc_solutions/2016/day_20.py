@@ -9,6 +9,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.intervals import IntervalSet
 
 
 GI = GetInput()
@@ -28,56 +29,22 @@ def _parse_ranges(raw: str) -> List[Range]:
     return ranges
 
 
-def _merge_ranges(ranges: List[Range]) -> List[Range]:
-    """Unisce intervalli [start, end] sovrapposti o adiacenti."""
-    if not ranges:
-        return []
-
-    ranges.sort(key=lambda r: r[0])
-    merged: List[List[int]] = [[ranges[0][0], ranges[0][1]]]
-
-    for start, end in ranges[1:]:
-        last = merged[-1]
-        if start <= last[1] + 1:
-            if end > last[1]:
-                last[1] = end
-        else:
-            merged.append([start, end])
-
-    return [(s, e) for s, e in merged]
+def _allowed(raw: str) -> IntervalSet:
+    """IP consentiti: tutto [0, MAX_IP] meno gli intervalli bloccati (uniti)."""
+    blocked = IntervalSet.from_closed(_parse_ranges(raw))
+    return blocked.complement(0, MAX_IP + 1)
 
 
 def solve_1(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
-    ranges = _merge_ranges(_parse_ranges(raw))
-
-    candidate = 0
-    for start, end in ranges:
-        if candidate < start:
-            break
-        if start <= candidate <= end:
-            candidate = end + 1
-
-    return candidate
+    allowed = _allowed(raw)
+    # Se è tutto bloccato il primo candidato è oltre MAX_IP
+    return allowed.min if allowed else MAX_IP + 1
 
 
 def solve_2(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
-    ranges = _merge_ranges(_parse_ranges(raw))
-
-    allowed = 0
-    prev_end = -1
-
-    for start, end in ranges:
-        if start > prev_end + 1:
-            allowed += start - (prev_end + 1)
-        if end > prev_end:
-            prev_end = end
-
-    if prev_end < MAX_IP:
-        allowed += MAX_IP - prev_end
-
-    return allowed
+    return _allowed(raw).total_length
 
 
 if __name__ == "__main__":
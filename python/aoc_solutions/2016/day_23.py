@@ -2,14 +2,14 @@ from __future__ import annotations
 
 from pathlib import Path
 import sys
-from typing import Optional, List, Dict
-from math import factorial
+from typing import Optional, Dict
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.assembunny import REGISTERS, Machine
 
 
 GI = GetInput()
@@ -29,91 +29,28 @@ GI = GetInput()
 #          If tgl toggles itself (for example, if a is 0, tgl a would target itself and become inc a), the resulting instruction is not executed until the next time it is reached.
 
 
-def _run_program(instructions: List[str], initial_eggs: int) -> Dict[str, int]:
+def _run_program(raw: str, initial_eggs: int) -> Dict[str, int]:
     """Esegue il linguaggio Assembunny e restituisce i registri finali."""
-    regs: Dict[str, int] = {"a": initial_eggs, "b": 0, "c" : 0, "d": 0}
-    ip = 0
-    n = len(instructions)
-
-    def _value(token: str) -> int:
-        return int(token) if token.lstrip("-").isdigit() else regs[token]
-
-    while 0 <= ip < n:
-        parts = instructions[ip].split()
-        op = parts[0]
-
-        if op == "inc":
-            regs[parts[1]] += 1
-            ip += 1
-        elif op == "dec":
-            regs[parts[1]] -= 1
-            ip += 1
-        elif op == "cpy":
-            x, y = parts[1], parts[2]
-            regs[y] = _value(x)
-            ip += 1
-        elif op == "jnz":
-            x, offset = parts[1], parts[2]
-            offset = _value(offset)
-            if _value(x) != 0:
-                ip += int(offset)
-            else:
-                ip += 1
-        elif op == "tgl":
-            ip_tochange = ip + regs[parts[1]]
-
-            try:
-                actual_instruction = instructions[ip_tochange]
-            except:
-                pass
-            else:
-                parts = actual_instruction.split()
-                actual_op = parts[0]
-                new_op = "_"
-                if actual_op == "inc":
-                    new_op = f"dec {parts[1]}"
-                elif actual_op == "dec":
-                    new_op = f"inc {parts[1]}"
-                elif actual_op == "tgl":
-                    new_op = f"inc {parts[1]}"
-                elif actual_op == "jnz":
-                    new_op = f"cpy {parts[1]} {parts[2]}"
-                elif actual_op == "cpy":
-                    new_op = f"jnz {parts[1]} {parts[2]}"
-                else:
-                    print(f"mi sono dimenticato di: {actual_op}")
-                    exit(1)
-                
-                instructions[ip_tochange] = new_op
-            finally:
-                ip += 1
-
-        else:
-            raise ValueError(f"Istruzione sconosciuta: {op!r}")
-
-    return regs
+    # il programma calcola a! con cicli annidati "inc/dec/jnz": la Machine li
+    # esegue come somme e prodotti, tgl ricompila solo le istruzioni toccate
+    regs = Machine(raw).run(a=initial_eggs)
+    return dict(zip(REGISTERS, regs))
 
 
 def solve_1(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
-    
-    instructions: List[str] = raw.splitlines()
     initial_eggs: int = 7
-    regs = _run_program(instructions, initial_eggs)
-    
+    regs = _run_program(raw, initial_eggs)
+
     return regs["a"]
 
 
 def solve_2(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
-    
-    part1_result = solve_1()
-    K = part1_result - factorial(7)
-
-    initial_eggs_part2 = 12
-    return factorial(initial_eggs_part2) + K
-
+    initial_eggs: int = 12
+    regs = _run_program(raw, initial_eggs)
 
+    return regs["a"]
 
 
 if __name__ == "__main__":
@@ -4,14 +4,8 @@ from pathlib import Path
 import sys
 from dataclasses import dataclass, field
 from typing import Optional, Tuple, List, Dict, Iterable, Iterator
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from queue import PriorityQueue
 
 
-# Animation Libs
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 import math
 from typing import TypedDict
 
@@ -33,6 +27,18 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput
+from input_cache import cached_parse
+from aoclib.lazy import lazy_import
+from aoclib.parallel import default_workers
+from aoclib.search import bfs
+from aoclib.tsp import held_karp
+
+# Solo per l'animazione (commentata in fondo al file)
+np = lazy_import("numpy")
+plt = lazy_import("matplotlib.pyplot")
+mpl_animation = lazy_import("matplotlib.animation")
+# Il pool di processi serve solo a calcolare i BFS (non in cache)
+futures_mod = lazy_import("concurrent.futures")
 
 
 GI = GetInput()
@@ -241,54 +247,47 @@ class Graph:
         return g
 
 def find_best_path(grid: Grid, start: Point, total_nodes: int) -> tuple[BfsFromStart, list[Point]]:
+    """
+    BFS da `start` verso gli altri nodi (escluso lo 0, che è sempre il punto
+    di partenza del tour). Per ogni nodo: costo e percorso (start escluso,
+    nodo di arrivo incluso); i frames sono le celle nell'ordine di visita.
+    """
+    # Celle come indici piatti: i = row * width + col
+    width = len(grid[0])
+    cells = [point for row in grid for point in row]
+    walkable = [point.can_walk for point in cells]
+    # stesso ordine di D (giù, destra, su, sinistra)
+    offsets = tuple(d.row * width + d.col for d in D)
+
+    def neighbours(i: int) -> Iterator[int]:
+        for off in offsets:
+            if walkable[i + off]:
+                yield i + off
+
+    targets = {
+        point.row * width + point.col
+        for point in grid.nodes.values()
+        if point.node and point.node != start.node
+    }
+    remaining = set(targets)
+
+    def all_found(i: int) -> bool:
+        remaining.discard(i)
+        return not remaining
+
+    start_index = start.row * width + start.col
+    search = bfs(start_index, neighbours, len(cells), goal=all_found)
+
+    # nodi nell'ordine in cui la BFS li raggiunge
     result: BfsFromStart = dict()
-    visited: set = set()
-    seq = 0
-    path : list = list()
-    frames: list[Point] = list()
-
-    q = PriorityQueue()
-
-    # queue data format: [cost, tiebreaker, Point, path_to_here]
-
-    # Idea:
-    # - get next queue element with priority
-    # - check if element is a node, and append to result (should be the best..)
-    # - list walkable paths
-    # - remove the visited ones
-    # - add to the queue all the walkable nodes filtered
-    # - repeat
-    
-    q.put([0,seq, start, path])
-    frames.append(start)
-    seq += 1
-
-    while not q.empty():
-        cost: int
-        point: Point
-        cost,_,point,path = q.get()
-        frames.append(point)
-
-        if (point.is_node) and (point.node != start.node):
-            if point.node:
-                result[point.node] = {
-                    "cost": cost,
-                    "path": path
-                }
-        
-        if len(result) == total_nodes:
-            return (result, frames)
-
-        possible_paths = grid.get_walkable(point)
-
-        for next_point in [possible_point for possible_point in possible_paths if possible_point not in visited]:
-            visited.add(next_point)
-            new_path = path.copy()
-            new_path.append(next_point)
-            q.put([cost+1, seq, next_point, new_path])
-            seq += 1
+    for i in search.order:
+        if i in targets:
+            result[cells[i].node] = {
+                "cost": search.dist[i],
+                "path": [cells[j] for j in search.path(i)[1:]],
+            }
 
-    return (result, frames)
+    return (result, [cells[i] for i in search.order])
 
 def find_best_tour(
     graph: Graph,
@@ -303,132 +302,61 @@ def find_best_tour(
     If go_back is True:
       - route must visit all nodes and finally go back to start_id.
 
-    We use a uniform-cost search (Dijkstra-like) over the space of tours:
-    - state = (current_node, visited_set, cost_so_far, route_nodes, route_points)
-    - priority queue ordered by cost_so_far
-    - the first state that satisfies the goal condition is optimal.
+    Held-Karp over the full mesh (aoclib.tsp): O(2^n * n^2) instead of a
+    search over partial tours. The only frame is the final, complete route.
     """
-
-    total_nodes: int = len(graph)
     if start_id not in graph.nodes:
         raise ValueError(f"Start node {start_id} not in graph")
 
-    best_route_nodes: list[int] = []
-    best_cost: int = 0
-    frames: list[RouteFrame] = []
-
-    # queue data format:
-    # [cost_so_far, tie_breaker, current_node_id, visited_set, route_nodes, route_points]
-    q: PriorityQueue = PriorityQueue()
-    seq = 0  # tie-breaker for stable ordering
-
-    # initial state
-    start_visited = {start_id}
-    start_route_nodes: list[int] = [start_id]
-    start_route_points: list[Point] = []  # will be built as we move between nodes
-
-    q.put([0, seq, start_id, start_visited, start_route_nodes, start_route_points])
-    seq += 1
-
-    while not q.empty():
-        cost: int
-        current_id: int
-        visited: set[int]
-        route_nodes: list[int]
-        route_points: list[Point]
-
-        cost, _, current_id, visited, route_nodes, route_points = q.get()
-
-        # goal check depends on go_back flag
-        is_complete = (
-            len(visited) == total_nodes
-            if not go_back
-            else (len(visited) == total_nodes and current_id == start_id)
-        )
+    ids = sorted(graph.nodes)
+    dist = [[0 if u == v else graph.get_cost(u, v) for v in ids] for u in ids]
+    tour = held_karp(dist, cycle=go_back, start=ids.index(start_id))
 
-        # record this state as a graph-frame (for future visualization)
-        frame: RouteFrame = {
-            "cost": cost,
-            "route_nodes": list(route_nodes),
-            "route_points": list(route_points),
-            "complete": is_complete,
-        }
-        frames.append(frame)
-
-        # if this state satisfies the goal condition, we are done
-        if is_complete:
-            best_route_nodes = route_nodes
-            best_cost = cost
-            break
-
-        # expand neighbors
-        for neighbor_id, info in graph.neighbors(current_id).items():
-            edge_cost: int = info["cost"]
-            segment_path: list[Point] = info["path"]  # path from current_id -> neighbor_id
-
-            # special handling for start_id when go_back=True:
-            # we want to allow exactly one final step back to start
-            if neighbor_id == start_id:
-                if not go_back:
-                    # when go_back is False, we never revisit the start node
-                    continue
-                # when go_back is True, we only allow going back to start
-                # after all nodes have been visited
-                if len(visited) != total_nodes:
-                    continue
-
-                new_cost = cost + edge_cost
-                new_visited = set(visited)  # same set, all nodes already visited
-                new_route_nodes = list(route_nodes)
-                new_route_nodes.append(start_id)
-
-                if route_points:
-                    new_route_points = list(route_points)
-                    new_route_points.extend(segment_path[1:])
-                else:
-                    new_route_points = list(segment_path)
-
-                q.put([new_cost, seq, start_id, new_visited, new_route_nodes, new_route_points])
-                seq += 1
-                continue
-
-            # regular neighbors (not the start node)
-            if neighbor_id in visited:
-                # do not revisit already visited nodes
-                continue
-
-            new_cost = cost + edge_cost
+    route_nodes = [ids[i] for i in tour.route]
+    # first segment: keep the full path; next ones skip the shared joint
+    route_points: list[Point] = []
+    for u, v in zip(route_nodes, route_nodes[1:]):
+        segment = graph.get_path(u, v)
+        route_points.extend(segment[1:] if route_points else segment)
 
-            # clone and extend visited set
-            new_visited = set(visited)
-            new_visited.add(neighbor_id)
+    frame: RouteFrame = {
+        "cost": tour.cost,
+        "route_nodes": list(route_nodes),
+        "route_points": route_points,
+        "complete": True,
+    }
+    return route_nodes, tour.cost, [frame]
 
-            # clone and extend route in terms of node ids
-            new_route_nodes = list(route_nodes)
-            new_route_nodes.append(neighbor_id)
+# start_id -> { target_id: (cost, [(row, col), ...]) }
+PlainBfsResults = dict[int, dict[int, tuple[int, list[tuple[int, int]]]]]
 
-            # extend the physical path in the maze:
-            # first segment: we keep the full path
-            # next segments: skip the first point to avoid duplicating joints
-            if route_points:
-                new_route_points = list(route_points)
-                new_route_points.extend(segment_path[1:])
-            else:
-                new_route_points = list(segment_path)
-
-            q.put([new_cost, seq, neighbor_id, new_visited, new_route_nodes, new_route_points])
-            seq += 1
-
-    return best_route_nodes, best_cost, frames
-
-def solve_1(test_string: str | None = None) -> tuple[int,int]:
-    inputs_1 = GI.input if test_string is None else test_string
 
+@cached_parse("2016-24-bfs", version="1")
+def _compute_bfs(inputs_1: str) -> PlainBfsResults:
+    """
+    BFS da ogni nodo verso tutti gli altri (il precalcolo pesante),
+    ridotta a costi e coordinate per poterla salvare in cache su disco.
+    """
     grid = Grid(inputs_1)
     total_nodes: int = len(grid.nodes) - 1
-    BFSresults: AllBfsResults = {}
+    plain: PlainBfsResults = {}
+
+    def store(start: Point, targets: BfsFromStart) -> None:
+        assert start.node is not None
+        plain[start.node] = {
+            target: (info["cost"], [(p.row, p.col) for p in info["path"]])
+            for target, info in targets.items()
+        }
+
+    workers = default_workers()
+    if workers <= 1:
+        # sotto `aoc run -j N` / `serve`, o con una sola CPU: niente pool
+        for start in grid.nodes.values():
+            targets, _frames = find_best_path(grid, start, total_nodes)
+            store(start, targets)
+        return plain
 
-    with ProcessPoolExecutor() as executor:
+    with futures_mod.ProcessPoolExecutor(max_workers=workers) as executor:
 
         futures = {
             executor.submit(find_best_path, grid, start, total_nodes): start 
@@ -436,31 +364,64 @@ def solve_1(test_string: str | None = None) -> tuple[int,int]:
             }
 
 
-        for future in as_completed(futures):
-            start = futures[future]
-            paths = future.result()
-            assert start.node is not None
-            BFSresults[start.node] = paths
+        for future in futures_mod.as_completed(futures):
+            targets, _frames = future.result()
+            store(futures[future], targets)
 
-    graph = Graph.from_bfs_results(BFSresults, directed=False)
+    return plain
 
-    best_route_nodes_1, best_cost_1, frames_1 = find_best_tour(graph, 0)
-    best_route_nodes_2, best_cost_2, frames_2 = find_best_tour(graph, 0, True)
+
+def _build_graph(inputs_1: str) -> Graph:
+    """Grafo completo tra i nodi numerati, con i costi delle BFS (in cache)."""
+    grid = Grid(inputs_1)
+    # i frames della BFS servono solo all'animazione: dalla cache non li abbiamo
+    BFSresults: AllBfsResults = {
+        start: (
+            {
+                target: {"cost": cost, "path": [grid[r][c] for r, c in path]}
+                for target, (cost, path) in targets.items()
+            },
+            [],
+        )
+        for start, targets in _compute_bfs(inputs_1).items()
+    }
 
     #anim = animate_bfs(grid, BFSresults, interval=5, frame_step=10, save_path=None)
     #plt.show()
 
+    return Graph.from_bfs_results(BFSresults, directed=False)
+
+
+def solve_both(test_string: str | None = None) -> tuple[int, int]:
+    """Le due parti condividono griglia, BFS e grafo: si costruiscono una volta."""
+    inputs_1 = GI.input if test_string is None else test_string
+    graph = _build_graph(inputs_1)
+
+    _best_route_nodes_1, best_cost_1, _frames_1 = find_best_tour(graph, 0)
+    _best_route_nodes_2, best_cost_2, _frames_2 = find_best_tour(graph, 0, True)
 
     return best_cost_1, best_cost_2
 
 
+def solve_1(test_string: str | None = None) -> int:
+    inputs_1 = GI.input if test_string is None else test_string
+    _best_route_nodes, best_cost, _frames = find_best_tour(_build_graph(inputs_1), 0)
+    return best_cost
+
+
+def solve_2(test_string: str | None = None) -> int:
+    inputs_1 = GI.input if test_string is None else test_string
+    _best_route_nodes, best_cost, _frames = find_best_tour(_build_graph(inputs_1), 0, True)
+    return best_cost
+
+
 # def animate_bfs(
 #     grid: "Grid",
 #     results: Dict[int, Tuple[BfsFromStart, List["Point"]]],
 #     interval: int = 50,
 #     frame_step: int = 1,
 #     save_path: str | None = None,
-# ) -> FuncAnimation:
+# ) -> mpl_animation.FuncAnimation:
 #     """
 #     Animazione cyberpunk delle BFS per ogni nodo di partenza.
 
@@ -626,7 +587,7 @@ def solve_1(test_string: str | None = None) -> tuple[int,int]:
 #             artists.append(img)
 #         return artists
 
-#     anim = FuncAnimation(
+#     anim = mpl_animation.FuncAnimation(
 #         fig,
 #         update,
 #         frames=total_frames,
@@ -642,6 +603,6 @@ def solve_1(test_string: str | None = None) -> tuple[int,int]:
 #     return anim
 
 if __name__ == "__main__":
-    part1,part2 = solve_1()
+    part1, part2 = solve_both()
     print(f"Part 1: {part1}")
     print(f"Part 2: {part2}")
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 from pathlib import Path
 import sys
-from typing import Optional, List, Dict
-from math import factorial
+from typing import Optional, Set
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput
+from aoclib.assembunny import Machine, Snapshot
 
 
 GI = GetInput()
@@ -28,110 +28,39 @@ GI = GetInput()
 #          If toggling produces an invalid instruction (like cpy 1 2) and an attempt is later made to execute that instruction, skip it instead.
 #          If tgl toggles itself (for example, if a is 0, tgl a would target itself and become inc a), the resulting instruction is not executed until the next time it is reached.
 
+# Se lo stato non si ripete, dopo tante uscite corrette il clock si considera buono
+MAX_CLOCK = 1000
 
-def _run_program(instructions: List[str], initial_eggs: int) -> bool:
-    """Esegue il linguaggio Assembunny e restituisce i registri finali."""
-    regs: Dict[str, int] = {"a": initial_eggs, "b": 0, "c" : 0, "d": 0}
-    ip = 0
-    n = len(instructions)
 
-    result = ""
+def _run_program(machine: Machine, initial_eggs: int) -> bool:
+    """True se il programma emette il clock 0, 1, 0, 1, ... all'infinito."""
+    seen: Set[Snapshot] = set()
 
-    def _value(token: str) -> int:
-        return int(token) if token.lstrip("-").isdigit() else regs[token]
-    
-    def _check_result(result: str) -> bool:
-        # return false if result is not in 010101010101 format
-        if len(result) == 1:
-            if result == "0":
-                return True
+    for count, (val, state) in enumerate(machine.outputs(a=initial_eggs)):
+        # ci si ferma al primo valore sbagliato
+        if val != count % 2:
             return False
-        if set(result[0::2]) == set("0") and set(result[1::2]) == set("1"):
-            return True
-        return False
-
-    while 0 <= ip < n:
-        parts = instructions[ip].split()
-        op = parts[0]
-
-        if op == "inc":
-            regs[parts[1]] += 1
-            ip += 1
-        elif op == "dec":
-            regs[parts[1]] -= 1
-            ip += 1
-        elif op == "cpy":
-            x, y = parts[1], parts[2]
-            regs[y] = _value(x)
-            ip += 1
-        elif op == "jnz":
-            x, offset = parts[1], parts[2]
-            offset = _value(offset)
-            if _value(x) != 0:
-                ip += int(offset)
-            else:
-                ip += 1
-        elif op == "out":
-            val = _value(parts[1])
-            result += str(val)
-            print(val, end = "")
-            res = _check_result(result)
-            if not res:
-                return False
-            if len(result) > 1000:
+        # stesso stato dopo un numero pari di uscite: il segnale si ripete
+        if count % 2 == 1:
+            if state in seen:
                 return True
-            ip += 1
-        elif op == "tgl":
-            ip_tochange = ip + regs[parts[1]]
-
-            try:
-                actual_instruction = instructions[ip_tochange]
-            except:
-                pass
-            else:
-                parts = actual_instruction.split()
-                actual_op = parts[0]
-                new_op = "_"
-                if actual_op == "inc":
-                    new_op = f"dec {parts[1]}"
-                elif actual_op == "dec":
-                    new_op = f"inc {parts[1]}"
-                elif actual_op == "tgl":
-                    new_op = f"inc {parts[1]}"
-                elif actual_op == "jnz":
-                    new_op = f"cpy {parts[1]} {parts[2]}"
-                elif actual_op == "cpy":
-                    new_op = f"jnz {parts[1]} {parts[2]}"
-                elif actual_op == "out":
-                    new_op = f"inc {parts[1]}"
-                else:
-                    print(f"mi sono dimenticato di: {actual_op}")
-                    exit(1)
-                
-                instructions[ip_tochange] = new_op
-            finally:
-                ip += 1
-
-        else:
-            raise ValueError(f"Istruzione sconosciuta: {op!r}")
+            seen.add(state)
+        if count >= MAX_CLOCK:
+            return True
 
     return True
 
 
 def solve_1(test_string: Optional[str] = None) -> int:
     raw = GI.input if test_string is None else test_string
-    
-    instructions: List[str] = raw.splitlines()
+
+    machine = Machine(raw)
     initial_eggs: int = 1
-    while True:
-        print(f"Trye with egg {initial_eggs}: ", end= "")
-        res = _run_program(instructions, initial_eggs)
-        if res:
-            break
+    while not _run_program(machine, initial_eggs):
         initial_eggs += 1
-        print()
-    
+
     return initial_eggs
 
+
 if __name__ == "__main__":
     print(f"Part 1: {solve_1()}")
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import List
 
 import sys
 
@@ -10,6 +10,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.cycles import fast_forward
 
 
 GI = GetInput()
@@ -97,29 +98,9 @@ def solve_2(test_string: str | None = None) -> int:
     platform = ["".join(col) for col in zip(*lines[::-1])]
     cycles = 1_000_000_000
 
-    seen: Dict[Tuple[str, ...], int] = {}
-    sequence: List[List[str]] = []
-
-    current = platform
-    step = 0
-
-    while True:
-        key = tuple(current)
-        if key in seen:
-            cycle_start = seen[key]
-            cycle_length = step - cycle_start
-            break
-        seen[key] = step
-        sequence.append(current)
-        current = _cycle(current)
-        step += 1
-
-    # Ora conosciamo inizio e lunghezza del ciclo
-    if cycles < len(sequence):
-        final_platform = sequence[cycles]
-    else:
-        offset = (cycles - cycle_start) % cycle_length
-        final_platform = sequence[cycle_start + offset]
+    # Gli stati si ripetono: rileviamo il ciclo e saltiamo direttamente allo
+    # stato finale. L'impronta di uno stato è la piattaforma in una sola stringa.
+    final_platform = fast_forward(platform, _cycle, cycles, key="".join)
 
     return _load(final_platform)
 
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Tuple
 
 import sys
 
@@ -11,135 +10,89 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.grid import Grid
 
 
 GI = GetInput()
 
 
-# Direzioni: freccia -> (delta_row, delta_col)
-DIRECTIONS: Dict[str, Tuple[int, int]] = {
-    "→": (0, 1),
-    "←": (0, -1),
-    "↑": (-1, 0),
-    "↓": (1, 0),
-}
+# Direzioni come Grid.offsets: 0 = ↑, 1 = →, 2 = ↓, 3 = ←
+UP, RIGHT, DOWN, LEFT = range(4)
+DIRECTIONS: Dict[str, int] = {"↑": UP, "→": RIGHT, "↓": DOWN, "←": LEFT}
 
+# Bordo attorno alla griglia: il raggio che ci arriva si estingue
+OUTSIDE = " "
 
-@dataclass
-class Tile:
-    row: int
-    col: int
-    symbol: str
-    energized_from: Set[str] = field(default_factory=set)
+# Per ogni carattere e direzione di arrivo, le direzioni in uscita
+BOUNCES: Dict[str, Tuple[Tuple[int, ...], ...]] = {
+    ".": ((UP,), (RIGHT,), (DOWN,), (LEFT,)),
+    "/": ((RIGHT,), (UP,), (LEFT,), (DOWN,)),
+    "\\": ((LEFT,), (DOWN,), (RIGHT,), (UP,)),
+    # Split in alto e in basso
+    "|": ((UP,), (UP, DOWN), (DOWN,), (UP, DOWN)),
+    # Split a sinistra e destra
+    "-": ((LEFT, RIGHT), (RIGHT,), (LEFT, RIGHT), (LEFT,)),
+}
 
-    def add_energy(self, direction: str) -> bool:
-        """
-        Registra che un raggio è passato da questa tile in `direction`.
-        Restituisce True se è la prima volta da quella direzione, False altrimenti.
-        """
-        if direction in self.energized_from:
-            return False
-        self.energized_from.add(direction)
-        return True
 
+class Game:
+    """
+    Raggi su una Grid con bordo: stato = (indice piatto, direzione).
+    energized[i] è la bitmask delle direzioni con cui un raggio è passato da i.
+    """
 
-@dataclass
-class Beam:
-    row: int
-    col: int
-    direction: str  # "→", "←", "↑", "↓"
+    def __init__(self, grid: Grid) -> None:
+        self.grid = grid
+        self.offsets = grid.offsets
+        # bounces[i] = uscite per direzione di arrivo; None sul bordo (fuori dalla griglia)
+        wall: Tuple[Tuple[int, ...], ...] = ((), (), (), ())
+        table = {ord(ch): out for ch, out in BOUNCES.items()}
+        table[ord(OUTSIDE)] = None
+        self.bounces = [table.get(code, wall) for code in grid.flat_list()]
 
+    def energized_count(self, start: int, direction: int) -> int:
+        """
+        Lancia un raggio che parte da `start` (fuori dalla griglia, sul bordo)
+        in direzione `direction` e conta le tile energizzate.
+        """
+        offsets = self.offsets
+        bounces = self.bounces
+        energized = bytearray(len(bounces))
+        beams: List[Tuple[int, int]] = [(start, direction)]
 
-class Game:
-    def __init__(self, lines: List[str]) -> None:
-        self.rows = len(lines)
-        self.cols = len(lines[0]) if self.rows > 0 else 0
-        self.tiles: List[List[Tile]] = [
-            [Tile(r, c, ch) for c, ch in enumerate(line)]
-            for r, line in enumerate(lines)
-        ]
-        self.beams: List[Beam] = []
-
-    def _step(self) -> None:
-        new_beams: List[Beam] = []
-
-        while self.beams:
-            beam = self.beams.pop()
-            dr, dc = DIRECTIONS[beam.direction]
-            nr, nc = beam.row + dr, beam.col + dc
+        while beams:
+            pos, d = beams.pop()
+            pos += offsets[d]
 
             # Fuori dalla griglia: il raggio si estingue
-            if nr < 0 or nr >= self.rows or nc < 0 or nc >= self.cols:
+            out = bounces[pos]
+            if out is None:
                 continue
 
-            tile = self.tiles[nr][nc]
-
             # Se abbiamo già energizzato questa tile da questa direzione, interrompi
-            if not tile.add_energy(beam.direction):
+            bit = 1 << d
+            if energized[pos] & bit:
                 continue
+            energized[pos] |= bit
 
-            ch = tile.symbol
-
-            if ch == ".":
-                new_beams.append(Beam(nr, nc, beam.direction))
-            elif ch == "/":
-                new_dir = {
-                    "→": "↑",
-                    "↑": "→",
-                    "←": "↓",
-                    "↓": "←",
-                }[beam.direction]
-                new_beams.append(Beam(nr, nc, new_dir))
-            elif ch == "\\":
-                new_dir = {
-                    "→": "↓",
-                    "↓": "→",
-                    "←": "↑",
-                    "↑": "←",
-                }[beam.direction]
-                new_beams.append(Beam(nr, nc, new_dir))
-            elif ch == "|":
-                if beam.direction in ("↑", "↓"):
-                    new_beams.append(Beam(nr, nc, beam.direction))
-                else:
-                    # Split in alto e in basso
-                    new_beams.append(Beam(nr, nc, "↑"))
-                    new_beams.append(Beam(nr, nc, "↓"))
-            elif ch == "-":
-                if beam.direction in ("←", "→"):
-                    new_beams.append(Beam(nr, nc, beam.direction))
-                else:
-                    # Split a sinistra e destra
-                    new_beams.append(Beam(nr, nc, "←"))
-                    new_beams.append(Beam(nr, nc, "→"))
-            else:
-                # Qualsiasi altro carattere è trattato come muro: il raggio si ferma
-                continue
-
-        self.beams = new_beams
-
-    def run(self) -> None:
-        while self.beams:
-            self._step()
+            # Qualsiasi altro carattere è trattato come muro: il raggio si ferma
+            for nd in out[d]:
+                beams.append((pos, nd))
 
-    def energized_count(self) -> int:
-        return sum(1 for row in self.tiles for tile in row if tile.energized_from)
+        return len(energized) - energized.count(0)
 
 
-def _run_game(lines: List[str], start_row: int, start_col: int, direction: str) -> int:
-    game = Game(lines)
-    game.beams.append(Beam(start_row, start_col, direction))
-    game.run()
-    return game.energized_count()
+def _run_game(game: Game, start_row: int, start_col: int, direction: str) -> int:
+    # Le coordinate sono quelle della mappa: con il bordo si spostano di 1
+    start = game.grid.index(start_row + 1, start_col + 1)
+    return game.energized_count(start, DIRECTIONS[direction])
 
 
-def _calculate_beam_starts(lines: List[str]) -> List[Tuple[int, int, str]]:
+def _calculate_beam_starts(rows: int, cols: int) -> List[Tuple[int, int, str]]:
     """
     Genera tutte le possibili posizioni di partenza dei raggi sui bordi
     della griglia, come richiesto per la parte 2.
     """
-    rows = len(lines)
-    cols = len(lines[0]) if rows > 0 else 0
     starts: List[Tuple[int, int, str]] = []
 
     # Da sinistra e destra
@@ -157,18 +110,19 @@ def _calculate_beam_starts(lines: List[str]) -> List[Tuple[int, int, str]]:
 
 def solve_1(test_string: str | None = None) -> int:
     raw = GI.input if test_string is None else test_string
-    lines = raw.splitlines()
+    game = Game(Grid.parse(raw, pad=OUTSIDE))
     # Partiamo appena fuori dalla griglia, in alto a sinistra, puntando a destra
-    return _run_game(lines, start_row=0, start_col=-1, direction="→")
+    return _run_game(game, start_row=0, start_col=-1, direction="→")
 
 
 def solve_2(test_string: str | None = None) -> int:
     raw = GI.input if test_string is None else test_string
-    lines = raw.splitlines()
+    grid = Grid.parse(raw)
+    game = Game(grid.padded(OUTSIDE))
 
     best = 0
-    for r, c, direction in _calculate_beam_starts(lines):
-        energized = _run_game(lines, start_row=r, start_col=c, direction=direction)
+    for r, c, direction in _calculate_beam_starts(grid.height, grid.width):
+        energized = _run_game(game, start_row=r, start_col=c, direction=direction)
         if energized > best:
             best = energized
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Tuple, Dict
+from typing import Optional
 import heapq
 import sys
 
@@ -10,78 +10,88 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.grid import Grid
+from aoclib.state import StateLayout
 
 GI = GetInput()
 
 
-Coord = tuple[int, int]
-State = tuple[int, int, int, int]  # (row, col, dir, run)
+WALL = ord("#")
+INF = 10**18
 
 
-def _parse_grid(raw: str) -> list[list[int]]:
-    return [[int(ch) for ch in line.strip()] for line in raw.splitlines() if line.strip()]
-
-
-#                 U        R        D        L
-DIRS: tuple[Coord, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+def _parse_grid(raw: str) -> Grid:
+    # Bordo di '#' attorno alla mappa: nessun controllo sui limiti nel loop
+    return Grid.parse(raw, pad="#")
 
 
 def _dijkstra(
-    grid: list[list[int]],
+    grid: Grid,
     min_run: int,
     max_run: int,
 ) -> int:
-    rows = len(grid)
-    cols = len(grid[0])
-
-    # priority queue items: (cost, row, col, dir, run)
-    pq: list[tuple[int, int, int, int, int]] = []
-    # dir = 0..3, run = steps consecutivi in questa direzione
-    # dir = -1 significa "nessuna direzione ancora"
-    heapq.heappush(pq, (0, 0, 0, -1, 0))
-
-    best: Dict[State, int] = {}
-
-    target: Coord = (rows - 1, cols - 1)
+    # Perdita di calore per cella (indice piatto), -1 sul bordo
+    heat = [-1 if code == WALL else code - ord("0") for code in grid.flat_list()]
+    # direzioni U R D L come Grid.offsets
+    offsets = grid.offsets
+
+    # Stato = (run, dir, pos) impacchettato in un int:
+    # run = passi consecutivi nella direzione dir, pos = indice piatto
+    layout = StateLayout(run=max_run, dir=3, pos=grid.size - 1)
+    dir_shift = layout.shift("dir")
+    pos_shift = layout.shift("pos")
+    run_mask = layout.mask("run")
+
+    dist = layout.table(INF)
+    start = grid.index(1, 1)
+    target = grid.index(grid.height - 2, grid.width - 2)
+    if start == target:
+        return 0
+
+    # Prima mossa: inizio segmento di lunghezza 1 in ogni direzione
+    pq: list[tuple[int, int]] = []
+    for nd, off in enumerate(offsets):
+        npos = start + off
+        if heat[npos] >= 0:
+            nstate = (npos << pos_shift) | (nd << dir_shift) | 1
+            dist[nstate] = heat[npos]
+            heapq.heappush(pq, (heat[npos], nstate))
 
     while pq:
-        cost, r, c, d, run = heapq.heappop(pq)
+        cost, state = heapq.heappop(pq)
+        if cost != dist[state]:
+            continue  # entry obsoleta
+
+        run = state & run_mask
+        d = (state >> dir_shift) & 3
+        pos = state >> pos_shift
 
-        if (r, c) == target and (d == -1 or run >= min_run):
+        if pos == target and run >= min_run:
             # Possiamo fermarci solo se l'ultimo segmento rispetta min_run
             return cost
 
-        state: State = (r, c, d, run)
-        old = best.get(state)
-        if old is not None and old <= cost:
-            continue
-        best[state] = cost
-
-        for nd, (dr, dc) in enumerate(DIRS):
-            nr, nc = r + dr, c + dc
-            if not (0 <= nr < rows and 0 <= nc < cols):
-                continue
-
-            if d == -1:
-                # Prima mossa: inizio segmento di lunghezza 1
-                nrun = 1
-            elif nd == d:
+        for nd in range(4):
+            if nd == d:
                 # Proseguo diritto
                 nrun = run + 1
+                if nrun > max_run:
+                    continue
             else:
                 # Curva: consentita solo se il segmento precedente ha già min_run passi
                 if run < min_run:
                     continue
                 nrun = 1
 
-            if nrun > max_run:
+            npos = pos + offsets[nd]
+            h = heat[npos]
+            if h < 0:
                 continue
 
-            ncost = cost + grid[nr][nc]
-            nstate: State = (nr, nc, nd, nrun)
-            old = best.get(nstate)
-            if old is None or ncost < old:
-                heapq.heappush(pq, (ncost, nr, nc, nd, nrun))
+            ncost = cost + h
+            nstate = (npos << pos_shift) | (nd << dir_shift) | nrun
+            if ncost < dist[nstate]:
+                dist[nstate] = ncost
+                heapq.heappush(pq, (ncost, nstate))
 
     raise RuntimeError("No path found")
 
@@ -9,12 +9,13 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.intervals import IntervalSet
 
 GI = GetInput()
 
 
 Rating = Dict[str, int]
-Interval = Dict[str, tuple[int, int]]  # inclusive ranges for x, m, a, s
+Interval = Dict[str, IntervalSet]  # valori ammessi per x, m, a, s
 
 
 def _parse_input(raw: str) -> tuple[dict[str, list[str]], list[Rating]]:
@@ -80,12 +81,8 @@ def solve_1(test_string: Optional[str] = None) -> int:
 
 def _count_accepted(workflows: dict[str, list[str]]) -> int:
     # DFS sugli intervalli
-    start_intervals: Interval = {
-        "x": (1, 4000),
-        "m": (1, 4000),
-        "a": (1, 4000),
-        "s": (1, 4000),
-    }
+    full = IntervalSet.from_closed([(1, 4000)])
+    start_intervals: Interval = {"x": full, "m": full, "a": full, "s": full}
 
     def split_interval(
         intervals: Interval,
@@ -93,38 +90,19 @@ def _count_accepted(workflows: dict[str, list[str]]) -> int:
         op: str,
         threshold: int,
     ) -> tuple[Optional[Interval], Optional[Interval]]:
-        lo, hi = intervals[var]
+        # '<': vero sotto threshold; '>': vero da threshold + 1 in su
         if op == "<":
-            # true: [lo, threshold-1]
-            t_hi = min(hi, threshold - 1)
-            f_lo = max(lo, threshold)
-            true_iv: Optional[Interval] = None
-            false_iv: Optional[Interval] = None
-            if lo <= t_hi:
-                true_iv = dict(intervals)
-                true_iv[var] = (lo, t_hi)
-            if f_lo <= hi:
-                false_iv = dict(intervals)
-                false_iv[var] = (f_lo, hi)
-            return true_iv, false_iv
+            true_set, false_set = intervals[var].split(threshold)
         else:
-            # op == '>' => true: [threshold+1, hi]
-            t_lo = max(lo, threshold + 1)
-            f_hi = min(hi, threshold)
-            true_iv = None
-            false_iv = None
-            if t_lo <= hi:
-                true_iv = dict(intervals)
-                true_iv[var] = (t_lo, hi)
-            if lo <= f_hi:
-                false_iv = dict(intervals)
-                false_iv[var] = (lo, f_hi)
-            return true_iv, false_iv
+            false_set, true_set = intervals[var].split(threshold + 1)
+        true_iv = {**intervals, var: true_set} if true_set else None
+        false_iv = {**intervals, var: false_set} if false_set else None
+        return true_iv, false_iv
 
     def count_interval(iv: Interval) -> int:
         prod = 1
-        for lo, hi in iv.values():
-            prod *= hi - lo + 1
+        for values in iv.values():
+            prod *= values.total_length
         return prod
 
     total = 0
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Set, Tuple, List
+from typing import Optional, Tuple
 import sys
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
@@ -9,62 +9,56 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.grid import Grid
+from aoclib.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 
 GI = GetInput()
 
 Pos = Tuple[int, int]
-DELTAS: Tuple[Pos, ...] = ((1, 0), (-1, 0), (0, 1), (0, -1))
 
 
-def _parse_grid(raw: str) -> Tuple[List[str], Pos]:
-    lines = [line for line in raw.splitlines() if line.strip()]
-    start: Optional[Pos] = None
-    for r, row in enumerate(lines):
-        c = row.find("S")
-        if c != -1:
-            start = (r, c)
-            break
-    if start is None:
-        raise ValueError("Nessuna 'S' trovata nella griglia.")
-    return lines, start
+def _parse_grid(raw: str) -> Tuple[Grid, Pos]:
+    grid = Grid.parse(raw)
+    try:
+        start = grid.find("S")
+    except ValueError:
+        raise ValueError("Nessuna 'S' trovata nella griglia.") from None
+    return grid, start
 
 
 def _reachable_after_steps(
-    grid: List[str],
+    grid: Grid,
     start: Pos,
     steps: int,
     infinite: bool = False,
 ) -> int:
     """
-    BFS per "frontiere": posizioni raggiungibili esattamente dopo `steps`
-    passi. Se infinite=True, la griglia viene tilata all'infinito usando
-    modulo (classico AoC 2023 day 21).
+    Posizioni raggiungibili esattamente dopo `steps` passi. Se infinite=True,
+    la griglia viene tilata all'infinito (classico AoC 2023 day 21).
+
+    La griglia è bipartita (scacchiera): si può tornare indietro e avanti,
+    quindi una cella è raggiungibile in esattamente `steps` passi se e solo se
+    la sua distanza BFS è <= steps e ha la stessa parità. Basta quindi un
+    solo campo di distanze invece di una frontiera per ogni passo.
     """
-    rows = len(grid)
-    cols = len(grid[0])
-    frontier: Set[Pos] = {start}
-
-    for _ in range(steps):
-        new_frontier: Set[Pos] = set()
-        for (r, c) in frontier:
-            for dr, dc in DELTAS:
-                nr, nc = r + dr, c + dc
-                if infinite:
-                    rr = nr % rows
-                    cc = nc % cols
-                    if grid[rr][cc] != "#":
-                        new_frontier.add((nr, nc))
-                else:
-                    if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] != "#":
-                        new_frontier.add((nr, nc))
-        frontier = new_frontier
-
-    return len(frontier)
+    if infinite:
+        # Abbastanza copie per coprire `steps` passi in ogni direzione
+        rows, cols = grid.shape
+        reps = 2 * max(-(-steps // rows), -(-steps // cols)) + 1
+        half = reps // 2
+        grid = grid.tiled(reps)
+        start = (start[0] + half * rows, start[1] + half * cols)
+
+    dist = grid.distances(start)
+    reachable = (dist >= 0) & (dist <= steps) & ((dist & 1) == (steps & 1))
+    return int(np.count_nonzero(reachable))
 
 
 def _count_infinite_big(
-    grid: List[str],
+    grid: Grid,
     start: Pos,
     steps: int,
 ) -> int:
@@ -73,7 +67,7 @@ def _count_infinite_big(
     raggiungibili come funzione del numero di tile "lontani" è un polinomio
     quadratico. Calcoliamo tre punti equispaziati e interpoliamo.
     """
-    rows = len(grid)
+    rows = grid.height
     base = steps % rows
 
     if steps < 3 * rows:
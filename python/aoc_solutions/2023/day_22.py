@@ -10,6 +10,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from input_cache import cached_parse  # type: ignore[import-untyped]
 
 
 GI = GetInput()
@@ -134,26 +135,58 @@ def _chain_reaction_count(bricks: List[Brick], start_id: int) -> int:
     return len(fallen) - 1
 
 
-def solve_1(test_string: Optional[str] = None) -> int:
-    raw = GI.input if test_string is None else test_string
-    bricks = _parse_bricks(raw)
-    _settle_bricks(bricks)
-    _build_support_graph(bricks)
-    return _count_safe_to_disintegrate(bricks)
+SettledBrick = Tuple[int, int, int, int, int, int, int, Tuple[int, ...], Tuple[int, ...]]
 
 
-def solve_2(test_string: Optional[str] = None) -> int:
-    raw = GI.input if test_string is None else test_string
+@cached_parse("2023-22-settled", version="1")
+def _settled_bricks(raw: str) -> List[SettledBrick]:
+    """
+    Parsing + caduta + grafo dei supporti (la parte costosa, O(n^2)),
+    ridotti a tuple così da poter essere salvati nella cache su disco.
+    """
     bricks = _parse_bricks(raw)
     _settle_bricks(bricks)
     _build_support_graph(bricks)
+    return [
+        (b.id, b.x1, b.y1, b.z1, b.x2, b.y2, b.z2,
+         tuple(sorted(b.supports)), tuple(sorted(b.supported_by)))
+        for b in bricks
+    ]
+
+
+def _load_bricks(raw: str) -> List[Brick]:
+    return [
+        Brick(i, x1, y1, z1, x2, y2, z2, set(supports), set(supported_by))
+        for (i, x1, y1, z1, x2, y2, z2, supports, supported_by) in _settled_bricks(raw)
+    ]
+
 
+def _total_chain_reaction(bricks: List[Brick]) -> int:
     total = 0
     for b in bricks:
         total += _chain_reaction_count(bricks, b.id)
     return total
 
 
+def solve_both(test_string: Optional[str] = None) -> Tuple[int, int]:
+    """Mattoni fatti cadere e grafo dei supporti costruiti una volta per le due parti."""
+    raw = GI.input if test_string is None else test_string
+    bricks = _load_bricks(raw)
+    return _count_safe_to_disintegrate(bricks), _total_chain_reaction(bricks)
+
+
+def solve_1(test_string: Optional[str] = None) -> int:
+    raw = GI.input if test_string is None else test_string
+    bricks = _load_bricks(raw)
+    return _count_safe_to_disintegrate(bricks)
+
+
+def solve_2(test_string: Optional[str] = None) -> int:
+    raw = GI.input if test_string is None else test_string
+    bricks = _load_bricks(raw)
+    return _total_chain_reaction(bricks)
+
+
 if __name__ == "__main__":
     print(f"Part 1: {solve_1()}")
     print(f"Part 2: {solve_2()}")
@@ -7,13 +7,15 @@ from typing import Any, Iterable, List, Tuple, cast
 
 import sys
 
-from sympy import Symbol, nonlinsolve  # type: ignore[import-untyped]
-
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.lazy import lazy_import
+
+# sympy serve solo alla parte 2 ed è l'import più pesante del repo
+sympy = lazy_import("sympy")
 
 GI = GetInput()
 
@@ -134,9 +136,9 @@ def _solve_part2(data: str) -> int:
         raise ValueError("Non sono riuscito a trovare 3 hailstones con velocità diverse.")
 
     # Variabili simboliche
-    sx, sy, sz = Symbol("s_x"), Symbol("s_y"), Symbol("s_z")
-    vx, vy, vz = Symbol("vel_x"), Symbol("vel_y"), Symbol("vel_z")
-    t0, t1, t2 = Symbol("t0"), Symbol("t1"), Symbol("t2")
+    sx, sy, sz = sympy.Symbol("s_x"), sympy.Symbol("s_y"), sympy.Symbol("s_z")
+    vx, vy, vz = sympy.Symbol("vel_x"), sympy.Symbol("vel_y"), sympy.Symbol("vel_z")
+    t0, t1, t2 = sympy.Symbol("t0"), sympy.Symbol("t1"), sympy.Symbol("t2")
 
     # Usiamo Any per non litigare con i type stub di sympy
     start_pos: List[Any] = [sx, sy, sz]
@@ -151,7 +153,7 @@ def _solve_part2(data: str) -> int:
         equations.append(start_pos[1] + start_vel[1] * t - (pos.y + vel.y * t))
         equations.append(start_pos[2] + start_vel[2] * t - (pos.z + vel.z * t))
 
-    solution_set = nonlinsolve(equations, [*start_pos, *start_vel, *times])
+    solution_set = sympy.nonlinsolve(equations, [*start_pos, *start_vel, *times])
 
     # Cast esplicito ad Iterable per accontentare Pylance
     first_solution = next(iter(cast(Iterable[Any], solution_set)))
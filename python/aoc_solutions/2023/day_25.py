@@ -5,13 +5,14 @@ from typing import Dict, Iterable, List, Set, Tuple
 
 import sys
 
-import networkx as nx  # type: ignore[import-untyped]
-
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.lazy import lazy_import
+
+nx = lazy_import("networkx")
 
 GI = GetInput()
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal, Set
+from typing import Set
 import sys
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
@@ -9,103 +9,95 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.grid import Grid
 
 
 GI = GetInput()
 
 # === Type alias ===
-Direction = Literal["^", ">", "v", "<"]
 Pos = tuple[int, int]
-Grid = list[list[str]]
 Visited = Set[Pos]
-State = tuple[int, int, Direction]
 
-# Direzioni: N, E, S, W
-DIRECTIONS: list[Direction] = ["^", ">", "v", "<"]
+# Direzioni come indici 0..3 in senso orario (^ > v <), come Grid.offsets:
+# girare a destra è (d + 1) % 4
 
-M: dict[Direction, tuple[int, int]] = {
-    "^": (-1, 0),
-    ">": (0, 1),
-    "v": (1, 0),
-    "<": (0, -1),
-}
-
-D: dict[Direction, Direction] = {
-    "^": ">",
-    ">": "v",
-    "v": "<",
-    "<": "^",
-}
+# Bordo attorno alla mappa: quando il guardiano ci arriva è uscito
+OUTSIDE = "O"
+WALL = ord("#")
+EXIT = ord(OUTSIDE)
 
 
 def _parse_grid(raw: str) -> tuple[Grid, Pos]:
-    """Parsa la stringa di input in una griglia e trova la posizione iniziale '^'."""
-    grid: Grid = [list(line) for line in raw.splitlines()]
-    start: Pos | None = None
-
-    for i, row in enumerate(grid):
-        try:
-            guard_col = row.index("^")
-        except ValueError:
-            continue
-
-        start = (i, guard_col)
-        # Sostituisci il simbolo del guardiano con un punto
-        grid[i][guard_col] = "."
-        break
-
-    if start is None:
-        raise ValueError("Guardiano non trovato nella mappa.")
-
+    """
+    Parsa l'input in una Grid con un bordo OUTSIDE e trova la posizione
+    iniziale '^' (in coordinate della griglia con bordo).
+    """
+    grid = Grid.parse(raw, pad=OUTSIDE)
+    try:
+        start = grid.find("^")
+    except ValueError:
+        raise ValueError("Guardiano non trovato nella mappa.") from None
+
+    # Sostituisci il simbolo del guardiano con un punto
+    grid[start] = "."
     return grid, start
 
 
-def _simulate(grid: Grid, start: Pos) -> tuple[Grid, Visited, Pos]:
+def _walk(cells: list[int], offsets: tuple[int, ...], pos: int) -> list[int] | None:
     """
-    Simula il percorso del guardiano:
-
-    - Ritorna la griglia (modificata solo togliendo '^'),
-      l'insieme delle posizioni visitate,
-      e la posizione di start.
-    - Se viene rilevato un loop, l'insieme visited è vuoto (sentinel).
+    Cammino del guardiano su indici piatti (grazie al bordo non servono
+    controlli sui limiti). Ritorna le celle visitate in ordine, oppure None
+    se il guardiano entra in un loop.
     """
-    current_row, current_col = start
-    current_dir: Direction = "^"
-
-    visited_tiles: Visited = {start}
-    seen_states: Set[State] = {(current_row, current_col, current_dir)}
+    direction = 0  # "^"
 
-    rows, cols = len(grid), len(grid[0])
+    # seen[i] = bitmask delle direzioni con cui siamo già passati da i
+    seen = bytearray(len(cells))
+    seen[pos] = 1 << direction
+    visited = [pos]
 
     while True:
         # Calcola la nuova posizione basata sulla direzione attuale
-        delta_row, delta_col = M[current_dir]
-        new_row = current_row + delta_row
-        new_col = current_col + delta_col
+        new_pos = pos + offsets[direction]
+        cell = cells[new_pos]
 
         # Verifica se il guardiano esce dalla mappa
-        if new_row < 0 or new_row >= rows or new_col < 0 or new_col >= cols:
-            break  # Fine del percorso
+        if cell == EXIT:
+            return visited  # Fine del percorso
 
         # Controlla se c'è un ostacolo
-        if grid[new_row][new_col] == "#":
+        if cell == WALL:
             # Gira a destra
-            current_dir = D[current_dir]
+            direction = (direction + 1) & 3
             continue
 
         # Muovi il guardiano avanti
-        current_row, current_col = new_row, new_col
+        pos = new_pos
 
         # Controlla se lo stato corrente è già stato visto
-        current_state: State = (current_row, current_col, current_dir)
-        if current_state in seen_states:
-            # Loop rilevato: usiamo visited vuoto come segnale
-            return grid, set(), start
+        bit = 1 << direction
+        bits = seen[pos]
+        if bits & bit:
+            return None
+        if not bits:
+            visited.append(pos)
+        seen[pos] = bits | bit
+
 
-        seen_states.add(current_state)
-        visited_tiles.add((current_row, current_col))
+def _simulate(grid: Grid, start: Pos) -> tuple[Grid, Visited, Pos]:
+    """
+    Simula il percorso del guardiano:
 
-    return grid, visited_tiles, start
+    - Ritorna la griglia (modificata solo togliendo '^'),
+      l'insieme delle posizioni visitate,
+      e la posizione di start.
+    - Se viene rilevato un loop, l'insieme visited è vuoto (sentinel).
+    """
+    visited = _walk(grid.flat_list(), grid.offsets, grid.index(*start))
+    if visited is None:
+        # Loop rilevato: usiamo visited vuoto come segnale
+        return grid, set(), start
+    return grid, {grid.pos(i) for i in visited}, start
 
 
 def solve_1(
@@ -140,21 +132,27 @@ def solve_2(grid: Grid, visited: Visited, start: Pos) -> int:
     visited_without_start: Visited = set(visited)
     visited_without_start.discard(start)
 
+    # Una sola conversione della griglia: l'ostacolo si mette e toglie sulla lista
+    cells = grid.flat_list()
+    offsets = grid.offsets
+    start_index = grid.index(*start)
+
     loops = 0
     max_visited = len(visited_without_start)
 
     for i, point in enumerate(visited_without_start):
         print(f"Evaluating position {i + 1: >3} of {max_visited}", end="")
-        grid[point[0]][point[1]] = "#"
+        index = grid.index(*point)
+        previous = cells[index]
+        cells[index] = WALL
 
-        # Rilancia la simulazione con la stessa griglia e lo stesso start
-        _, result, _ = solve_1(grid=grid, start=start)
-        if not result:
+        # Rilancia la simulazione con lo stesso start
+        if _walk(cells, offsets, start_index) is None:
             loops += 1
 
         # rollback
         print(f" Done! Loop count: {loops}", end="\r")
-        grid[point[0]][point[1]] = "."
+        cells[index] = previous
 
     print()
     return loops
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from queue import PriorityQueue
-from typing import Literal, NamedTuple
+from typing import Iterator, Literal, NamedTuple
 
 import sys
 
@@ -12,6 +11,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput
+from aoclib.search import best_first
 
 
 GI = GetInput()
@@ -60,7 +60,7 @@ def evaluate_equation(eq: Equation, allow_concat: bool) -> bool:
     Restituisce True se esiste una combinazione di operazioni che porta
     da eq.values al risultato eq.result.
 
-    Usa una PriorityQueue per esplorare prima gli stati più promettenti.
+    Esplora (best-first) prima gli stati più vicini al risultato.
     Riempie eq.good_ones con le sequenze di operazioni trovate.
     """
     values = eq.values
@@ -70,54 +70,39 @@ def evaluate_equation(eq: Equation, allow_concat: bool) -> bool:
     if length == 0:
         return False
 
-    q: PriorityQueue[Node] = PriorityQueue()
-
-    # Primo nodo: nessuna operazione applicata, primo valore come risultato temporaneo
-    first_value = values[0]
-    q.put(Node(priority=target - first_value, tmp_res=first_value, index=0, operations=[]))
-
-    found = False
-
-    while not q.empty():
-        priority, tmp_res, index, operations = q.get()
+    def expand(node: Node) -> Iterator[tuple[int, Node]]:
+        _, tmp_res, index, operations = node
 
         # Passiamo al prossimo valore in lista
         index += 1
-
-        # Se abbiamo consumato tutti i valori, verifichiamo il risultato
         if index == length:
-            if tmp_res == target:
-                eq.ok = True
-                eq.good_ones.append(operations)
-                found = True
-            continue
+            return
 
         new_value = values[index]
-
-        # Somma
-        add_res = tmp_res + new_value
-        if add_res <= target:
-            q.put(Node(priority=target - add_res,
-                       tmp_res=add_res,
-                       index=index,
-                       operations=operations + ["+"]))
-
-        # Moltiplicazione
-        mul_res = tmp_res * new_value
-        if mul_res <= target:
-            q.put(Node(priority=target - mul_res,
-                       tmp_res=mul_res,
-                       index=index,
-                       operations=operations + ["*"]))
-
+        candidates = [(tmp_res + new_value, "+"), (tmp_res * new_value, "*")]
         # Concatenazione (solo se consentita)
         if allow_concat:
-            concat_res = int(f"{tmp_res}{new_value}")
-            if concat_res <= target:
-                q.put(Node(priority=target - concat_res,
-                           tmp_res=concat_res,
-                           index=index,
-                           operations=operations + ["||"]))
+            candidates.append((int(f"{tmp_res}{new_value}"), "||"))
+
+        for res, op in candidates:
+            if res <= target:
+                yield target - res, Node(priority=target - res,
+                                         tmp_res=res,
+                                         index=index,
+                                         operations=operations + [op])
+
+    # Primo nodo: nessuna operazione applicata, primo valore come risultato temporaneo
+    first_value = values[0]
+    start = Node(priority=target - first_value, tmp_res=first_value, index=0, operations=[])
+
+    found = False
+
+    for _, (_, tmp_res, index, operations) in best_first([(start.priority, start)], expand):
+        # Se abbiamo consumato tutti i valori, verifichiamo il risultato
+        if index + 1 == length and tmp_res == target:
+            eq.ok = True
+            eq.good_ones.append(operations)
+            found = True
 
     return found
 
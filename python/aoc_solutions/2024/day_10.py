@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Tuple
 
 import sys
 
@@ -10,108 +9,83 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.grid import Grid
 
 
 GI = GetInput()
 
-Grid = List[List[int]]
-Pos = Tuple[int, int]
+# Bordo attorno alla mappa: nessuna altezza è "bordo + 1"
+BORDER = "."
 
 
 # --- Helpers comuni -------------------------------------------------------
 
 
 def parse_grid(raw: str) -> Grid:
-    return [
-        [int(ch) for ch in line.strip()]
-        for line in raw.splitlines()
-        if line.strip()
-    ]
+    return Grid.parse(raw, pad=BORDER)
 
 
-def possible_next_steps(pos: Pos, grid: Grid) -> List[Pos]:
-    row, col = pos
-    current_height = grid[row][col]
-
-    candidates: List[Pos] = [
-        (row + 1, col),
-        (row, col + 1),
-        (row - 1, col),
-        (row, col - 1),
-    ]
-
-    max_row = len(grid) - 1
-    max_col = len(grid[0]) - 1
-
-    good: List[Pos] = []
-    for nr, nc in candidates:
-        if (
-            0 <= nr <= max_row
-            and 0 <= nc <= max_col
-            and grid[nr][nc] == current_height + 1
-        ):
-            good.append((nr, nc))
-
-    return good
+def _uphill(grid: Grid) -> list[list[int]]:
+    """
+    Per ogni cella (indice piatto) i vicini con altezza esattamente +1.
+    Il bordo evita i controlli sui limiti.
+    """
+    cells = grid.flat_list()
+    offsets = grid.offsets
+    up: list[list[int]] = [[] for _ in cells]
+    for i, h in enumerate(cells):
+        if h == ord(BORDER):
+            continue
+        up[i] = [i + off for off in offsets if cells[i + off] == h + 1]
+    return up
 
 
-def find_trailheads(grid: Grid) -> List[Pos]:
-    return [
-        (r, c)
-        for r, row in enumerate(grid)
-        for c, val in enumerate(row)
-        if val == 0
-    ]
+def _cells_by_height(grid: Grid) -> list[list[int]]:
+    """Indici piatti delle celle raggruppati per altezza 0..9."""
+    cells = grid.flat_list()
+    by_height: list[list[int]] = [[] for _ in range(10)]
+    for i, h in enumerate(cells):
+        if h != ord(BORDER):
+            by_height[h - ord("0")].append(i)
+    return by_height
 
 
-def score_trailhead(grid: Grid, start: Pos) -> int:
+def score_trailheads(grid: Grid) -> int:
     """
-    Parte 1: per un trailhead, conta il numero di picchi (celle con 9)
-    distinti raggiungibili.
+    Parte 1: per ogni trailhead, numero di picchi (celle con 9) distinti
+    raggiungibili. Programmazione dinamica dall'alto: peaks[i] è l'insieme
+    dei picchi raggiungibili da i (le altezze salgono sempre, niente cicli).
     """
-    stack: List[Pos] = [start]
-    visited: set[Pos] = set()
-    peaks: set[Pos] = set()
+    up = _uphill(grid)
+    by_height = _cells_by_height(grid)
+    peaks: dict[int, frozenset[int]] = {i: frozenset((i,)) for i in by_height[9]}
 
-    while stack:
-        r, c = stack.pop()
-        if (r, c) in visited:
-            continue
-        visited.add((r, c))
+    for h in range(8, -1, -1):
+        for i in by_height[h]:
+            reach: set[int] = set()
+            for j in up[i]:
+                reach |= peaks[j]
+            peaks[i] = frozenset(reach)
 
-        if grid[r][c] == 9:
-            peaks.add((r, c))
-            continue
-
-        for nxt in possible_next_steps((r, c), grid):
-            if nxt not in visited:
-                stack.append(nxt)
+    return sum(len(peaks[i]) for i in by_height[0])
 
-    return len(peaks)
 
-
-def rating_trailhead(grid: Grid, start: Pos) -> int:
+def rating_trailheads(grid: Grid) -> int:
     """
-    Parte 2: per un trailhead, conta il numero di percorsi distinti
-    che portano a un picco (cella con 9).
-
-    Non usiamo visited perché i valori aumentano da 0 a 9:
-    non ci sono cicli (cammino sempre strettamente crescente).
+    Parte 2: per ogni trailhead, numero di percorsi distinti che portano
+    a un picco: paths[i] = somma dei paths dei vicini a quota +1.
     """
-    stack: List[Pos] = [start]
-    rating = 0
-
-    while stack:
-        r, c = stack.pop()
-
-        if grid[r][c] == 9:
-            rating += 1
-            continue
+    up = _uphill(grid)
+    by_height = _cells_by_height(grid)
+    paths = [0] * grid.size
+    for i in by_height[9]:
+        paths[i] = 1
 
-        for nxt in possible_next_steps((r, c), grid):
-            stack.append(nxt)
+    for h in range(8, -1, -1):
+        for i in by_height[h]:
+            paths[i] = sum(paths[j] for j in up[i])
 
-    return rating
+    return sum(paths[i] for i in by_height[0])
 
 
 # --- Soluzioni richieste dal template -------------------------------------
@@ -119,16 +93,12 @@ def rating_trailhead(grid: Grid, start: Pos) -> int:
 
 def solve_1(test_string: str | None = None) -> int:
     inputs_1 = GI.input if test_string is None else test_string
-    grid = parse_grid(inputs_1)
-    trailheads = find_trailheads(grid)
-    return sum(score_trailhead(grid, th) for th in trailheads)
+    return score_trailheads(parse_grid(inputs_1))
 
 
 def solve_2(test_string: str | None = None) -> int:
     inputs_1 = GI.input if test_string is None else test_string
-    grid = parse_grid(inputs_1)
-    trailheads = find_trailheads(grid)
-    return sum(rating_trailhead(grid, th) for th in trailheads)
+    return rating_trailheads(parse_grid(inputs_1))
 
 
 if __name__ == "__main__":
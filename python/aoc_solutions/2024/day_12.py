@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, List, Set, Tuple
-
 import sys
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
@@ -10,139 +8,73 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.grid import DIRS4, Grid, shift
+from aoclib.lazy import lazy_import
 
+np = lazy_import("numpy")
 
-GI = GetInput()
 
-Grid = List[str]
-Pos = Tuple[int, int]
-Region = Set[Pos]
+GI = GetInput()
 
-# Direzioni ortogonali
-DIRS: Tuple[Pos, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+# Angoli di una cella: coppie di direzioni ortogonali adiacenti (N-E, E-S, S-W, W-N)
+CORNERS = tuple(zip(DIRS4, DIRS4[1:] + DIRS4[:1]))
 
 
 # --- Helpers di base ------------------------------------------------------
 
 
-def parse_grid(raw: str) -> Grid:
-    return [line.rstrip("\n") for line in raw.splitlines() if line.strip()]
-
-
-def in_bounds(r: int, c: int, rows: int, cols: int) -> bool:
-    return 0 <= r < rows and 0 <= c < cols
-
-
-def neighbors(grid: Grid, r: int, c: int) -> Iterable[Pos]:
-    rows, cols = len(grid), len(grid[0])
-    for dr, dc in DIRS:
-        nr, nc = r + dr, c + dc
-        if in_bounds(nr, nc, rows, cols):
-            yield nr, nc
-
-
-def find_regions(grid: Grid) -> List[Region]:
+def parse_regions(raw: str) -> tuple[np.ndarray, int]:
     """
-    Trova tutte le regioni connesse di stesso carattere.
-    Ogni regione è un set di posizioni (r, c).
+    Etichetta le regioni connesse di stesso carattere.
+    Ritorna (labels, n): labels[r, c] è l'id (0..n-1) della regione di (r, c).
     """
-    rows, cols = len(grid), len(grid[0])
-    visited: Region = set()
-    regions: List[Region] = []
+    return Grid.parse(raw).label_regions()
 
-    for r in range(rows):
-        for c in range(cols):
-            if (r, c) in visited:
-                continue
 
-            char = grid[r][c]
-            region: Region = set()
-            stack: List[Pos] = [(r, c)]
-            visited.add((r, c))
+def _same(labels: np.ndarray, dr: int, dc: int) -> np.ndarray:
+    """True dove il vicino in direzione (dr, dc) è nella stessa regione."""
+    return shift(labels, dr, dc, fill=-1) == labels
 
-            while stack:
-                cr, cc = stack.pop()
-                region.add((cr, cc))
 
-                for nr, nc in neighbors(grid, cr, cc):
-                    if (nr, nc) in visited:
-                        continue
-                    if grid[nr][nc] != char:
-                        continue
-                    visited.add((nr, nc))
-                    stack.append((nr, nc))
+def _per_region(labels: np.ndarray, n: int, counts: np.ndarray) -> np.ndarray:
+    """Somma `counts` (un valore per cella) per ogni regione."""
+    return np.bincount(labels.ravel(), weights=counts.ravel(), minlength=n).astype(np.int64)
 
-            regions.append(region)
 
-    return regions
+def areas_of(labels: np.ndarray, n: int) -> np.ndarray:
+    return np.bincount(labels.ravel(), minlength=n)
 
 
 # --- Parte 1: perimetro (fences) -----------------------------------------
 
 
-def perimeter_of(region: Region) -> int:
+def perimeters_of(labels: np.ndarray, n: int) -> np.ndarray:
     """
-    Perimetro di una regione:
+    Perimetro di ogni regione:
     per ogni cella, contiamo i lati che non toccano un'altra cella della regione.
     """
-    perim = 0
-    for r, c in region:
-        for dr, dc in DIRS:
-            if (r + dr, c + dc) not in region:
-                perim += 1
-    return perim
+    fences = sum((~_same(labels, dr, dc)).astype(np.int64) for dr, dc in DIRS4)
+    return _per_region(labels, n, fences)
 
 
 # --- Parte 2: numero di "sides" (lati) -----------------------------------
 
 
-def count_sides_of(region: Region) -> int:
+def sides_of(labels: np.ndarray, n: int) -> np.ndarray:
     """
-    Calcola il numero di lati (sides) di una regione, come da testo del puzzle.
-
-    È la tua stessa funzione, adattata a lavorare direttamente su set[(r, c)].
+    Numero di lati (sides) di ogni regione, come da testo del puzzle:
+    in un poligono i lati sono tanti quanti gli angoli. Per ogni cella e
+    per ogni coppia di direzioni ortogonali (es. N ed E) c'è un angolo se:
+      - convesso: nessuno dei due vicini è nella regione;
+      - concavo: entrambi lo sono, ma non la cella in diagonale.
     """
-    reg = region
-
-    left: set[Pos] = set()
-    right: set[Pos] = set()
-    up: set[Pos] = set()
-    down: set[Pos] = set()
-
-    for (r, c) in reg:
-        if (r - 1, c) not in reg:
-            up.add((r, c))
-        if (r + 1, c) not in reg:
-            down.add((r, c))
-        if (r, c + 1) not in reg:
-            right.add((r, c))
-        if (r, c - 1) not in reg:
-            left.add((r, c))
-
-    corners = 0
-    # upper corners
-    for (r, c) in up:
-        if (r, c) in left:
-            corners += 1
-        if (r, c) in right:
-            corners += 1
-        if (r - 1, c - 1) in right and (r, c) not in left:
-            corners += 1
-        if (r - 1, c + 1) in left and (r, c) not in right:
-            corners += 1
-
-    # lower corners
-    for (r, c) in down:
-        if (r, c) in left:
-            corners += 1
-        if (r, c) in right:
-            corners += 1
-        if (r + 1, c - 1) in right and (r, c) not in left:
-            corners += 1
-        if (r + 1, c + 1) in left and (r, c) not in right:
-            corners += 1
-
-    return corners
+    same = {d: _same(labels, *d) for d in DIRS4}
+    corners = np.zeros(labels.shape, dtype=np.int64)
+    for a, b in CORNERS:
+        diagonal = _same(labels, a[0] + b[0], a[1] + b[1])
+        corners += ~same[a] & ~same[b]
+        corners += same[a] & same[b] & ~diagonal
+    return _per_region(labels, n, corners)
 
 
 # --- Soluzioni richieste dal template ------------------------------------
@@ -153,17 +85,8 @@ def solve_1(test_string: str | None = None) -> int:
     Prezzo = area * perimetro per ogni regione, somma totale.
     """
     inputs_1 = GI.input if test_string is None else test_string
-    grid = parse_grid(inputs_1)
-
-    regions = find_regions(grid)
-
-    total = 0
-    for region in regions:
-        area = len(region)
-        perim = perimeter_of(region)
-        total += area * perim
-
-    return total
+    labels, n = parse_regions(inputs_1)
+    return int((areas_of(labels, n) * perimeters_of(labels, n)).sum())
 
 
 def solve_2(test_string: str | None = None) -> int:
@@ -171,17 +94,8 @@ def solve_2(test_string: str | None = None) -> int:
     Prezzo = area * numero di lati (sides) per ogni regione, somma totale.
     """
     inputs_1 = GI.input if test_string is None else test_string
-    grid = parse_grid(inputs_1)
-
-    regions = find_regions(grid)
-
-    total = 0
-    for region in regions:
-        area = len(region)
-        sides = count_sides_of(region)
-        total += area * sides
-
-    return total
+    labels, n = parse_regions(inputs_1)
+    return int((areas_of(labels, n) * sides_of(labels, n)).sum())
 
 
 if __name__ == "__main__":
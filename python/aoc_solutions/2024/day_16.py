@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import List, Set, Tuple
 
 import heapq
 import sys
@@ -11,22 +11,19 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.grid import Grid
+from aoclib.state import StateLayout
 
 
 GI = GetInput()
 
 Pos = Tuple[int, int]  # (row, col)
-Dir = Tuple[int, int]  # (dr, dc)
-State = Tuple[Pos, Dir]
-GridMap = Dict[Pos, str]
-
-DIRS: Tuple[Dir, ...] = (
-    (1, 0),   # down
-    (0, 1),   # right
-    (-1, 0),  # up
-    (0, -1),  # left
-)
+# Stato = (direzione, indice_piatto) impacchettato in un int: pos << 2 | dir,
+# direzioni come Grid.offsets (N, E, S, W)
+State = int
 
+EAST = 1
+TURN_COST = 1000
 INF = 10**18
 
 
@@ -34,26 +31,15 @@ INF = 10**18
 # Parsing
 # ---------------------------------------------------------------------------
 
-def parse_grid(raw: str) -> Tuple[GridMap, Pos, Pos]:
+def parse_grid(raw: str) -> Tuple[Grid, Pos, Pos]:
     """
-    Parla la griglia in un dict {(row, col): char}, e trova S ed E.
+    Parsa la griglia in una Grid (il labirinto è già chiuso da '#'), e trova S ed E.
     """
-    lines = raw.splitlines()
-    grid: GridMap = {}
-    start: Pos | None = None
-    end: Pos | None = None
-
-    for r, line in enumerate(lines):
-        for c, ch in enumerate(line):
-            grid[(r, c)] = ch
-            if ch == "S":
-                start = (r, c)
-            elif ch == "E":
-                end = (r, c)
-
-    if start is None or end is None:
-        raise ValueError("Start 'S' o End 'E' non trovati nella griglia.")
-
+    grid = Grid.parse(raw)
+    try:
+        start, end = grid.find("S"), grid.find("E")
+    except ValueError:
+        raise ValueError("Start 'S' o End 'E' non trovati nella griglia.") from None
     return grid, start, end
 
 
@@ -61,7 +47,7 @@ def parse_grid(raw: str) -> Tuple[GridMap, Pos, Pos]:
 # Dijkstra + ricostruzione dei percorsi minimi
 # ---------------------------------------------------------------------------
 
-def dijkstra_all_best_paths(grid: GridMap, start: Pos, end: Pos) -> Tuple[int, Set[Pos]]:
+def dijkstra_all_best_paths(grid: Grid, start: Pos, end: Pos) -> Tuple[int, Set[Pos]]:
     """
     Esegue Dijkstra sugli stati (posizione, direzione):
 
@@ -73,77 +59,70 @@ def dijkstra_all_best_paths(grid: GridMap, start: Pos, end: Pos) -> Tuple[int, S
       - best_tiles: insieme di tutte le posizioni (row, col) che appartengono
         ad almeno un percorso di costo minimo.
     """
-    # direzione iniziale: verso destra (0, 1) come nell'originale
-    start_dir: Dir = (0, 1)
-    start_state: State = (start, start_dir)
+    walls = grid.mask("#").ravel().tolist()
+    offsets = grid.offsets
 
-    dist: Dict[State, int] = {start_state: 0}
-    parents: Dict[State, Set[State]] = {}
+    layout = StateLayout(dir=3, pos=grid.size - 1)
+    pos_shift = layout.shift("pos")
+
+    # direzione iniziale: verso destra (est) come nell'originale
+    start_state: State = layout.pack(EAST, grid.index(*start))
+    dist = layout.table(INF)
+    dist[start_state] = 0
 
     heap: List[Tuple[int, State]] = [(0, start_state)]
 
     while heap:
         score, state = heapq.heappop(heap)
-        pos, face = state
 
         # entry obsoleta?
-        if score != dist.get(state, INF):
+        if score != dist[state]:
             continue
 
-        # esplora vicini
-        for d in DIRS:
-            nr, nc = pos[0] + d[0], pos[1] + d[1]
-            npos: Pos = (nr, nc)
+        pos, face = state >> pos_shift, state & 3
 
-            if grid.get(npos, "#") == "#":
+        # esplora vicini
+        for d, off in enumerate(offsets):
+            npos = pos + off
+            if walls[npos]:
                 continue
 
-            step_cost = 1 if d == face else 1001
-            new_score = score + step_cost
-            nstate: State = (npos, d)
-
-            old_dist = dist.get(nstate, INF)
-            if new_score < old_dist:
+            new_score = score + (1 if d == face else TURN_COST + 1)
+            nstate = (npos << pos_shift) | d
+            if new_score < dist[nstate]:
                 dist[nstate] = new_score
-                parents[nstate] = {state}
                 heapq.heappush(heap, (new_score, nstate))
-            elif new_score == old_dist:
-                # nuovo padre per un percorso alternativo, stesso costo minimo
-                parents.setdefault(nstate, set()).add(state)
 
     # Troviamo tutti gli stati di arrivo in end con costo minimo
-    goal_states: List[State] = []
-    best_cost = INF
-    for st, sc in dist.items():
-        pos, _ = st
-        if pos == end:
-            if sc < best_cost:
-                best_cost = sc
-                goal_states = [st]
-            elif sc == best_cost:
-                goal_states.append(st)
-
-    if best_cost == INF or not goal_states:
+    end_index = grid.index(*end)
+    goal_states = [layout.pack(d, end_index) for d in range(4)]
+    best_cost = min(dist[st] for st in goal_states)
+    if best_cost == INF:
         raise ValueError("Nessun percorso dalla S alla E.")
+    goal_states = [st for st in goal_states if dist[st] == best_cost]
 
-    # Risaliamo tutti i percorsi minimi all'indietro per ottenere le piastrelle
-    best_tiles: Set[Pos] = set()
+    # Risaliamo tutti i percorsi minimi all'indietro: un padre di (p, d) è
+    # uno stato (p - offset[d], d') tale che dist[padre] + costo == dist[(p, d)]
+    best_tiles: Set[int] = set()
     stack: List[State] = list(goal_states)
-    seen_states: Set[State] = set()
+    seen_states = layout.visited()
+    for st in goal_states:
+        seen_states[st] = 1
 
     while stack:
         st = stack.pop()
-        if st in seen_states:
-            continue
-        seen_states.add(st)
-
-        pos, _ = st
+        pos, face = st >> pos_shift, st & 3
         best_tiles.add(pos)
 
-        for parent in parents.get(st, []):
-            stack.append(parent)
+        prev = pos - offsets[face]
+        for d in range(4):
+            parent = (prev << pos_shift) | d
+            cost = 1 if d == face else TURN_COST + 1
+            if dist[parent] + cost == dist[st] and not seen_states[parent]:
+                seen_states[parent] = 1
+                stack.append(parent)
 
-    return best_cost, best_tiles
+    return best_cost, {grid.pos(i) for i in best_tiles}
 
 
 # ---------------------------------------------------------------------------
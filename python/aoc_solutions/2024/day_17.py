@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
 
 import sys
+import time
 
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
@@ -54,12 +56,20 @@ def parse_input(raw: str) -> tuple[Registers, Program]:
 
 
 # ---------------------------------------------------------------------------
-# VM / interpreter
+# VM: interprete di riferimento e versione compilata
 # ---------------------------------------------------------------------------
 
-def run_program(program: Program, regs: Registers, max_outputs: int | None = None) -> List[int]:
+ADV, BXL, BST, JNZ, BXC, OUT, BDV, CDV = range(8)
+
+# combo operand -> espressione Python (7 è "reserved")
+COMBO_SRC = ("0", "1", "2", "3", "A", "B", "C")
+
+CompiledProgram = Callable[[int, int, int, int], List[int]]
+
+
+def interpret_program(program: Program, regs: Registers, max_outputs: int | None = None) -> List[int]:
     """
-    Esegue il program con i registri dati, secondo le regole del day 17.
+    Interprete istruzione per istruzione (riferimento per il benchmark).
 
     Se max_outputs è valorizzato, si ferma appena produce più di max_outputs
     valori di output (utile per pruning nella parte 2).
@@ -87,32 +97,32 @@ def run_program(program: Program, regs: Registers, max_outputs: int | None = Non
         opcode = program[ip]
         operand = program[ip + 1] if ip + 1 < len(program) else 0
 
-        if opcode == 0:  # ADV
+        if opcode == ADV:
             R["A"] = R["A"] // (2 ** get_operand(operand))
             ip += 2
-        elif opcode == 1:  # BXL
+        elif opcode == BXL:
             R["B"] = R["B"] ^ operand
             ip += 2
-        elif opcode == 2:  # BST
+        elif opcode == BST:
             R["B"] = get_operand(operand) % 8
             ip += 2
-        elif opcode == 3:  # JNZ
+        elif opcode == JNZ:
             if R["A"] != 0:
                 ip = operand
             else:
                 ip += 2
-        elif opcode == 4:  # BCX
+        elif opcode == BXC:
             R["B"] = R["B"] ^ R["C"]
             ip += 2
-        elif opcode == 5:  # OUT
+        elif opcode == OUT:
             out.append(get_operand(operand) % 8)
             ip += 2
             if max_outputs is not None and len(out) > max_outputs:
                 break
-        elif opcode == 6:  # BDV
+        elif opcode == BDV:
             R["B"] = R["A"] // (2 ** get_operand(operand))
             ip += 2
-        elif opcode == 7:  # CDV
+        elif opcode == CDV:
             R["C"] = R["A"] // (2 ** get_operand(operand))
             ip += 2
         else:
@@ -121,6 +131,122 @@ def run_program(program: Program, regs: Registers, max_outputs: int | None = Non
     return out
 
 
+def _combo(operand: int) -> str:
+    if not 0 <= operand < len(COMBO_SRC):
+        raise ValueError(f"Combo operand non valido: {operand}")
+    return COMBO_SRC[operand]
+
+
+def _statement(opcode: int, operand: int) -> List[str]:
+    """Codice Python di un'istruzione (escluso JNZ): shift al posto di // 2 ** x."""
+    if opcode == ADV:
+        return [f"A >>= {_combo(operand)}"]
+    if opcode == BXL:
+        return [f"B ^= {operand}"]
+    if opcode == BST:
+        return [f"B = {_combo(operand)} & 7"]
+    if opcode == BXC:
+        return ["B ^= C"]
+    if opcode == OUT:
+        return [f"append({_combo(operand)} & 7)", "if len(out) > limit: return out"]
+    if opcode == BDV:
+        return [f"B = A >> {_combo(operand)}"]
+    if opcode == CDV:
+        return [f"C = A >> {_combo(operand)}"]
+    raise ValueError(f"Opcode sconosciuto: {opcode}")
+
+
+@lru_cache(maxsize=None)
+def compile_program(program: Tuple[int, ...]) -> CompiledProgram:
+    """
+    Traduce il programma una volta sola in una funzione Python
+    `(A, B, C, limit) -> output`.
+
+    Ogni blocco base (da un bersaglio di salto al JNZ successivo) diventa
+    codice lineare dentro `while True`, e `ip` cambia solo ai salti.
+    """
+    n = len(program)
+
+    def at(ip: int) -> Tuple[int, int]:
+        return program[ip], program[ip + 1] if ip + 1 < n else 0
+
+    # inizi dei blocchi: 0, i bersagli dei JNZ e le istruzioni dopo un JNZ
+    leaders = {0}
+    todo = [0]
+    while todo:
+        ip = todo.pop()
+        while 0 <= ip < n:
+            opcode, operand = at(ip)
+            if opcode == JNZ:
+                for nxt in (operand, ip + 2):
+                    if 0 <= nxt < n and nxt not in leaders:
+                        leaders.add(nxt)
+                        todo.append(nxt)
+                break
+            ip += 2
+            if ip in leaders:
+                break
+
+    lines = [
+        "def compiled(A, B, C, limit):",
+        "    out = []",
+        "    append = out.append",
+        "    ip = 0",
+        "    while True:",
+    ]
+    for k, start in enumerate(sorted(leaders)):
+        lines.append(f"        {'if' if k == 0 else 'elif'} ip == {start}:")
+        ip = start
+        body: List[str] = []
+        while True:
+            if not 0 <= ip < n:
+                body.append("return out")
+                break
+            opcode, operand = at(ip)
+            if opcode == JNZ:
+                body += [f"ip = {operand} if A else {ip + 2}", "continue"]
+                break
+            body += _statement(opcode, operand)
+            ip += 2
+            if ip in leaders:
+                body += [f"ip = {ip}", "continue"]
+                break
+        lines += [f"            {line}" for line in body]
+    lines += ["        else:", "            return out"]
+
+    namespace: Dict[str, object] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["compiled"]  # type: ignore[return-value]
+
+
+def run_program(program: Program, regs: Registers, max_outputs: int | None = None) -> List[int]:
+    """
+    Esegue il program con i registri dati, secondo le regole del day 17
+    (versione compilata, stesso risultato di `interpret_program`).
+    """
+    limit = sys.maxsize if max_outputs is None else max_outputs
+    return compile_program(tuple(program))(regs["A"], regs["B"], regs["C"], limit)
+
+
+def benchmark(program: Program, regs: Registers, seconds: float = 1.0) -> Dict[str, float]:
+    """Esecuzioni complete al secondo: interprete vs programma compilato."""
+    compiled = compile_program(tuple(program))
+    runners: Dict[str, Callable[[], object]] = {
+        "interpreter": lambda: interpret_program(program, regs),
+        "compiled": lambda: compiled(regs["A"], regs["B"], regs["C"], sys.maxsize),
+    }
+    rates: Dict[str, float] = {}
+    for name, runner in runners.items():
+        runs = 0
+        start = time.perf_counter()
+        while (elapsed := time.perf_counter() - start) < seconds:
+            for _ in range(100):
+                runner()
+            runs += 100
+        rates[name] = runs / elapsed
+    return rates
+
+
 # ---------------------------------------------------------------------------
 # Part 1
 # ---------------------------------------------------------------------------
@@ -140,9 +266,81 @@ def solve_1(test_string: str | None = None) -> str:
 # Part 2 – trova A minimo tale che out(A) == program
 # ---------------------------------------------------------------------------
 
+def single_loop_body(program: Program) -> Program | None:
+    """
+    Riconosce la forma dei programmi del day 17:
+
+        <corpo senza salti, un solo OUT, un solo ADV 3>  JNZ 0
+
+    in cui B e C sono sempre scritti prima di essere letti, quindi ogni
+    iterazione dipende solo da A. Ritorna il corpo (senza JNZ) o None.
+    """
+    if len(program) < 4 or len(program) % 2:
+        return None
+    ops = list(zip(program[0::2], program[1::2]))
+    *body, last = ops
+    if last != (JNZ, 0):
+        return None
+    if any(op == JNZ for op, _ in body) or [op for op, _ in body].count(OUT) != 1:
+        return None
+    if [(op, x) for op, x in body if op == ADV] != [(ADV, 3)]:
+        return None
+
+    written: set[str] = set()
+    for op, x in body:
+        reads: set[str] = set()
+        if op in (ADV, BST, OUT, BDV, CDV):
+            if x == 7:
+                return None
+            reads |= {COMBO_SRC[x]} & {"B", "C"}
+        if op == BXL:
+            reads.add("B")
+        if op == BXC:
+            reads |= {"B", "C"}
+        if not reads <= written:
+            return None
+        if op in (BXL, BST, BXC, BDV):
+            written.add("B")
+        elif op == CDV:
+            written.add("C")
+
+    return [v for pair in body for v in pair]
+
+
+def reverse_search(program: Program) -> int | None:
+    """
+    Ricostruisce A tre bit alla volta partendo dall'ultimo output.
+
+    Con la forma di `single_loop_body`, l'iterazione i parte da A >> 3i e
+    produce program[i] dipendendo solo da quel valore: si fissano le cifre
+    ottali dalla più alta (ultimo output) alla più bassa, eseguendo ogni volta
+    una sola iterazione del corpo. Le cifre sono provate in ordine crescente,
+    quindi il primo A trovato è il minimo. None se il programma ha un'altra forma.
+    """
+    body = single_loop_body(program)
+    if body is None:
+        return None
+    step = compile_program(tuple(body))
+
+    def dfs(prefix: int, i: int) -> int | None:
+        if i < 0:
+            return prefix
+        for digit in range(8):
+            a = prefix << 3 | digit
+            # A a inizio iterazione non può essere 0: il JNZ precedente sarebbe uscito
+            if a and step(a, 0, 0, 1) == [program[i]]:
+                res = dfs(a, i - 1)
+                if res is not None:
+                    return res
+        return None
+
+    return dfs(0, len(program) - 1)
+
+
 def find_minimum_A_self_reproducing(regs: Registers, program: Program) -> int:
     """
-    Implementa il backtracking in base 8 usato da molte soluzioni:
+    Ripiego per programmi di forma diversa: backtracking in base 8 con
+    esecuzioni complete.
 
     - Costruiamo A in base 8 dall'ultima cifra verso la prima.
     - A ogni passo fissiamo una cifra in più (moltiplicando per 8 e
@@ -153,6 +351,7 @@ def find_minimum_A_self_reproducing(regs: Registers, program: Program) -> int:
            nrem = 1            -> tutto il programma)
     - Ci fermiamo al primo A che riproduce l'intero programma.
     """
+    compiled = compile_program(tuple(program))
 
     def enumerate_candidates(prefix: int, target: List[int]) -> List[int]:
         """
@@ -160,14 +359,11 @@ def find_minimum_A_self_reproducing(regs: Registers, program: Program) -> int:
         e ritorna quelli per cui run_program(A) == target.
         """
         base = prefix * 8
-        candidates: List[int] = []
-        for a in range(base, base + 8):
-            local_regs = dict(regs)
-            local_regs["A"] = a
-            out = run_program(program, local_regs)
-            if out == target:
-                candidates.append(a)
-        return candidates
+        limit = len(target)
+        return [
+            a for a in range(base, base + 8)
+            if compiled(a, regs["B"], regs["C"], limit) == target
+        ]
 
     sys.setrecursionlimit(10_000)
 
@@ -194,7 +390,10 @@ def find_minimum_A_self_reproducing(regs: Registers, program: Program) -> int:
 def solve_2(test_string: str | None = None) -> int:
     raw = GI.input if test_string is None else test_string
     regs, program = parse_input(raw)
-    return find_minimum_A_self_reproducing(regs, program)
+    result = reverse_search(program)
+    if result is None:
+        result = find_minimum_A_self_reproducing(regs, program)
+    return result
 
 
 if __name__ == "__main__":
@@ -207,3 +406,8 @@ Program: 0,1,5,4,3,0
     print(f"Part 1 (test): {solve_1(test)}")
     print(f"Part 1 (input): {solve_1()}")
     print(f"Part 2 (input): {solve_2()}")
+
+    if "--bench" in sys.argv:
+        regs, program = parse_input(GI.input)
+        for name, rate in benchmark(program, regs).items():
+            print(f"{name:>12}: {rate:,.0f} esecuzioni/s")
@@ -1,18 +1,16 @@
 from __future__ import annotations
 
-from collections import deque
 from pathlib import Path
 from typing import List, Tuple
 
 import sys
 
-import numpy as np
-
 PYTHON_DIR = Path(__file__).resolve().parents[2]
 if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.grid import Grid
 
 
 GI = GetInput()
@@ -24,67 +22,46 @@ Pos = Tuple[int, int]  # (x, y) = (col, row)
 # Helpers comuni
 # ---------------------------------------------------------------------------
 
-def in_boundaries(p: Pos, size: int) -> bool:
-    x, y = p
-    return 0 <= x < size and 0 <= y < size
+def parse_bytes(raw: str) -> List[Pos]:
+    """Coordinate (x, y) dei byte, nell'ordine in cui cadono."""
+    points: List[Pos] = []
+    for line in raw.splitlines():
+        if line.strip():
+            x_str, y_str = line.split(",")
+            points.append((int(x_str), int(y_str)))
+    return points
 
 
-def build_grid(raw: str, size: int, corrupted_count: int) -> np.ndarray:
+def build_grid(points: List[Pos], size: int, corrupted_count: int) -> Grid:
     """
     Costruisce una griglia `size x size` con:
-    - 0 = cella libera
-    - 1 = byte corrotto (ostacolo)
+    - '.' = cella libera
+    - '#' = byte corrotto (ostacolo)
     usando i primi `corrupted_count` byte dell'input.
     """
-    grid = np.zeros((size, size), dtype=np.uint8)
-    lines = [ln for ln in raw.splitlines() if ln.strip()]
-
-    for line in lines[:corrupted_count]:
-        x_str, y_str = line.split(",")
-        x = int(x_str)
-        y = int(y_str)
-        grid[y, x] = 1
-
+    grid = Grid.blank(size, size)
+    if corrupted_count > 0:
+        xs, ys = zip(*points[:corrupted_count])
+        grid.cells[list(ys), list(xs)] = ord("#")
     return grid
 
 
-def navigate_grid(grid: np.ndarray, start: Pos, end: Pos) -> int:
+def navigate_grid(grid: Grid, start: Pos, end: Pos) -> int:
     """
-    BFS su griglia NumPy.
+    BFS sulla griglia (campo delle distanze da start).
     Restituisce il numero di passi del percorso minimo, oppure -1 se non esiste.
     """
-    size = grid.shape[0]
     sx, sy = start
     ex, ey = end
 
-    if grid[sy, sx] == 1 or grid[ey, ex] == 1:
+    if grid[sy, sx] == "#" or grid[ey, ex] == "#":
         return -1
 
-    q: deque[Tuple[Pos, int]] = deque()
-    q.append(((sx, sy), 0))
-    visited: set[Pos] = {(sx, sy)}
-
-    while q:
-        (x, y), steps = q.popleft()
-
-        if (x, y) == (ex, ey):
-            return steps
-
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx, ny = x + dx, y + dy
-            if (
-                in_boundaries((nx, ny), size)
-                and grid[ny, nx] == 0
-                and (nx, ny) not in visited
-            ):
-                visited.add((nx, ny))
-                q.append(((nx, ny), steps + 1))
-
-    return -1
+    return int(grid.distances((sy, sx))[ey, ex])
 
 
-def shortest_path_after_n_bytes(raw: str, size: int, corrupted_count: int) -> int:
-    grid = build_grid(raw, size, corrupted_count)
+def shortest_path_after_n_bytes(points: List[Pos], size: int, corrupted_count: int) -> int:
+    grid = build_grid(points, size, corrupted_count)
     start: Pos = (0, 0)
     end: Pos = (size - 1, size - 1)
     return navigate_grid(grid, start, end)
@@ -109,7 +86,7 @@ def solve_1(test_string: str | None = None, corrupted_bytes: int | None = None)
     if corrupted_bytes is None:
         corrupted_bytes = 12 if is_test else 1024
 
-    return shortest_path_after_n_bytes(raw, size, corrupted_bytes)
+    return shortest_path_after_n_bytes(parse_bytes(raw), size, corrupted_bytes)
 
 
 # ---------------------------------------------------------------------------
@@ -127,6 +104,7 @@ def solve_2(test_string: str | None = None) -> str:
     size = 7 if is_test else 71
 
     lines = [ln for ln in raw.splitlines() if ln.strip()]
+    points = parse_bytes(raw)
     total_bytes = len(lines)
 
     min_corrupted = 12 if is_test else 1024
@@ -137,7 +115,7 @@ def solve_2(test_string: str | None = None) -> str:
 
     while lo <= hi:
         mid = (lo + hi) // 2
-        dist = shortest_path_after_n_bytes(raw, size, mid)
+        dist = shortest_path_after_n_bytes(points, size, mid)
         if dist == -1:
             # già bloccato con mid byte -> prova a vedere se si blocca prima
             ans = mid
@@ -83,18 +83,22 @@ def count_patterns(raw: str) -> Tuple[int, int]:
 
 
 # ---------------------------------------------------------------------------
-# Solve 1 & 2
+# Solve 1 & 2 (solve_both: una sola passata per le due parti)
 # ---------------------------------------------------------------------------
 
-def solve_1(test_string: str | None = None) -> int:
+def solve_both(test_string: str | None = None) -> Tuple[int, int]:
+    """Entrambe le parti con un solo conteggio (usato dal runner)."""
     raw = GI.input if test_string is None else test_string
-    part1, _ = count_patterns(raw)
+    return count_patterns(raw)
+
+
+def solve_1(test_string: str | None = None) -> int:
+    part1, _ = solve_both(test_string)
     return part1
 
 
 def solve_2(test_string: str | None = None) -> int:
-    raw = GI.input if test_string is None else test_string
-    _, part2 = count_patterns(raw)
+    _, part2 = solve_both(test_string)
     return part2
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import random
 from pathlib import Path
 from typing import Dict, List
 
@@ -11,6 +11,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput  # type: ignore[import-untyped]
+from aoclib.circuit import Circuit, pack_words
 
 
 GI = GetInput()
@@ -20,43 +21,14 @@ GI = GetInput()
 # Modello del circuito
 # ---------------------------------------------------------------------------
 
-@dataclass
-class Instruction:
-    one: str
-    two: str
-    operand: str
-    dest: str
-
-    def try_eval(self, gates: Dict[str, int]) -> int | None:
-        """
-        Prova a calcolare il valore del gate:
-        - se gli ingressi non sono ancora noti, torna None
-        - altrimenti ritorna il valore (0 o 1)
-        """
-        if self.one not in gates or self.two not in gates:
-            return None
-
-        a = gates[self.one]
-        b = gates[self.two]
-
-        if self.operand == "AND":
-            return a & b
-        if self.operand == "OR":
-            return a | b
-        if self.operand == "XOR":
-            return a ^ b
-
-        raise ValueError(f"Operatore sconosciuto: {self.operand}")
-
-
-def parse_circuit(raw: str) -> tuple[Dict[str, int], List[Instruction]]:
+def parse_circuit(raw: str) -> tuple[Dict[str, int], Circuit]:
     """
     Parsea l'input in:
       - gates: mappa wire -> valore iniziale (x**, y**, ecc.)
-      - instructions: lista di Instruction che definiscono nuovi wire
+      - circuit: i gate che definiscono gli altri wire (aoclib.circuit)
     """
     gates: Dict[str, int] = {}
-    instructions: List[Instruction] = []
+    gate_lines: List[str] = []
 
     for line in raw.splitlines():
         line = line.strip()
@@ -69,45 +41,9 @@ def parse_circuit(raw: str) -> tuple[Dict[str, int], List[Instruction]]:
             gates[gate] = int(value_str)
         elif "->" in line:
             # Riga tipo: "ntg XOR fgs -> mjb"
-            left, dest = line.split(" -> ")
-            one, operand, two = left.split(" ")
-            instructions.append(Instruction(one=one, two=two, operand=operand, dest=dest))
-
-    return gates, instructions
-
-
-def evaluate_all_gates(
-    gates: Dict[str, int],
-    instructions: List[Instruction],
-) -> Dict[str, int]:
-    """
-    Risolve tutte le istruzioni finché possibile, propagando i valori.
-
-    Il circuito è combinazionale, quindi non dovrebbero esserci cicli.
-    Se rimangono istruzioni impossibili da risolvere, solleva un errore.
-    """
-    remaining = instructions[:]
+            gate_lines.append(line)
 
-    while remaining:
-        next_round: List[Instruction] = []
-        progress = False
-
-        for instr in remaining:
-            res = instr.try_eval(gates)
-            if res is None:
-                next_round.append(instr)
-            else:
-                gates[instr.dest] = res
-                progress = True
-
-        if not progress:
-            # Non si è riusciti a risolvere nessuna nuova istruzione:
-            # probabile ciclo o ingresso mancante.
-            raise RuntimeError("Impossibile risolvere alcune istruzioni (ciclo o input mancanti).")
-
-        remaining = next_round
-
-    return gates
+    return gates, Circuit.parse(gate_lines)
 
 
 # ---------------------------------------------------------------------------
@@ -121,22 +57,31 @@ def solve_1(test_string: str | None = None) -> int:
     """
     raw = GI.input if test_string is None else test_string
 
-    gates, instructions = parse_circuit(raw)
-    evaluate_all_gates(gates, instructions)
+    gates, circuit = parse_circuit(raw)
+    # un solo passaggio in ordine topologico
+    return circuit.evaluate(gates).word("z")
 
-    # Raccogliamo tutti i wire che iniziano per 'z'
-    z_wires = sorted(name for name in gates.keys() if name.startswith("z"))
 
-    # Nel tuo codice originale:
-    #   res = ""
-    #   for z in sorted(z_wires):
-    #       res = str(gates[z]) + res
-    # cioè costruivi la stringa dai bit z00, z01, ... prependendo → MSB..LSB
-    # equivalente a iterare z_wires al contrario e fare append.
-    bits = "".join(str(gates[z]) for z in reversed(z_wires))
-    value = int(bits, 2)
+# ---------------------------------------------------------------------------
+# Part 2 – Bit sospetti (test dell'addizionatore, bit-parallel)
+# ---------------------------------------------------------------------------
 
-    return value
+def suspect_bits(circuit: Circuit, lanes: int = 256, seed: int = 0) -> List[str]:
+    """
+    Il circuito dovrebbe calcolare z = x + y: lo si prova su `lanes` coppie
+    casuali in una sola valutazione (un bit di ogni intero per coppia) e si
+    ritornano i wire z** sbagliati in almeno una. Un aiuto per leggere il .dot.
+    """
+    bits = sum(1 for name in circuit.inputs if name.startswith("x"))
+    rng = random.Random(seed)
+    xs = [rng.getrandbits(bits) for _ in range(lanes)]
+    ys = [rng.getrandbits(bits) for _ in range(lanes)]
+
+    inputs = pack_words("x", xs, bits) | pack_words("y", ys, bits)
+    values = circuit.evaluate_lanes(inputs, lanes)
+
+    expected = pack_words("z", [x + y for x, y in zip(xs, ys)], bits + 1)
+    return [z for z in values.bus("z") if values[z] != expected.get(z, 0)]
 
 
 # ---------------------------------------------------------------------------
@@ -286,6 +231,9 @@ tnw OR pbm -> gnj"""
     print("Test Part 1:", solve_1(test1))
     print("Part 1 (input reale):", solve_1())
 
+    _gates, real_circuit = parse_circuit(GI.input)
+    print("Bit z sospetti:", ", ".join(suspect_bits(real_circuit)) or "nessuno")
+
     dot_file = solve_2(test2)
     print("DOT di test scritto in:", dot_file)
     print("DOT input reale scritto in:", solve_2())
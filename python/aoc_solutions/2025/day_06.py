@@ -11,7 +11,9 @@ from get_input import GetInput
 from dataclasses import dataclass, field
 
 from math import prod
-import numpy as np
+from aoclib.lazy import lazy_import
+
+np = lazy_import("numpy")
 
 GI = GetInput()
 
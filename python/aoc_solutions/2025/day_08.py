@@ -8,6 +8,7 @@ if str(PYTHON_DIR) not in sys.path:
     sys.path.append(str(PYTHON_DIR))
 
 from get_input import GetInput
+from input_cache import cached_parse
 
 from typing import TypeAlias, Callable
 from dataclasses import dataclass
@@ -120,25 +121,22 @@ class Circuits:
         return self._dsu.component_sizes()
 
 
-def solve_1(test_string: str | None = None) -> int:
-    # Numero di coppie da considerare:
-    # - 10 per l'esempio (come nel testo)
-    # - 1000 per l'input reale del puzzle
-    if test_string is None:
-        inputs_1 = GI.input
-        couples = 1000
-    else:
-        inputs_1 = test_string
-        couples = 10
-
-    # Parsing delle coordinate
+def _parse_juncboxes(raw: str) -> list[JuncBox]:
     juncboxes: list[JuncBox] = []
-    for line in inputs_1.strip().splitlines():
+    for line in raw.strip().splitlines():
         x_str, y_str, z_str = line.split(",")
         x, y, z = int(x_str), int(y_str), int(z_str)
         juncboxes.append((x, y, z))
+    return juncboxes
 
-    # Calcolo di tutte le distanze tra coppie (non orientate, una sola volta)
+
+@cached_parse("2025-08-distances", version="1")
+def _sorted_distances(raw: str) -> list[tuple[float, JuncBox, JuncBox]]:
+    """
+    Tutte le distanze tra coppie (non orientate, una sola volta), ordinate
+    per distanza crescente. È il passo O(n^2) condiviso dalle due parti.
+    """
+    juncboxes = _parse_juncboxes(raw)
     distances: list[tuple[float, JuncBox, JuncBox]] = []
     juc_quantity = len(juncboxes)
 
@@ -148,8 +146,23 @@ def solve_1(test_string: str | None = None) -> int:
             node2 = juncboxes[k]
             distances.append((distance(node1, node2), node1, node2))
 
-    # Ordiniamo per distanza crescente
     distances.sort(key=lambda a: a[0])
+    return distances
+
+
+def solve_1(test_string: str | None = None) -> int:
+    # Numero di coppie da considerare:
+    # - 10 per l'esempio (come nel testo)
+    # - 1000 per l'input reale del puzzle
+    if test_string is None:
+        inputs_1 = GI.input
+        couples = 1000
+    else:
+        inputs_1 = test_string
+        couples = 10
+
+    juncboxes = _parse_juncboxes(inputs_1)
+    distances = _sorted_distances(inputs_1)
 
     # Prendiamo solo le prime `couples` coppie.
     couples = min(couples, len(distances))
@@ -180,29 +193,16 @@ def solve_2(test_string: str | None = None)  -> int:
     else:
         inputs_1 = test_string
 
-    juncboxes: list[JuncBox] = []
-    for line in inputs_1.strip().splitlines():
-        x_str, y_str, z_str = line.split(",")
-        x, y, z = int(x_str), int(y_str), int(z_str)
-        juncboxes.append((x, y, z))
-
-    distances: list[tuple[float, JuncBox, JuncBox]] = []
-    juc_quantity = len(juncboxes)
-
-    for j in range(juc_quantity):
-        node1 = juncboxes[j]
-        for k in range(j + 1, juc_quantity):
-            node2 = juncboxes[k]
-            distances.append((distance(node1, node2), node1, node2))
-
-    distances.sort(key=lambda a: a[0])
+    juncboxes = _parse_juncboxes(inputs_1)
+    # La lista in cache è condivisa: la scorro senza modificarla
+    distances = iter(_sorted_distances(inputs_1))
     connections: list[Connection] = list()
-    sizes: int = len(distances)
-    d = distances[0]
+    sizes: int = len(juncboxes)
+    d: tuple[float, JuncBox, JuncBox] | None = None
 
     # Prendiamo solo le prime `couples` coppie.
     while sizes != 1:
-        d = distances.pop(0)
+        d = next(distances)
         connections.append(Connection(node1=d[1], node2=d[2]))
 
         circuits = Circuits(juncboxes)
@@ -211,6 +211,7 @@ def solve_2(test_string: str | None = None)  -> int:
 
         sizes = len(circuits.component_sizes())
 
+    assert d is not None
     return d[1][0] * d[2][0]
 
 
@@ -13,8 +13,10 @@ from typing import TypeAlias, cast
 from itertools import combinations
 from functools import reduce
 import operator
-import numpy as np
-import pulp
+from aoclib.lazy import lazy_import
+
+# pulp (e il solver CBC) serve solo alla parte 2
+pulp = lazy_import("pulp")
 
 GI = GetInput()
 
@@ -16,19 +16,11 @@ if str(PYTHON_DIR) not in sys.path:
 from get_input import GetInput
 
 
-# -----------------------------
-# Lazy input loading (worker-safe)
-# -----------------------------
-GI: GetInput | None = None
+GI = GetInput()
 
 
 def load_input(test_string: str | None) -> str:
-    if test_string is not None:
-        return test_string
-    global GI
-    if GI is None:
-        GI = GetInput()
-    return GI.input
+    return GI.input if test_string is None else test_string
 
 
 # -----------------------------
@@ -0,0 +1,7 @@
+"""
+Shared helpers for the Python solutions (python/aoc_solutions/).
+
+Solutions already put python/ on sys.path, so they can simply do:
+
+    from aoclib.lazy import lazy_import
+"""
@@ -0,0 +1,250 @@
+"""
+Assembunny (AoC 2016 days 12, 23, 25): decoder, loop-idiom optimiser and
+interpreter.
+
+The source is decoded once into `(op, x_is_reg, x, y_is_reg, y)` tuples,
+registers a..d being indices 0..3. Before executing an instruction the
+interpreter looks up a table of recognised idioms starting there:
+
+- add loop   `inc a / dec c / jnz c -2` (in either order, inc or dec on both)
+             -> a += c; c = 0
+- multiply   `cpy x c / <add loop on a, c> / dec d / jnz d -5`
+             -> a += x * d; c = 0; d = 0
+- divide     `cpy k c / jnz b 2 / jnz 1 6 / dec b / dec c / jnz c -4 /
+              inc a / jnz 1 -7`
+             -> a += b // k; c = k - b % k; b = 0
+
+and runs them in O(1) when their loop counters guarantee termination
+(otherwise it falls back to single steps). `tgl` rewrites one instruction
+and recomputes only the idioms whose window contains it.
+
+`out` values are streamed by `Machine.outputs()`, so callers can stop at the
+first wrong value.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator
+
+REGISTERS = "abcd"
+
+CPY, INC, DEC, JNZ, TGL, OUT = range(6)
+_OPCODES = {"cpy": CPY, "inc": INC, "dec": DEC, "jnz": JNZ, "tgl": TGL, "out": OUT}
+_ONE_ARG = {INC, DEC, TGL, OUT}
+# tgl: one-argument instructions become inc (inc becomes dec),
+# two-argument ones become jnz (jnz becomes cpy)
+_TOGGLED = {INC: DEC, DEC: INC, TGL: INC, OUT: INC, JNZ: CPY, CPY: JNZ}
+
+# (op, x_is_reg, x, y_is_reg, y)
+Instr = tuple[int, bool, int, bool, int]
+# idioms: (ADD, dst, dst_step, counter, counter_step)
+#         (MUL, dst, dst_step, src_is_reg, src, inner, inner_step, outer, outer_step)
+#         (DIV, quotient, dividend, divisor_is_reg, divisor, counter)
+ADD, MUL, DIV = range(3)
+_WINDOW = {ADD: 3, MUL: 6, DIV: 8}
+_LONGEST = max(_WINDOW.values())
+
+
+def _operand(token: str) -> tuple[bool, int]:
+    if token in REGISTERS:
+        return True, REGISTERS.index(token)
+    return False, int(token)
+
+
+def decode(source: str) -> list[Instr]:
+    program: list[Instr] = []
+    for lineno, line in enumerate(source.splitlines(), 1):
+        parts = line.split()
+        if not parts:
+            continue
+        op = _OPCODES.get(parts[0])
+        if op is None:
+            raise ValueError(f"line {lineno}: unknown instruction {parts[0]!r}")
+        expected = 2 if op in _ONE_ARG else 3
+        if len(parts) != expected:
+            raise ValueError(f"line {lineno}: {parts[0]} takes {expected - 1} operand(s)")
+        xr, x = _operand(parts[1])
+        yr, y = _operand(parts[2]) if expected == 3 else (False, 0)
+        program.append((op, xr, x, yr, y))
+    return program
+
+
+def _step_of(instr: Instr) -> tuple[int, int] | None:
+    """(register, +1/-1) for `inc r` / `dec r`, else None."""
+    op, xr, x, _, _ = instr
+    if op in (INC, DEC) and xr:
+        return x, 1 if op == INC else -1
+    return None
+
+
+def _match_add(program: list[Instr], ip: int) -> tuple | None:
+    if ip + 3 > len(program):
+        return None
+    first, second = _step_of(program[ip]), _step_of(program[ip + 1])
+    op, xr, counter, yr, offset = program[ip + 2]
+    if first is None or second is None or op != JNZ or not xr or yr or offset != -2:
+        return None
+    for (dst, dst_step), (cnt, cnt_step) in ((first, second), (second, first)):
+        if cnt == counter and dst != counter:
+            return (ADD, dst, dst_step, counter, cnt_step)
+    return None
+
+
+def _match_mul(program: list[Instr], ip: int) -> tuple | None:
+    if ip + 6 > len(program):
+        return None
+    op, src_is_reg, src, yr, inner = program[ip]
+    add = _match_add(program, ip + 1)
+    outer_step = _step_of(program[ip + 4])
+    jop, jxr, outer, jyr, offset = program[ip + 5]
+    if op != CPY or not yr or add is None or outer_step is None:
+        return None
+    _, dst, dst_step, counter, inner_step = add
+    if (
+        counter != inner
+        or jop != JNZ or not jxr or jyr or offset != -5
+        or outer_step[0] != outer
+        or outer in (dst, inner)
+        or (src_is_reg and src in (dst, inner, outer))
+    ):
+        return None
+    return (MUL, dst, dst_step, src_is_reg, src, inner, inner_step, outer, outer_step[1])
+
+
+def _is_jump(instr: Instr, offset: int, reg: int | None = None) -> bool:
+    """`jnz <reg> offset`, or an unconditional `jnz <non-zero literal> offset` if reg is None."""
+    op, xr, x, yr, y = instr
+    if op != JNZ or yr or y != offset:
+        return False
+    return (xr and x == reg) if reg is not None else (not xr and x != 0)
+
+
+def _match_div(program: list[Instr], ip: int) -> tuple | None:
+    if ip + 8 > len(program):
+        return None
+    op, k_is_reg, k, yr, counter = program[ip]
+    if op != CPY or not yr:
+        return None
+    dividend = program[ip + 1][2]
+    quotient = _step_of(program[ip + 6])
+    if (
+        not program[ip + 1][1]
+        or not _is_jump(program[ip + 1], 2, dividend)
+        or not _is_jump(program[ip + 2], 6)
+        or _step_of(program[ip + 3]) != (dividend, -1)
+        or _step_of(program[ip + 4]) != (counter, -1)
+        or not _is_jump(program[ip + 5], -4, counter)
+        or quotient is None or quotient[1] != 1
+        or not _is_jump(program[ip + 7], -7)
+    ):
+        return None
+    registers = {dividend, counter, quotient[0]}
+    if len(registers) != 3 or (k_is_reg and k in registers):
+        return None
+    return (DIV, quotient[0], dividend, k_is_reg, k, counter)
+
+
+def _match(program: list[Instr], ip: int) -> tuple | None:
+    return _match_div(program, ip) or _match_mul(program, ip) or _match_add(program, ip)
+
+
+def _iterations(value: int, step: int) -> int:
+    """Times a `jnz` loop stepping its counter by `step` runs from `value` (0 = not finite)."""
+    k = -value * step
+    return k if k > 0 else 0
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """Machine state when an `out` executes (for cycle detection)."""
+    ip: int
+    registers: tuple[int, int, int, int]
+    # positions toggled an odd number of times
+    toggled: frozenset[int]
+
+
+class Machine:
+    __slots__ = ("program", "_idioms")
+
+    def __init__(self, source: str) -> None:
+        self.program = decode(source)
+        self._idioms = [_match(self.program, ip) for ip in range(len(self.program))]
+
+    def run(self, a: int = 0, b: int = 0, c: int = 0, d: int = 0) -> list[int]:
+        """Run to completion (ignoring `out`) and return the registers [a, b, c, d]."""
+        regs = [a, b, c, d]
+        for _ in self._execute(regs):
+            pass
+        return regs
+
+    def outputs(self, a: int = 0, b: int = 0, c: int = 0, d: int = 0) -> Iterator[tuple[int, Snapshot]]:
+        """Stream (value, state) for every `out`; stop iterating to stop the machine."""
+        return self._execute([a, b, c, d])
+
+    def _execute(self, regs: list[int]) -> Iterator[tuple[int, Snapshot]]:
+        # tgl rewrites the program: every run works on its own copy
+        program = list(self.program)
+        idioms = list(self._idioms)
+        toggled: set[int] = set()
+        n = len(program)
+        ip = 0
+
+        while 0 <= ip < n:
+            idiom = idioms[ip]
+            if idiom is not None:
+                if idiom[0] == ADD:
+                    _, dst, dst_step, counter, counter_step = idiom
+                    k = _iterations(regs[counter], counter_step)
+                    if k:
+                        regs[dst] += dst_step * k
+                        regs[counter] = 0
+                        ip += 3
+                        continue
+                elif idiom[0] == MUL:
+                    _, dst, dst_step, src_is_reg, src, inner, inner_step, outer, outer_step = idiom
+                    k_inner = _iterations(regs[src] if src_is_reg else src, inner_step)
+                    k_outer = _iterations(regs[outer], outer_step)
+                    if k_inner and k_outer:
+                        regs[dst] += dst_step * k_inner * k_outer
+                        regs[inner] = 0
+                        regs[outer] = 0
+                        ip += 6
+                        continue
+                else:
+                    _, quotient, dividend, k_is_reg, k, counter = idiom
+                    divisor = regs[k] if k_is_reg else k
+                    if divisor > 0 and regs[dividend] >= 0:
+                        q, r = divmod(regs[dividend], divisor)
+                        regs[quotient] += q
+                        regs[counter] = divisor - r
+                        regs[dividend] = 0
+                        ip += 8
+                        continue
+
+            op, xr, x, yr, y = program[ip]
+            if op == CPY:
+                if yr:  # cpy into a literal (after tgl): skipped
+                    regs[y] = regs[x] if xr else x
+            elif op == INC:
+                if xr:
+                    regs[x] += 1
+            elif op == DEC:
+                if xr:
+                    regs[x] -= 1
+            elif op == JNZ:
+                if (regs[x] if xr else x) != 0:
+                    ip += regs[y] if yr else y
+                    continue
+            elif op == TGL:
+                target = ip + (regs[x] if xr else x)
+                if 0 <= target < n:
+                    t_op, t_xr, t_x, t_yr, t_y = program[target]
+                    program[target] = (_TOGGLED[t_op], t_xr, t_x, t_yr, t_y)
+                    toggled ^= {target}
+                    # only the idioms whose window contains `target` can change
+                    for start in range(max(0, target - _LONGEST + 1), target + 1):
+                        idioms[start] = _match(program, start)
+            else:  # OUT
+                value = regs[x] if xr else x
+                yield value, Snapshot(ip, (regs[0], regs[1], regs[2], regs[3]), frozenset(toggled))
+            ip += 1
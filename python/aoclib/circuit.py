@@ -0,0 +1,265 @@
+"""
+Combinational circuits of named wires (AoC 2015/07, 2024/24).
+
+    circuit = Circuit.parse(lines, width=16)   # "x AND y -> d", "123 -> x", "NOT x -> h"
+    values = circuit.evaluate({"x": 123})      # values["d"]
+    values.set("b", 956)                       # recompute only what depends on b
+
+Wires are numbered and the gates sorted topologically once, when the circuit
+is built: an evaluation is then a single pass over a flat list, and
+overriding a wire re-evaluates only its downstream cone. Wires that are used
+but never driven are the circuit inputs; literals become constant wires.
+
+One-bit circuits can also be evaluated bit-parallel: `evaluate_lanes` packs
+one input vector per bit of a Python int, so AND / OR / XOR / NOT compute
+all the lanes at once (`pack_words` / `Evaluation.words` convert numbered
+buses such as x00, x01, ... from and to per-lane integers).
+"""
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Sequence
+
+# Sources (never evaluated) first
+CONST, INPUT, COPY, NOT, AND, OR, XOR, LSHIFT, RSHIFT = range(9)
+_OPCODES = {
+    "COPY": COPY, "NOT": NOT, "AND": AND, "OR": OR, "XOR": XOR,
+    "LSHIFT": LSHIFT, "RSHIFT": RSHIFT,
+}
+_ARITY = {COPY: 1, NOT: 1, AND: 2, OR: 2, XOR: 2, LSHIFT: 2, RSHIFT: 2}
+
+# (dest, op, operands): operands are wire names or decimal literals
+Gate = tuple[str, str, tuple[str, ...]]
+
+
+def parse_gate(line: str) -> Gate:
+    """`a AND b -> c`, `NOT a -> c`, `a -> c` or `123 -> c`."""
+    expr, _, dest = line.partition(" -> ")
+    tokens = expr.split()
+    if not dest or not 1 <= len(tokens) <= 3:
+        raise ValueError(f"Not a gate: {line!r}")
+    if len(tokens) == 1:
+        return dest.strip(), "COPY", (tokens[0],)
+    if len(tokens) == 2:
+        return dest.strip(), tokens[0], (tokens[1],)
+    return dest.strip(), tokens[1], (tokens[0], tokens[2])
+
+
+class Circuit:
+    __slots__ = (
+        "width", "mask", "names", "index", "ops", "args", "inputs",
+        "_gates", "_position", "_users", "_cones",
+    )
+
+    def __init__(self, gates: Iterable[Gate], width: int = 1) -> None:
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.names: list[str] = []
+        self.index: dict[str, int] = {}
+        self.ops: list[int] = []
+        # operand wires; for CONST the (value,)
+        self.args: list[tuple[int, ...]] = []
+
+        for dest, op, operands in gates:
+            code = _OPCODES.get(op)
+            if code is None:
+                raise ValueError(f"{dest}: unknown gate {op!r}")
+            if len(operands) != _ARITY[code]:
+                raise ValueError(f"{dest}: {op} takes {_ARITY[code]} operand(s), got {len(operands)}")
+            node = self._wire(dest)
+            if self.ops[node] != INPUT:
+                raise ValueError(f"Wire {dest!r} is driven twice")
+            self.ops[node] = code
+            self.args[node] = tuple(self._operand(token) for token in operands)
+
+        self.inputs = [name for name, op in zip(self.names, self.ops) if op == INPUT]
+        self._sort()
+        self._cones: dict[int, list[int]] = {}
+
+    @classmethod
+    def parse(cls, lines: Iterable[str], width: int = 1) -> Circuit:
+        """From `... -> dest` lines (blank lines are skipped)."""
+        return cls((parse_gate(line) for line in lines if line.strip()), width)
+
+    def _wire(self, name: str) -> int:
+        node = self.index.get(name)
+        if node is None:
+            node = self.index[name] = len(self.names)
+            self.names.append(name)
+            self.ops.append(INPUT)
+            self.args.append(())
+        return node
+
+    def _operand(self, token: str) -> int:
+        if not token.isdigit():
+            return self._wire(token)
+        node = self._wire(token)
+        self.ops[node] = CONST
+        self.args[node] = (int(token) & self.mask,)
+        return node
+
+    def _sort(self) -> None:
+        """Kahn's algorithm: `_gates` lists the evaluated wires in dependency order."""
+        n = len(self.names)
+        users: list[list[int]] = [[] for _ in range(n)]
+        pending = [0] * n
+        for node in range(n):
+            if self.ops[node] > INPUT:
+                for arg in self.args[node]:
+                    users[arg].append(node)
+                pending[node] = len(self.args[node])
+
+        ready = [node for node in range(n) if self.ops[node] <= INPUT]
+        order: list[int] = []
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for user in users[node]:
+                pending[user] -= 1
+                if pending[user] == 0:
+                    ready.append(user)
+
+        if len(order) != n:
+            stuck = sorted(self.names[node] for node in range(n) if pending[node])
+            raise ValueError(f"The circuit has a cycle through {', '.join(stuck[:5])}")
+
+        self._users = users
+        self._position = [0] * n
+        for i, node in enumerate(order):
+            self._position[node] = i
+        self._gates = [node for node in order if self.ops[node] > INPUT]
+
+    def cone(self, wire: str) -> list[int]:
+        """Wires downstream of `wire` (excluded), in evaluation order."""
+        start = self.index[wire]
+        cone = self._cones.get(start)
+        if cone is None:
+            seen = {start}
+            stack = [start]
+            while stack:
+                for user in self._users[stack.pop()]:
+                    if user not in seen:
+                        seen.add(user)
+                        stack.append(user)
+            seen.discard(start)
+            cone = self._cones[start] = sorted(seen, key=self._position.__getitem__)
+        return cone
+
+    # --- evaluation ---------------------------------------------------------
+
+    def evaluate(self, inputs: Mapping[str, int] | None = None) -> Evaluation:
+        """
+        Values of every wire. `inputs` must cover the undriven wires; it may
+        also force driven ones, whose gate is then ignored.
+        """
+        return self._evaluate(inputs or {}, self.mask, 1)
+
+    def evaluate_lanes(self, inputs: Mapping[str, int], lanes: int) -> Evaluation:
+        """
+        One-bit circuits only: bit i of every value is lane i, an independent
+        evaluation of the circuit, so `lanes` input vectors cost one pass.
+        """
+        if self.width != 1:
+            raise ValueError("evaluate_lanes needs a one-bit circuit")
+        mask = (1 << lanes) - 1
+        return self._evaluate(inputs, mask, mask)
+
+    def _evaluate(self, inputs: Mapping[str, int], mask: int, spread: int) -> Evaluation:
+        values = [0] * len(self.names)
+        for node, op in enumerate(self.ops):
+            if op == CONST:
+                # width 1 constants are 0 or 1: `spread` copies them to every lane
+                values[node] = self.args[node][0] * spread
+
+        missing = [name for name in self.inputs if name not in inputs]
+        if missing:
+            raise ValueError(f"No value for input wire(s) {', '.join(missing[:5])}")
+        fixed: set[int] = set()
+        for name, value in inputs.items():
+            node = self.index.get(name)
+            if node is None:
+                raise KeyError(f"Unknown wire {name!r}")
+            values[node] = value & mask
+            if self.ops[node] > INPUT:
+                fixed.add(node)
+
+        self._run(values, self._gates, mask, fixed)
+        return Evaluation(self, values, mask, fixed)
+
+    def _run(self, values: list[int], nodes: Sequence[int], mask: int, fixed: set[int]) -> None:
+        ops, args = self.ops, self.args
+        for node in nodes:
+            if fixed and node in fixed:
+                continue
+            op = ops[node]
+            a = args[node]
+            if op == AND:
+                values[node] = values[a[0]] & values[a[1]]
+            elif op == OR:
+                values[node] = values[a[0]] | values[a[1]]
+            elif op == XOR:
+                values[node] = values[a[0]] ^ values[a[1]]
+            elif op == COPY:
+                values[node] = values[a[0]]
+            elif op == NOT:
+                values[node] = ~values[a[0]] & mask
+            elif op == LSHIFT:
+                values[node] = (values[a[0]] << values[a[1]]) & mask
+            else:  # RSHIFT
+                values[node] = values[a[0]] >> values[a[1]]
+
+
+class Evaluation:
+    """The values of one evaluation, indexed by wire name."""
+
+    __slots__ = ("circuit", "values", "mask", "_fixed")
+
+    def __init__(self, circuit: Circuit, values: list[int], mask: int, fixed: set[int]) -> None:
+        self.circuit = circuit
+        self.values = values
+        self.mask = mask
+        self._fixed = fixed
+
+    def __getitem__(self, wire: str) -> int:
+        return self.values[self.circuit.index[wire]]
+
+    def set(self, wire: str, value: int) -> None:
+        """Force `wire` to `value` and re-evaluate only the wires depending on it."""
+        circuit = self.circuit
+        node = circuit.index[wire]
+        self.values[node] = value & self.mask
+        if circuit.ops[node] > INPUT:
+            self._fixed.add(node)
+        circuit._run(self.values, circuit.cone(wire), self.mask, self._fixed)
+
+    def bus(self, prefix: str) -> list[str]:
+        """Wires named `prefix` + a number (x00, x01, ...), least significant first."""
+        wires = [
+            name for name in self.circuit.names
+            if name.startswith(prefix) and name[len(prefix):].isdigit()
+        ]
+        return sorted(wires, key=lambda name: int(name[len(prefix):]))
+
+    def word(self, prefix: str) -> int:
+        """One-bit circuits: the number on the bus `prefix` (wire i = bit i)."""
+        return sum(self[wire] << i for i, wire in enumerate(self.bus(prefix)))
+
+    def words(self, prefix: str, lanes: int) -> list[int]:
+        """After `evaluate_lanes`: the number on the bus `prefix`, for every lane."""
+        return [
+            sum(((self[wire] >> lane) & 1) << i for i, wire in enumerate(self.bus(prefix)))
+            for lane in range(lanes)
+        ]
+
+
+def pack_words(prefix: str, words: Sequence[int], bits: int, digits: int = 2) -> dict[str, int]:
+    """
+    Inputs for `evaluate_lanes`: bit i of words[lane] goes to the wire
+    `prefix` + i (zero-padded to `digits`), at bit `lane`.
+    """
+    packed: dict[str, int] = {}
+    for i in range(bits):
+        lanes = 0
+        for lane, word in enumerate(words):
+            lanes |= ((word >> i) & 1) << lane
+        packed[f"{prefix}{i:0{digits}d}"] = lanes
+    return packed
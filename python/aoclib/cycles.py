@@ -0,0 +1,163 @@
+"""
+Cycle detection for iterated functions `x_{i+1} = f(x_i)`.
+
+Long simulations ("the state after 1_000_000_000 steps") eventually repeat:
+x_mu is the first state that comes back, lam the length of the loop. Then
+x_n == x_{mu + (n - mu) % lam} for every n >= mu, and `fast_forward` jumps to
+step n without simulating (or storing) all the states in between.
+
+States are compared through `key(state)`: pass a compact fingerprint
+(`arr.tobytes()` for NumPy arrays, a packed int, `"".join(rows)`) instead of
+keeping full copies around.
+
+- `find_cycle`: remembers one fingerprint per step (dict), simulates mu + lam steps.
+- `brent` / `floyd`: O(1) memory, at the price of a few extra calls to `f`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Literal, TypeVar
+
+T = TypeVar("T")
+
+Key = Callable[[T], Hashable]
+Method = Literal["hash", "brent", "floyd"]
+
+
+def _identity(x: T) -> T:
+    return x
+
+
+@dataclass(frozen=True, slots=True)
+class Cycle(Generic[T]):
+    mu: int   # first step of the loop
+    lam: int  # loop length
+    # state at step `at` (== state at step mu + (at - mu) % lam)
+    state: T
+    at: int
+
+    def equivalent_step(self, n: int) -> int:
+        """Smallest step with the same state as step `n`."""
+        return n if n < self.mu else self.mu + (n - self.mu) % self.lam
+
+    def steps_from_state(self, n: int) -> int:
+        """How many more applications of f turn `state` into the state at step n (n >= mu)."""
+        if n < self.mu:
+            raise ValueError(f"Step {n} comes before the cycle (mu={self.mu})")
+        return (n - self.at) % self.lam
+
+
+def find_cycle(x0: T, f: Callable[[T], T], key: Key = _identity, limit: int | None = None) -> Cycle[T]:
+    """Hash-keyed detection: one fingerprint per step, f called mu + lam times."""
+    seen: dict[Hashable, int] = {}
+    x, step = x0, 0
+    while True:
+        fp = key(x)
+        first = seen.get(fp)
+        if first is not None:
+            return Cycle(first, step - first, x, step)
+        if limit is not None and step >= limit:
+            raise RuntimeError(f"No cycle within {limit} steps")
+        seen[fp] = step
+        x = f(x)
+        step += 1
+
+
+def brent(x0: T, f: Callable[[T], T], key: Key = _identity) -> Cycle[T]:
+    """Brent's algorithm: O(1) memory, about mu + 2 * lam calls to f (plus the search for lam)."""
+    # lam: the hare runs ahead in windows of doubling size
+    power = lam = 1
+    tortoise, hare = x0, f(x0)
+    t_key = key(tortoise)
+    while t_key != key(hare):
+        if power == lam:
+            tortoise, t_key = hare, key(hare)
+            power *= 2
+            lam = 0
+        hare = f(hare)
+        lam += 1
+
+    # mu: two pointers lam steps apart meet at the start of the loop
+    tortoise = hare = x0
+    for _ in range(lam):
+        hare = f(hare)
+    mu = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = f(tortoise), f(hare)
+        mu += 1
+
+    return Cycle(mu, lam, tortoise, mu)
+
+
+def floyd(x0: T, f: Callable[[T], T], key: Key = _identity) -> Cycle[T]:
+    """Floyd's tortoise and hare: O(1) memory, about 3 * (mu + lam) calls to f."""
+    tortoise, hare = f(x0), f(f(x0))
+    while key(tortoise) != key(hare):
+        tortoise, hare = f(tortoise), f(f(hare))
+
+    # mu: restart the tortoise, both move one step at a time
+    mu = 0
+    tortoise = x0
+    while key(tortoise) != key(hare):
+        tortoise, hare = f(tortoise), f(hare)
+        mu += 1
+
+    # lam: walk the loop once from x_mu
+    lam = 1
+    hare = f(tortoise)
+    t_key = key(tortoise)
+    while t_key != key(hare):
+        hare = f(hare)
+        lam += 1
+
+    return Cycle(mu, lam, tortoise, mu)
+
+
+_METHODS: dict[str, Callable[..., Cycle]] = {"brent": brent, "floyd": floyd}
+
+
+def fast_forward(
+    x0: T,
+    f: Callable[[T], T],
+    n: int,
+    *,
+    key: Key = _identity,
+    method: Method = "hash",
+) -> T:
+    """
+    State after `n` applications of f. Simulates until the first repeat
+    (or step n, if that comes first) and jumps over the remaining loops.
+    """
+    if n < 0:
+        raise ValueError(f"n must be >= 0, got {n}")
+
+    if method == "hash":
+        # like find_cycle, but stops early if step n comes before the repeat
+        seen: dict[Hashable, int] = {}
+        x, step = x0, 0
+        while step < n:
+            fp = key(x)
+            first = seen.get(fp)
+            if first is not None:
+                cycle = Cycle(first, step - first, x, step)
+                break
+            seen[fp] = step
+            x = f(x)
+            step += 1
+        else:
+            return x
+    else:
+        try:
+            cycle = _METHODS[method](x0, f, key)
+        except KeyError:
+            raise ValueError(f"Unknown method {method!r}") from None
+        if n < cycle.mu:
+            x = x0
+            for _ in range(n):
+                x = f(x)
+            return x
+
+    x = cycle.state
+    for _ in range(cycle.steps_from_state(n)):
+        x = f(x)
+    return x
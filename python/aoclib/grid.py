@@ -0,0 +1,299 @@
+"""
+Character grids backed by a contiguous uint8 NumPy array.
+
+The input is parsed once into `Grid.cells` (shape (height, width), one byte
+per cell). Cells can also be addressed by flat index `i = r * width + c`,
+whose orthogonal neighbours are `i + off` for `off in grid.offsets`: pad the
+grid with a sentinel (`Grid.parse(raw, pad="#")`) and hot loops need no
+bounds checks at all.
+
+For pure-Python inner loops convert once with `grid.flat_list()` (plain ints
+are much faster to index than NumPy scalars); for whole-grid work use the
+vectorised helpers (`mask`, `find_all`, `shift`, `distances`).
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Iterable, TypeAlias
+
+from aoclib.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+Pos: TypeAlias = tuple[int, int]  # (row, col)
+
+# Orthogonal directions, clockwise from north: N, E, S, W
+DIRS4: tuple[Pos, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIRS8: tuple[Pos, ...] = (
+    (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1),
+)
+
+UNREACHABLE = -1
+
+
+def _codes(chars: str | Iterable[str]) -> list[int]:
+    return [ord(ch) for ch in chars]
+
+
+def shift(arr: Any, dr: int, dc: int, fill: Any = 0) -> Any:
+    """
+    `out[r, c] = arr[r + dr, c + dc]`, or `fill` where that falls outside.
+    Comparing an array with its shifts is the vectorised form of "look at
+    the neighbour in direction (dr, dc)".
+    """
+    h, w = arr.shape
+    out = np.full_like(arr, fill)
+    if abs(dr) >= h or abs(dc) >= w:
+        return out
+    out[max(0, -dr):h - max(0, dr), max(0, -dc):w - max(0, dc)] = (
+        arr[max(0, dr):h - max(0, -dr), max(0, dc):w - max(0, -dc)]
+    )
+    return out
+
+
+class Grid:
+    __slots__ = ("cells", "_neighbours")
+
+    def __init__(self, cells: Any) -> None:
+        if cells.ndim != 2:
+            raise ValueError(f"Grid needs a 2-D array, got shape {cells.shape}")
+        cells = np.ascontiguousarray(cells, dtype=np.uint8)
+        # frombuffer over bytes, broadcast views, ...: grids are always writable
+        self.cells = cells if cells.flags.writeable else cells.copy()
+        self._neighbours: dict[bool, Any] = {}
+
+    # -----------------------------
+    # Construction
+    # -----------------------------
+    @classmethod
+    def parse(cls, raw: str, *, pad: str | None = None) -> Grid:
+        """One row per non-blank line; all rows must have the same length."""
+        lines = [line for line in raw.splitlines() if line.strip()]
+        if not lines:
+            raise ValueError("Empty grid")
+        width = len(lines[0])
+        if any(len(line) != width for line in lines):
+            raise ValueError("Grid rows have different lengths")
+        data = bytearray("".join(lines), "ascii")
+        grid = cls(np.frombuffer(data, dtype=np.uint8).reshape(len(lines), width))
+        return grid if pad is None else grid.padded(pad)
+
+    @classmethod
+    def blank(cls, height: int, width: int, fill: str = ".") -> Grid:
+        return cls(np.full((height, width), ord(fill), dtype=np.uint8))
+
+    def copy(self) -> Grid:
+        return Grid(self.cells.copy())
+
+    def padded(self, ch: str, width: int = 1) -> Grid:
+        """New grid with a `width`-cell border of `ch` (coordinates shift by `width`)."""
+        return Grid(np.pad(self.cells, width, constant_values=ord(ch)))
+
+    def tiled(self, reps_rows: int, reps_cols: int | None = None) -> Grid:
+        """The grid repeated `reps_rows x reps_cols` times (finite view of a wrapping map)."""
+        return Grid(np.tile(self.cells, (reps_rows, reps_rows if reps_cols is None else reps_cols)))
+
+    # -----------------------------
+    # Shape and addressing
+    # -----------------------------
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def size(self) -> int:
+        return self.cells.size
+
+    @property
+    def offsets(self) -> tuple[int, int, int, int]:
+        """Flat-index offsets of DIRS4 (N, E, S, W)."""
+        w = self.width
+        return (-w, 1, w, -1)
+
+    def index(self, r: int, c: int) -> int:
+        return r * self.width + c
+
+    def pos(self, i: int) -> Pos:
+        r, c = divmod(i, self.width)
+        return (r, c)
+
+    def in_bounds(self, r: int, c: int) -> bool:
+        return 0 <= r < self.height and 0 <= c < self.width
+
+    def __getitem__(self, pos: Pos) -> str:
+        return chr(self.cells[pos])
+
+    def __setitem__(self, pos: Pos, ch: str) -> None:
+        self.cells[pos] = ord(ch)
+
+    def get(self, r: int, c: int, default: str = "") -> str:
+        return chr(self.cells[r, c]) if self.in_bounds(r, c) else default
+
+    def flat_list(self) -> list[int]:
+        """Cell codes as a flat list of ints, for pure-Python hot loops."""
+        return self.cells.ravel().tolist()
+
+    def neighbour_table(self, wrap: bool = False) -> Any:
+        """
+        (size, 4) int array: flat index of the N, E, S, W neighbour of each
+        cell, or -1 outside the grid. With `wrap=True` the grid is a torus.
+        Cached per grid (the shape never changes).
+        """
+        table = self._neighbours.get(wrap)
+        if table is None:
+            h, w = self.shape
+            rows, cols = np.divmod(np.arange(h * w), w)
+            table = np.empty((h * w, 4), dtype=np.int64)
+            for k, (dr, dc) in enumerate(DIRS4):
+                nr, nc = rows + dr, cols + dc
+                if wrap:
+                    table[:, k] = (nr % h) * w + nc % w
+                else:
+                    inside = (nr >= 0) & (nr < h) & (nc >= 0) & (nc < w)
+                    table[:, k] = np.where(inside, nr * w + nc, -1)
+            self._neighbours[wrap] = table
+        return table
+
+    # -----------------------------
+    # Vectorised queries
+    # -----------------------------
+    def mask(self, chars: str | Iterable[str]) -> Any:
+        """Boolean array, True where the cell is one of `chars`."""
+        codes = _codes(chars)
+        if len(codes) == 1:
+            return self.cells == codes[0]
+        return np.isin(self.cells, codes)
+
+    def count(self, chars: str | Iterable[str]) -> int:
+        return int(self.mask(chars).sum())
+
+    def find_all(self, chars: str | Iterable[str]) -> list[Pos]:
+        """Positions of every cell in `chars`, in row-major order."""
+        rows, cols = np.nonzero(self.mask(chars))
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    def find(self, ch: str) -> Pos:
+        """Position of the first `ch` (row-major); ValueError if missing."""
+        i = self.cells.tobytes().find(ord(ch).to_bytes(1, "little"))
+        if i < 0:
+            raise ValueError(f"{ch!r} not found in grid")
+        return self.pos(i)
+
+    # -----------------------------
+    # Searches
+    # -----------------------------
+    def distances(
+        self,
+        start: Pos | Iterable[Pos],
+        *,
+        walls: str = "#",
+        passable: Any = None,
+        wrap: bool = False,
+    ) -> Any:
+        """
+        BFS distance field from `start` (one position or several) as an int
+        array of the grid's shape, -1 where unreachable. Cells in `walls` are
+        blocked, unless an explicit boolean `passable` array is given.
+        """
+        if passable is None:
+            passable = ~self.mask(walls)
+        starts = [start] if isinstance(start, tuple) and isinstance(start[0], int) else list(start)
+        h, w = self.shape
+
+        if wrap:
+            open_cells = passable.ravel().tolist()
+            table = self.neighbour_table(wrap=True).tolist()
+            dist = [UNREACHABLE] * (h * w)
+            queue: deque[int] = deque()
+            for r, c in starts:
+                dist[r * w + c] = 0
+                queue.append(r * w + c)
+            while queue:
+                i = queue.popleft()
+                d = dist[i] + 1
+                for j in table[i]:
+                    if open_cells[j] and dist[j] < 0:
+                        dist[j] = d
+                        queue.append(j)
+            return np.array(dist, dtype=np.int64).reshape(h, w)
+
+        # A blocked border removes every bounds check from the loop
+        wp = w + 2
+        open_cells = np.pad(passable, 1, constant_values=False).ravel().tolist()
+        offsets = (-wp, 1, wp, -1)
+        dist = [UNREACHABLE] * ((h + 2) * wp)
+        queue = deque()
+        for r, c in starts:
+            i = (r + 1) * wp + c + 1
+            dist[i] = 0
+            queue.append(i)
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for off in offsets:
+                j = i + off
+                if open_cells[j] and dist[j] < 0:
+                    dist[j] = d
+                    queue.append(j)
+        return np.array(dist, dtype=np.int64).reshape(h + 2, wp)[1:-1, 1:-1]
+
+    def label_regions(self) -> tuple[Any, int]:
+        """
+        Connected regions of equal characters (4-connectivity).
+        Returns (labels, count): an int array of region ids 0..count-1.
+        """
+        h, w = self.shape
+        wp = w + 2
+        # border code 256 never equals a cell
+        codes = np.pad(self.cells.astype(np.int32), 1, constant_values=256).ravel().tolist()
+        labels = [-1] * len(codes)
+        offsets = (-wp, 1, wp, -1)
+        count = 0
+
+        for r in range(1, h + 1):
+            for i in range(r * wp + 1, r * wp + w + 1):
+                if labels[i] >= 0:
+                    continue
+                code = codes[i]
+                labels[i] = count
+                stack = [i]
+                while stack:
+                    k = stack.pop()
+                    for off in offsets:
+                        j = k + off
+                        if labels[j] < 0 and codes[j] == code:
+                            labels[j] = count
+                            stack.append(j)
+                count += 1
+
+        return np.array(labels, dtype=np.int64).reshape(h + 2, wp)[1:-1, 1:-1], count
+
+    # -----------------------------
+    # Output
+    # -----------------------------
+    def lines(self) -> list[str]:
+        return [row.tobytes().decode("ascii") for row in self.cells]
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
+
+    def __repr__(self) -> str:
+        return f"Grid({self.height}x{self.width})"
+
+
+if __name__ == "__main__":
+    grid = Grid.parse("ab\ncd\n")
+    grid[(0, 0)] = "x"
+    assert grid.lines() == ["xb", "cd"], grid.lines()
+    padded = Grid.parse("ab\ncd\n", pad="#")
+    padded[(1, 1)] = "y"
+    assert padded.lines()[1] == "#yb#", padded.lines()
+    print("grid: ok")
@@ -0,0 +1,185 @@
+"""
+MD5 "mining": scan nonces n = start, start + 1, ... and keep those whose
+md5(salt + str(n)) satisfies a predicate on the raw 16-byte digest.
+
+    for n, digest in find_prefixed("abcdef", HexPrefix("00000")):
+        ...
+
+- Predicates look at digest bytes (`HexPrefix` compares whole bytes plus at
+  most one nibble) instead of formatting a hexdigest for every candidate.
+- Salts of at least one MD5 block (64 bytes) are hashed once and the state
+  is `.copy()`-ed per nonce; for shorter salts hashing `salt + nonce` from
+  scratch is faster than copying the hash object.
+- With `workers > 1` contiguous nonce ranges are scanned by a process pool
+  (default `aoclib.parallel.default_workers()`: the usable CPUs, the share
+  set by the runner / server, or inline inside a worker process);
+  results are merged back in nonce order, so "the first N matches" are the
+  same as with a single process. Predicates must then be picklable (the
+  classes below are).
+"""
+from __future__ import annotations
+
+import re
+from collections import deque
+from hashlib import md5
+from typing import Callable, Iterator
+
+from aoclib.lazy import lazy_import
+from aoclib.parallel import default_workers
+
+futures_mod = lazy_import("concurrent.futures")
+
+Predicate = Callable[[bytes], bool]
+Match = tuple[int, bytes]  # (nonce, digest)
+
+# Nonces per task: big enough to amortise the inter-process traffic
+CHUNK = 50_000
+# Below one MD5 block, re-hashing the salt is cheaper than copying the state
+_BLOCK = 64
+
+
+class HexPrefix:
+    """True if the hex digest starts with `prefix` (checked on the raw bytes)."""
+
+    __slots__ = ("prefix", "_full", "_nibble")
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix.lower()
+        even = len(prefix) // 2 * 2
+        self._full = bytes.fromhex(prefix[:even])
+        self._nibble = int(prefix[even], 16) if len(prefix) % 2 else -1
+
+    def __call__(self, digest: bytes) -> bool:
+        if not digest.startswith(self._full):
+            return False
+        return self._nibble < 0 or digest[len(self._full)] >> 4 == self._nibble
+
+    def __reduce__(self) -> tuple:
+        return (HexPrefix, (self.prefix,))
+
+    def __repr__(self) -> str:
+        return f"HexPrefix({self.prefix!r})"
+
+
+class HexRun:
+    """True if the hex digest contains `length` equal characters in a row."""
+
+    __slots__ = ("length", "_re")
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+        self._re = re.compile(rf"(.)\1{{{length - 1}}}")
+
+    def first(self, digest: bytes) -> str | None:
+        """Character of the first run, or None."""
+        m = self._re.search(digest.hex())
+        return m.group(1) if m else None
+
+    def __call__(self, digest: bytes) -> bool:
+        return self._re.search(digest.hex()) is not None
+
+    def __reduce__(self) -> tuple:
+        return (HexRun, (self.length,))
+
+    def __repr__(self) -> str:
+        return f"HexRun({self.length})"
+
+
+def hasher(salt: str | bytes, stretch: int = 0) -> Callable[[bytes], bytes]:
+    """
+    `suffix -> md5(salt + suffix).digest()`, re-hashing the hex digest
+    `stretch` more times (2016/14 "key stretching").
+    """
+    salt_b = salt.encode() if isinstance(salt, str) else salt
+
+    if len(salt_b) >= _BLOCK:
+        copy = md5(salt_b).copy
+
+        def first(suffix: bytes) -> bytes:
+            h = copy()
+            h.update(suffix)
+            return h.digest()
+    else:
+
+        def first(suffix: bytes) -> bytes:
+            return md5(salt_b + suffix).digest()
+
+    if not stretch:
+        return first
+
+    def stretched(suffix: bytes) -> bytes:
+        digest = first(suffix)
+        for _ in range(stretch):
+            digest = md5(digest.hex().encode()).digest()
+        return digest
+
+    return stretched
+
+
+def scan(salt: str, predicate: Predicate, lo: int, hi: int, stretch: int = 0) -> list[Match]:
+    """Matches with lo <= nonce < hi, in order (one task of the pool)."""
+    digest_of = hasher(salt, stretch)
+    full = predicate._full if isinstance(predicate, HexPrefix) else b""
+    out: list[Match] = []
+    for n in range(lo, hi):
+        digest = digest_of(b"%d" % n)
+        if digest.startswith(full) and predicate(digest):
+            out.append((n, digest))
+    return out
+
+
+def find_prefixed(
+    salt: str,
+    predicate: Predicate | str,
+    start: int = 0,
+    *,
+    stretch: int = 0,
+    workers: int | None = None,
+    chunk: int | None = None,
+) -> Iterator[Match]:
+    """
+    Endless generator of (nonce, digest) for the nonces >= start whose
+    digest satisfies `predicate` (a hex prefix string is a `HexPrefix`),
+    in increasing nonce order. Stop iterating to stop the search.
+    `workers` defaults to `default_workers()` (1 = no pool).
+    """
+    if isinstance(predicate, str):
+        predicate = HexPrefix(predicate)
+    if workers is None:
+        workers = default_workers()
+    if chunk is None:
+        # a stretched nonce costs `stretch + 1` hashes
+        chunk = max(1, CHUNK // (stretch + 1))
+
+    if workers <= 1:
+        # Single process: no batching, no overshoot past the last match used
+        salt_b = salt.encode()
+        n = start
+        if stretch or len(salt_b) >= _BLOCK:
+            digest_of = hasher(salt_b, stretch)
+            while True:
+                digest = digest_of(b"%d" % n)
+                if predicate(digest):
+                    yield n, digest
+                n += 1
+        # common case inlined: short salt, one hash per nonce, and a
+        # startswith() pre-check that rejects almost every HexPrefix candidate
+        full = predicate._full if isinstance(predicate, HexPrefix) else b""
+        while True:
+            digest = md5(salt_b + b"%d" % n).digest()
+            if digest.startswith(full) and predicate(digest):
+                yield n, digest
+            n += 1
+
+    pool = futures_mod.ProcessPoolExecutor(workers)
+    try:
+        # A few chunks in flight per worker; results consumed strictly in order
+        pending: deque = deque()
+        lo = start
+        while True:
+            while len(pending) < 2 * workers:
+                pending.append(pool.submit(scan, salt, predicate, lo, lo + chunk, stretch))
+                lo += chunk
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
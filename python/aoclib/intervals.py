@@ -0,0 +1,201 @@
+"""
+Sets of integers stored as sorted, disjoint half-open intervals.
+
+An `IntervalSet` keeps one flat, strictly increasing list of boundaries
+`[s0, e0, s1, e1, ...]` for the intervals `[s0, e0) ∪ [s1, e1) ∪ ...`
+(overlapping and adjacent ranges are merged when the set is built). A point
+`x` is a member iff `bisect_right(bounds, x)` is odd, so membership is
+O(log n); union, intersection and difference are a single O(n + m) merge of
+the two boundary lists.
+
+Puzzle inputs usually give inclusive ranges: build them with
+`IntervalSet.from_closed([(lo, hi), ...])` and read them back with `closed()`.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterable, Iterator
+
+_INF = float("inf")
+
+# (start, end, delta): [start, end) is moved to [start + delta, end + delta)
+Piece = tuple[int, int, int]
+
+
+class IntervalSet:
+    __slots__ = ("_bounds",)
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        """From half-open `(start, end)` ranges, in any order; empty ones are dropped."""
+        bounds: list[int] = []
+        for start, end in sorted(r for r in ranges if r[0] < r[1]):
+            if bounds and start <= bounds[-1]:
+                if end > bounds[-1]:
+                    bounds[-1] = end
+            else:
+                bounds.append(start)
+                bounds.append(end)
+        self._bounds = bounds
+
+    @classmethod
+    def _from_bounds(cls, bounds: list[int]) -> IntervalSet:
+        out = cls.__new__(cls)
+        out._bounds = bounds
+        return out
+
+    @classmethod
+    def from_closed(cls, ranges: Iterable[tuple[int, int]]) -> IntervalSet:
+        """From inclusive `(lo, hi)` ranges."""
+        return cls((lo, hi + 1) for lo, hi in ranges)
+
+    @classmethod
+    def span(cls, start: int, end: int) -> IntervalSet:
+        """The single interval [start, end)."""
+        return cls._from_bounds([start, end] if start < end else [])
+
+    @classmethod
+    def points(cls, values: Iterable[int]) -> IntervalSet:
+        return cls((v, v + 1) for v in values)
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def __contains__(self, x: int) -> bool:
+        return bisect_right(self._bounds, x) & 1 == 1
+
+    def count_members(self, values: Iterable[int]) -> int:
+        """How many of `values` are in the set (duplicates count), O(log n) each."""
+        bounds = self._bounds
+        return sum(bisect_right(bounds, x) & 1 for x in values)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Half-open `(start, end)` intervals, in increasing order."""
+        b = self._bounds
+        return iter(zip(b[0::2], b[1::2]))
+
+    def closed(self) -> Iterator[tuple[int, int]]:
+        """Inclusive `(lo, hi)` intervals, in increasing order."""
+        return ((start, end - 1) for start, end in self)
+
+    def __len__(self) -> int:
+        """Number of disjoint intervals (see `total_length` for the number of members)."""
+        return len(self._bounds) // 2
+
+    def __bool__(self) -> bool:
+        return bool(self._bounds)
+
+    @property
+    def total_length(self) -> int:
+        b = self._bounds
+        return sum(b[i + 1] - b[i] for i in range(0, len(b), 2))
+
+    @property
+    def min(self) -> int:
+        if not self._bounds:
+            raise ValueError("min of an empty IntervalSet")
+        return self._bounds[0]
+
+    @property
+    def max(self) -> int:
+        if not self._bounds:
+            raise ValueError("max of an empty IntervalSet")
+        return self._bounds[-1] - 1
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalSet) and self._bounds == other._bounds
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._bounds))
+
+    def __repr__(self) -> str:
+        inner = ", ".join(f"[{s}, {e})" for s, e in self)
+        return f"IntervalSet({inner})"
+
+    # -----------------------------
+    # Set algebra
+    # -----------------------------
+    def _combine(self, other: IntervalSet, keep: Callable[[bool, bool], bool]) -> IntervalSet:
+        a, b = self._bounds, other._bounds
+        na, nb = len(a), len(b)
+        i = j = 0
+        in_a = in_b = inside = False
+        out: list[int] = []
+        while i < na or j < nb:
+            x = min(a[i] if i < na else _INF, b[j] if j < nb else _INF)
+            if i < na and a[i] == x:
+                in_a = not in_a
+                i += 1
+            if j < nb and b[j] == x:
+                in_b = not in_b
+                j += 1
+            now = keep(in_a, in_b)
+            if now != inside:
+                out.append(x)  # type: ignore[arg-type]
+                inside = now
+        return IntervalSet._from_bounds(out)
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda x, y: x or y)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda x, y: x and y)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda x, y: x and not y)
+
+    def __xor__(self, other: IntervalSet) -> IntervalSet:
+        return self._combine(other, lambda x, y: x != y)
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+
+    def complement(self, start: int, end: int) -> IntervalSet:
+        """Members of [start, end) that are not in the set."""
+        return IntervalSet.span(start, end) - self
+
+    def split(self, x: int) -> tuple[IntervalSet, IntervalSet]:
+        """(members < x, members >= x), in O(log n) plus the copy."""
+        b = self._bounds
+        i = bisect_left(b, x)  # boundaries < x
+        if i & 1 == 0:
+            # x is outside, or exactly the start of an interval
+            return IntervalSet._from_bounds(b[:i]), IntervalSet._from_bounds(b[i:])
+        if b[i] == x:
+            # x is the end of an interval: nothing to cut
+            return IntervalSet._from_bounds(b[:i + 1]), IntervalSet._from_bounds(b[i + 1:])
+        return IntervalSet._from_bounds(b[:i] + [x]), IntervalSet._from_bounds([x] + b[i:])
+
+    # -----------------------------
+    # Mappings
+    # -----------------------------
+    def shift(self, delta: int) -> IntervalSet:
+        return IntervalSet._from_bounds([x + delta for x in self._bounds])
+
+    def map_affine(self, pieces: Iterable[Piece]) -> IntervalSet:
+        """
+        Image of the set under a piecewise translation: members in
+        [start, end) of a piece move by its delta, all the others stay put.
+        The pieces must not overlap. One sweep, O((n + p) log (n + p)).
+        """
+        ordered = sorted(p for p in pieces if p[0] < p[1])
+        for (_, end, _), (start, _, _) in zip(ordered, ordered[1:]):
+            if start < end:
+                raise ValueError("map_affine pieces overlap")
+        piece_ends = [end for _, end, _ in ordered]
+
+        out: list[tuple[int, int]] = []
+        for a, b in self:
+            k = bisect_right(piece_ends, a)  # first piece ending after a
+            while a < b:
+                if k < len(ordered) and ordered[k][0] <= a:
+                    _, p_end, delta = ordered[k]
+                    stop = min(b, p_end)
+                    out.append((a + delta, stop + delta))
+                    k += 1
+                else:
+                    # gap before the next piece: unchanged
+                    stop = b if k == len(ordered) else min(b, ordered[k][0])
+                    out.append((a, stop))
+                a = stop
+        return IntervalSet(out)
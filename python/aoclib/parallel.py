@@ -0,0 +1,39 @@
+"""
+How many worker processes a helper (e.g. `aoclib.hashmine`) may start.
+
+`python -m aoc run -j N` and `python -m aoc serve` already run several solves
+at once: a solve that starts its own pool of "all the CPUs" oversubscribes
+the machine N times. They export each solve's share of the CPUs as
+AOC_WORKERS, which `default_workers()` honours. In any other multiprocessing
+child it returns 1 (work inline): nested pools never pay off.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+
+WORKERS_ENV = "AOC_WORKERS"
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (affinity mask / cgroup cpusets included)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def cpu_share(jobs: int) -> int:
+    """Workers each of `jobs` concurrent solves may use."""
+    return max(1, available_cpus() // max(1, jobs))
+
+
+def default_workers() -> int:
+    value = os.environ.get(WORKERS_ENV, "").strip()
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            raise ValueError(f"{WORKERS_ENV} must be an integer, got {value!r}") from None
+    if multiprocessing.parent_process() is not None:
+        return 1
+    return available_cpus()
@@ -0,0 +1,269 @@
+"""
+Shortest-path and best-first search helpers built on `heapq` and flat arrays.
+
+`queue.PriorityQueue` is a thread-safe queue: every put/get takes a lock and
+goes through several method calls. Searches here push plain tuples on a list
+with `heapq`, using an insertion counter as tie-breaker so that states never
+need to be comparable and equal priorities come out in FIFO order.
+
+- `dijkstra` / `astar`: hashable states, weighted edges, dict storage.
+- `best_first` / `uniform_cost`: tree searches (no deduplication) where the
+  state carries its own history (paths, routes, ...).
+- `bfs` / `dial`: states encoded as ints in `range(size)`, with distances
+  and parents in arrays instead of dicts.
+"""
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Callable, Generic, Hashable, Iterable, Iterator, TypeVar
+
+S = TypeVar("S")
+H = TypeVar("H", bound=Hashable)
+P = TypeVar("P")
+
+UNREACHABLE = -1
+
+
+class PriorityHeap(Generic[P, S]):
+    """
+    Minimal replacement for `queue.PriorityQueue` when a plain min-heap is
+    enough: no locks, and items are never compared (FIFO among equal priorities).
+    """
+
+    __slots__ = ("_heap", "_seq")
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[P, int, S]] = []
+        self._seq = count()
+
+    def push(self, priority: P, item: S) -> None:
+        heapq.heappush(self._heap, (priority, next(self._seq), item))
+
+    def pop(self) -> tuple[P, S]:
+        priority, _, item = heapq.heappop(self._heap)
+        return priority, item
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+
+# -----------------------------
+# Hashable states
+# -----------------------------
+@dataclass(slots=True)
+class SearchResult(Generic[H]):
+    dist: dict[H, int]
+    parent: dict[H, H]
+    # first goal state popped, if a goal was given and reached
+    goal: H | None = None
+
+    @property
+    def cost(self) -> int | None:
+        return None if self.goal is None else self.dist[self.goal]
+
+    def path(self, target: H | None = None) -> list[H]:
+        """States from a start to `target` (default: the goal), both included."""
+        node = self.goal if target is None else target
+        if node is None or node not in self.dist:
+            return []
+        out = [node]
+        while node in self.parent:
+            node = self.parent[node]
+            out.append(node)
+        out.reverse()
+        return out
+
+
+def astar(
+    starts: H | Iterable[H],
+    neighbours: Callable[[H], Iterable[tuple[H, int]]],
+    heuristic: Callable[[H], int],
+    goal: Callable[[H], bool] | None = None,
+    *,
+    multi: bool = False,
+) -> SearchResult[H]:
+    """
+    A* from one start (or several with `multi=True`). `neighbours(s)` yields
+    (next_state, weight) with weight >= 0; `heuristic` must not overestimate.
+    Without `goal` every reachable state is settled (Dijkstra).
+    """
+    start_states: Iterable[H] = starts if multi else (starts,)  # type: ignore[assignment]
+    dist: dict[H, int] = {}
+    parent: dict[H, H] = {}
+    seq = count()
+    heap: list[tuple[int, int, int, H]] = []
+    for s in start_states:
+        dist[s] = 0
+        heap.append((heuristic(s), next(seq), 0, s))
+    heapq.heapify(heap)
+
+    push, pop = heapq.heappush, heapq.heappop
+    while heap:
+        _, _, d, state = pop(heap)
+        if d != dist[state]:
+            continue  # stale entry
+        if goal is not None and goal(state):
+            return SearchResult(dist, parent, state)
+        for nxt, w in neighbours(state):
+            nd = d + w
+            if nd < dist.get(nxt, nd + 1):
+                dist[nxt] = nd
+                parent[nxt] = state
+                push(heap, (nd + heuristic(nxt), next(seq), nd, nxt))
+
+    return SearchResult(dist, parent)
+
+
+def dijkstra(
+    starts: H | Iterable[H],
+    neighbours: Callable[[H], Iterable[tuple[H, int]]],
+    goal: Callable[[H], bool] | None = None,
+    *,
+    multi: bool = False,
+) -> SearchResult[H]:
+    """Dijkstra on hashable states: `astar` with a zero heuristic."""
+    return astar(starts, neighbours, lambda _s: 0, goal, multi=multi)
+
+
+# -----------------------------
+# Tree searches (no deduplication)
+# -----------------------------
+def best_first(
+    starts: Iterable[tuple[P, S]],
+    expand: Callable[[S], Iterable[tuple[P, S]]],
+) -> Iterator[tuple[P, S]]:
+    """
+    Yield (priority, state) in increasing priority order, expanding each
+    state after it is yielded. States are never compared or deduplicated,
+    so they can carry lists (paths, routes). Stop iterating to stop the search.
+    """
+    seq = count()
+    heap = [(p, next(seq), s) for p, s in starts]
+    heapq.heapify(heap)
+    push, pop = heapq.heappush, heapq.heappop
+    while heap:
+        priority, _, state = pop(heap)
+        yield priority, state
+        for p, nxt in expand(state):
+            push(heap, (p, next(seq), nxt))
+
+
+def uniform_cost(
+    start: S,
+    expand: Callable[[S], Iterable[tuple[int, S]]],
+    goal: Callable[[S], bool],
+) -> tuple[int, S] | None:
+    """
+    Cheapest goal in a tree search: `expand(s)` yields (edge_cost, child).
+    Returns (total_cost, goal_state) or None.
+    """
+    def children(item: tuple[int, S]) -> Iterator[tuple[int, tuple[int, S]]]:
+        cost, state = item
+        for w, child in expand(state):
+            yield cost + w, (cost + w, child)
+
+    for cost, (_, state) in best_first([(0, (0, start))], children):
+        if goal(state):
+            return cost, state
+    return None
+
+
+# -----------------------------
+# Integer states: array-backed storage
+# -----------------------------
+@dataclass(slots=True)
+class BfsResult:
+    dist: array
+    parent: array
+    # states in the order they were dequeued
+    order: list[int] = field(default_factory=list)
+
+    def path(self, target: int) -> list[int]:
+        """States from the start to `target`, both included ([] if unreachable)."""
+        if self.dist[target] < 0:
+            return []
+        out = [target]
+        while self.parent[target] >= 0:
+            target = self.parent[target]
+            out.append(target)
+        out.reverse()
+        return out
+
+
+def bfs(
+    starts: int | Iterable[int],
+    neighbours: Callable[[int], Iterable[int]],
+    size: int,
+    goal: Callable[[int], bool] | None = None,
+) -> BfsResult:
+    """
+    Breadth-first search over states `0 <= s < size`. Distances and parents
+    live in `array('q')` (-1 = unreached / no parent). Stops after dequeuing
+    a state for which `goal` returns True.
+    """
+    dist = array("q", [UNREACHABLE]) * size
+    parent = array("q", [UNREACHABLE]) * size
+    order: list[int] = []
+    queue: deque[int] = deque([starts] if isinstance(starts, int) else starts)
+    for s in queue:
+        dist[s] = 0
+
+    while queue:
+        s = queue.popleft()
+        order.append(s)
+        if goal is not None and goal(s):
+            break
+        d = dist[s] + 1
+        for n in neighbours(s):
+            if dist[n] < 0:
+                dist[n] = d
+                parent[n] = s
+                queue.append(n)
+
+    return BfsResult(dist, parent, order)
+
+
+def dial(
+    starts: int | Iterable[int],
+    neighbours: Callable[[int], Iterable[tuple[int, int]]],
+    size: int,
+    max_weight: int,
+) -> array:
+    """
+    Dijkstra with a bucket queue (Dial's algorithm) for small integer
+    weights `0 <= w <= max_weight`: O(1) push and pop instead of O(log n).
+    Returns the distances as `array('q')`, -1 where unreachable.
+    """
+    dist = array("q", [UNREACHABLE]) * size
+    nbuckets = max_weight + 1
+    buckets: list[list[int]] = [[] for _ in range(nbuckets)]
+    pending = 0
+    for s in [starts] if isinstance(starts, int) else starts:
+        dist[s] = 0
+        buckets[0].append(s)
+        pending += 1
+
+    d = 0
+    while pending:
+        bucket = buckets[d % nbuckets]
+        while bucket:
+            s = bucket.pop()
+            pending -= 1
+            if dist[s] != d:
+                continue  # stale entry
+            for n, w in neighbours(s):
+                nd = d + w
+                if dist[n] < 0 or nd < dist[n]:
+                    dist[n] = nd
+                    buckets[nd % nbuckets].append(n)
+                    pending += 1
+        d += 1
+
+    return dist
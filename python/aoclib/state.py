@@ -0,0 +1,110 @@
+"""
+Search states packed into a single int.
+
+A `StateLayout` gives every field a fixed number of bits (enough for its
+largest value), the first field in the lowest bits:
+
+    layout = StateLayout(run=10, dir=3, pos=grid.size - 1)
+    s = layout.pack(run, d, pos)      # run | d << 4 | pos << 6
+    run, d, pos = layout.unpack(s)
+
+Packed states hash and compare as plain ints and, when the layout is small
+enough, index flat tables (`layout.table()`, `layout.visited()`) instead of
+dicts and sets of tuples. Hot loops can inline the arithmetic with
+`layout.shift(name)` and `layout.mask(name)`.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+
+# Above this many states a flat table wastes too much memory: use a set/dict
+MAX_TABLE_SIZE = 1 << 26
+
+
+@dataclass(frozen=True, slots=True)
+class BitField:
+    name: str
+    shift: int
+    width: int
+
+    @property
+    def mask(self) -> int:
+        return (1 << self.width) - 1
+
+
+class StateLayout:
+    __slots__ = ("fields", "bits", "_by_name")
+
+    def __init__(self, **maxima: int) -> None:
+        """One field per keyword, `name=largest value`, lowest bits first."""
+        if not maxima:
+            raise ValueError("StateLayout needs at least one field")
+        fields: list[BitField] = []
+        shift = 0
+        for name, largest in maxima.items():
+            if largest < 0:
+                raise ValueError(f"Field {name!r}: values must be >= 0, got max {largest}")
+            width = max(1, largest.bit_length())
+            fields.append(BitField(name, shift, width))
+            shift += width
+        self.fields: tuple[BitField, ...] = tuple(fields)
+        self.bits = shift
+        self._by_name = {f.name: f for f in fields}
+
+    @property
+    def size(self) -> int:
+        """Number of distinct packed values (every state is < size)."""
+        return 1 << self.bits
+
+    def shift(self, name: str) -> int:
+        return self._by_name[name].shift
+
+    def mask(self, name: str) -> int:
+        """Mask of the field *after* shifting it down."""
+        return self._by_name[name].mask
+
+    def pack(self, *values: int) -> int:
+        if len(values) != len(self.fields):
+            raise ValueError(f"Expected {len(self.fields)} values, got {len(values)}")
+        state = 0
+        for f, v in zip(self.fields, values):
+            if not 0 <= v <= f.mask:
+                raise ValueError(f"Field {f.name!r}: {v} does not fit in {f.width} bits")
+            state |= v << f.shift
+        return state
+
+    def unpack(self, state: int) -> tuple[int, ...]:
+        return tuple((state >> f.shift) & f.mask for f in self.fields)
+
+    def get(self, state: int, name: str) -> int:
+        f = self._by_name[name]
+        return (state >> f.shift) & f.mask
+
+    def replace(self, state: int, name: str, value: int) -> int:
+        """`state` with field `name` set to `value`."""
+        f = self._by_name[name]
+        return (state & ~(f.mask << f.shift)) | (value << f.shift)
+
+    # -----------------------------
+    # Flat tables indexed by state
+    # -----------------------------
+    def _check_table_size(self) -> None:
+        if self.size > MAX_TABLE_SIZE:
+            raise ValueError(
+                f"Layout needs {self.bits} bits: too large for a flat table, use a set or dict"
+            )
+
+    def table(self, fill: int = -1, typecode: str = "q") -> array:
+        """`array(typecode)` with one slot per state (distances, parents, ...)."""
+        self._check_table_size()
+        return array(typecode, [fill]) * self.size
+
+    def visited(self) -> bytearray:
+        """Zeroed byte per state, for seen/visited flags or small bitmasks."""
+        self._check_table_size()
+        return bytearray(self.size)
+
+    def __repr__(self) -> str:
+        inner = ", ".join(f"{f.name}:{f.width}" for f in self.fields)
+        return f"StateLayout({inner})"
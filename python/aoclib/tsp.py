@@ -0,0 +1,136 @@
+"""
+Shortest / longest Hamiltonian paths and cycles (Held-Karp bitmask DP).
+
+    best = held_karp(dist)                              # open path, any start
+    best = held_karp(dist, objective="max", cycle=True) # best round trip
+    best.cost, best.route                               # route = node indices
+
+`dist[i][j]` is the cost of going from i to j (a dense square matrix, need
+not be symmetric). `dp[mask, k]` is the best cost of a path visiting exactly
+the nodes in `mask` and ending in k; the table is filled one popcount layer
+at a time with NumPy, vectorised over all the masks of the layer, so the
+work is O(2^n * n^2) element operations instead of O(n!) Python steps:
+20 nodes take seconds, not centuries. Memory is 2^n * n int64 values (with
+a fixed start, 2^(n-1) * (n-1)).
+
+The route is rebuilt by walking the table backwards (no parent table).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal, Sequence
+
+from aoclib.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+Objective = Literal["min", "max"]
+
+# "unreachable" in the DP table; costs must stay far below it
+_INF = 1 << 60
+_MAX_COST = 1 << 40
+# 2^n * n int64 values: past this the table does not fit in memory anyway
+MAX_NODES = 25
+
+
+@dataclass(frozen=True, slots=True)
+class Tour:
+    cost: int
+    # node indices in visiting order; for cycles the start is repeated at the end
+    route: tuple[int, ...]
+
+
+def held_karp(
+    dist: Sequence[Sequence[int]],
+    *,
+    objective: Objective = "min",
+    cycle: bool = False,
+    start: int | None = None,
+) -> Tour:
+    """
+    Best Hamiltonian path (or cycle, if `cycle`) over all the nodes of `dist`.
+
+    Open paths start anywhere unless `start` is given; cycles start at
+    `start` (default 0), which only decides how the route is printed.
+    """
+    if objective not in ("min", "max"):
+        raise ValueError(f"objective must be 'min' or 'max', got {objective!r}")
+    d = np.asarray(dist, dtype=np.int64)
+    n = len(d)
+    if d.shape != (n, n):
+        raise ValueError(f"dist must be a square matrix, got shape {d.shape}")
+    if n == 0:
+        raise ValueError("held_karp needs at least one node")
+    if n > MAX_NODES:
+        raise ValueError(f"{n} nodes: the DP table would need 2^{n} * {n} entries")
+    if np.abs(d).max() >= _MAX_COST:
+        raise ValueError("costs too large for the int64 DP table")
+    if cycle and start is None:
+        start = 0
+    if start is not None and not 0 <= start < n:
+        raise ValueError(f"start {start} out of range for {n} nodes")
+
+    sign = 1 if objective == "min" else -1
+    d = d * sign
+
+    # The DP runs over `nodes` (all of them, or all but the fixed start);
+    # `first[k]` is the cost of reaching nodes[k] as the first of them.
+    if start is None:
+        nodes = list(range(n))
+        first = np.zeros(n, dtype=np.int64)
+    else:
+        nodes = [v for v in range(n) if v != start]
+        first = d[start, nodes]
+    m = len(nodes)
+    sub = d[np.ix_(nodes, nodes)]
+
+    if m == 0:
+        route = (start,) * (2 if cycle else 1)
+        cost = int(d[start, start]) if cycle else 0
+        return Tour(cost * sign, route)  # type: ignore[arg-type]
+
+    size = 1 << m
+    dp = np.full((size, m), _INF, dtype=np.int64)
+    singles = 1 << np.arange(m)
+    dp[singles, np.arange(m)] = first
+
+    masks = np.arange(size)
+    popcount = np.zeros(size, dtype=np.int8)
+    for k in range(m):
+        popcount += (masks >> k) & 1
+
+    for count in range(2, m + 1):
+        layer = np.flatnonzero(popcount == count)
+        for k in range(m):
+            targets = layer[(layer >> k) & 1 == 1]
+            # predecessor mask without k: best over its last node j of dp + d[j, k]
+            dp[targets, k] = (dp[targets ^ (1 << k)] + sub[:, k]).min(axis=1)
+
+    full = size - 1
+    totals = dp[full].copy()
+    if cycle:
+        totals += d[nodes, start]
+    last = int(np.argmin(totals))
+    cost = int(totals[last])
+
+    # walk back: the predecessor is any j that explains dp[mask, k]
+    order = [last]
+    mask, k = full, last
+    while mask != 1 << k:
+        prev = mask ^ (1 << k)
+        j = int(np.flatnonzero(dp[prev] + sub[:, k] == dp[mask, k])[0])
+        order.append(j)
+        mask, k = prev, j
+    order.reverse()
+
+    route = [nodes[i] for i in order]
+    if start is not None:
+        route.insert(0, start)
+    if cycle:
+        route.append(start)  # type: ignore[arg-type]
+    return Tour(cost * sign, tuple(route))
+
+
+def route_cost(dist: Sequence[Sequence[int]], route: Sequence[int]) -> int:
+    """Sum of `dist` along consecutive nodes of `route`."""
+    return sum(dist[a][b] for a, b in zip(route, route[1:]))
@@ -1,10 +1,14 @@
 # python/get_input.py
 from __future__ import annotations
 
-import inspect
+import os
+import sys
 from pathlib import Path
 from typing import Optional
 
+# Cache globale path -> testo, condivisa da tutte le istanze del processo
+_TEXT_CACHE: dict[Path, str] = {}
+
 
 class GetInput:
     """
@@ -15,9 +19,11 @@ class GetInput:
 
     Convenzione per i dati:
         ./data/{year}/day_{NN}/input_{part}.txt
+
+    Il costruttore non fa I/O: il file viene letto solo al primo accesso a
+    `.input` / `.input_list`, quindi importare una soluzione costa poco anche
+    quando l'input non c'è.
     """
-    input: str
-    input_lines: list
 
     def __init__(
         self,
@@ -28,11 +34,9 @@ class GetInput:
         root: Optional[Path] = None,
     ) -> None:
         # Chi mi ha chiamato? (file day_XX.py)
-        stack = inspect.stack()
-        # 0 = questo __init__
-        # 1 = punto dove è stato fatto GetInput()
-        caller_frame = stack[1]
-        caller_file = Path(caller_frame.filename).resolve()
+        # sys._getframe(1) = punto dove è stato fatto GetInput(), senza
+        # materializzare tutto lo stack come inspect.stack()
+        caller_file = Path(os.path.abspath(sys._getframe(1).f_code.co_filename))
         self.caller_file = caller_file
 
         # Se year non è passato, provo a inferirlo dalla cartella
@@ -70,28 +74,67 @@ class GetInput:
         self.day: int = day
         self.part: int = part
 
-        # Root del repo: assumo che questo file sia in ./python/get_input.py
-        # quindi repo_root è il parent della cartella python.
         if root is None:
-            root = Path(__file__).resolve().parent.parent
+            root = self.default_root()
         self.root: Path = root
 
-        # Path dell'input
-        self.path: Path = (
-            self.root
-            / "data"
-            / str(self.year)
-            / f"day_{self.day:02d}"
-            / f"input_{self.part}.txt"
-        )
-
-        if not self.path.exists():
-            raise FileNotFoundError(
-                f"File di input non trovato: {self.path}\n"
-                "Hai già lanciato tools/get_day.py per questo giorno?"
-            )
-
-        # Contenuto effettivo dell'input
-        self.input: str = self.path.read_text(encoding="utf-8")
-        self.input_list : list = self.input.splitlines()
+        # Path dell'input (non ancora letto)
+        self.path: Path = self.input_path(self.year, self.day, self.part, root=self.root)
+
+        self._input: Optional[str] = None
+        self._input_list: Optional[list[str]] = None
+
+    @property
+    def input(self) -> str:
+        """Contenuto effettivo dell'input, letto al primo accesso."""
+        if self._input is None:
+            self._input = self.read_text(self.path)
+        return self._input
+
+    @property
+    def input_list(self) -> list[str]:
+        if self._input_list is None:
+            self._input_list = self.input.splitlines()
+        return self._input_list
+
+    @staticmethod
+    def read_text(path: Path) -> str:
+        """Legge (una volta sola per processo) il file di input."""
+        text = _TEXT_CACHE.get(path)
+        if text is None:
+            try:
+                text = path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"File di input non trovato: {path}\n"
+                    "Hai già lanciato tools/get_day.py per questo giorno?"
+                ) from None
+            _TEXT_CACHE[path] = text
+        return text
 
+    @staticmethod
+    def clear_cache() -> None:
+        _TEXT_CACHE.clear()
+
+    @staticmethod
+    def default_root() -> Path:
+        # Root del repo: assumo che questo file sia in ./python/get_input.py
+        # quindi repo_root è il parent della cartella python.
+        return Path(__file__).resolve().parent.parent
+
+    @classmethod
+    def input_path(
+        cls,
+        year: int,
+        day: int,
+        part: int = 1,
+        *,
+        root: Optional[Path] = None,
+    ) -> Path:
+        """
+        Path convenzionale dell'input, senza leggere nulla:
+            {root}/data/{year}/day_{NN}/input_{part}.txt
+        """
+        if root is None:
+            root = cls.default_root()
+        return root / "data" / str(year) / f"day_{day:02d}" / f"input_{part}.txt"
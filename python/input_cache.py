@@ -0,0 +1,195 @@
+# python/input_cache.py
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from get_input import GetInput
+
+T = TypeVar("T")
+
+# Cartella della cache su disco (fuori da git, accanto ai dati)
+CACHE_DIR: Path = GetInput.default_root() / "data" / ".cache"
+
+# Dimensione massima complessiva della cache (override: AOC_CACHE_MAX_MB)
+DEFAULT_MAX_BYTES: int = 256 * 1024 * 1024
+
+# AOC_CACHE=0 disabilita completamente la cache (memoria e disco)
+ENV_ENABLED = "AOC_CACHE"
+ENV_MAX_MB = "AOC_CACHE_MAX_MB"
+
+_SUFFIX = ".pickle"
+
+
+def _enabled() -> bool:
+    return os.getenv(ENV_ENABLED, "1") not in ("0", "false", "no", "off")
+
+
+def _max_bytes() -> int:
+    value = os.getenv(ENV_MAX_MB)
+    return DEFAULT_MAX_BYTES if value is None else int(float(value) * 1024 * 1024)
+
+
+class ParseCache:
+    """
+    Cache persistente per il risultato di un passo di parsing/precalcolo.
+
+    Chiave = sha256(testo dell'input) + nome del passo + versione del parser
+    (+ eventuali argomenti extra). I valori sono serializzati con pickle in
+    `data/.cache/`; quando la cartella supera `max_bytes` vengono eliminati i
+    file usati meno di recente (l'mtime viene aggiornato a ogni hit).
+
+    Conviene restituire tipi builtin (tuple, list, dict, int, str): le classi
+    definite in un day_NN.py cambiano nome di modulo tra `python day_NN.py`
+    (`__main__`) e il runner, e un file che non si riesce a caricare viene
+    semplicemente trattato come un miss.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: Optional[int] = None) -> None:
+        self.directory = directory
+        self.max_bytes = _max_bytes() if max_bytes is None else max_bytes
+        self._memory: dict[str, Any] = {}
+
+    @staticmethod
+    def key_for(name: str, version: str, text: str, extra: tuple[Any, ...] = ()) -> str:
+        h = hashlib.sha256(text.encode("utf-8"))
+        h.update(b"\0" + name.encode("utf-8") + b"\0" + version.encode("utf-8"))
+        if extra:
+            h.update(b"\0" + repr(extra).encode("utf-8"))
+        safe_name = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in name)
+        return f"{safe_name}-{h.hexdigest()[:32]}"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Ritorna (hit, valore)."""
+        if key in self._memory:
+            return True, self._memory[key]
+
+        path = self._path(key)
+        try:
+            with path.open("rb") as fh:
+                value = pickle.load(fh)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            # file corrotto o classi non più importabili: lo considero un miss
+            path.unlink(missing_ok=True)
+            return False, None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._memory[key] = value
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # valore non serializzabile: resta solo in memoria
+            return
+
+        if len(payload) > self.max_bytes:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Scrittura atomica: più processi del runner possono scrivere insieme
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(payload)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Elimina i file meno recenti finché la cache sta in `max_bytes`."""
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self.directory.exists():
+            for path in self.directory.glob(f"*{_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+
+_DEFAULT_CACHE: Optional[ParseCache] = None
+
+
+def default_cache() -> ParseCache:
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = ParseCache()
+    return _DEFAULT_CACHE
+
+
+def cached_parse(
+    name: str,
+    version: str = "1",
+    *,
+    cache: Optional[ParseCache] = None,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decoratore opt-in: memoizza `fn(text, *args)` in memoria e su disco.
+
+        @cached_parse("2023-22-bricks", version="1")
+        def _settled_bricks(raw: str) -> tuple[...]:
+            ...
+
+    Il primo argomento deve essere il testo dell'input. Cambiare `version`
+    quando cambia il formato del valore restituito. Il valore ritornato è
+    condiviso tra le chiamate: non va modificato in place.
+    """
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(text: str, *args: Any, **kwargs: Any) -> T:
+            if not _enabled():
+                return fn(text, *args, **kwargs)
+
+            store = cache if cache is not None else default_cache()
+            extra = (args, tuple(sorted(kwargs.items()))) if (args or kwargs) else ()
+            key = store.key_for(name, version, text, extra)
+
+            hit, value = store.get(key)
+            if hit:
+                return value
+
+            value = fn(text, *args, **kwargs)
+            store.put(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -1,4 +1,6 @@
+use std::collections::HashMap;
 use std::env;
+use std::fmt::Display;
 use std::fs;
 use std::io;
 use std::path::PathBuf;
@@ -41,3 +43,78 @@ pub fn read_input(year: i32, day: u8, part: u8) -> io::Result<String> {
     let path = input_path(year, day, part)?;
     fs::read_to_string(path)
 }
+
+/// Path del registro delle risposte accettate di un anno:
+///   ./data/{year}/answers.txt
+///
+/// Formato (condiviso con Python e Nim), una riga per parte:
+///   {day} {part} {answer}
+/// Le righe vuote e quelle che iniziano con `#` sono ignorate.
+pub fn answers_path(year: i32) -> io::Result<PathBuf> {
+    Ok(repo_root()?
+        .join("data")
+        .join(year.to_string())
+        .join("answers.txt"))
+}
+
+/// Primo campo di `s` (saltando gli spazi iniziali) e il resto della riga.
+fn next_field(s: &str) -> Option<(&str, &str)> {
+    let s = s.trim_start();
+    if s.is_empty() {
+        return None;
+    }
+    let end = s.find(char::is_whitespace).unwrap_or(s.len());
+    Some(s.split_at(end))
+}
+
+/// Legge tutte le risposte note di un anno come mappa (day, part) -> answer.
+/// Se il file non esiste ritorna una mappa vuota.
+pub fn read_answers(year: i32) -> io::Result<HashMap<(u8, u8), String>> {
+    let path = answers_path(year)?;
+    let text = match fs::read_to_string(&path) {
+        Ok(text) => text,
+        Err(e) if e.kind() == io::ErrorKind::NotFound => return Ok(HashMap::new()),
+        Err(e) => return Err(e),
+    };
+
+    let mut answers = HashMap::new();
+    for line in text.lines() {
+        let line = line.trim();
+        if line.is_empty() || line.starts_with('#') {
+            continue;
+        }
+        // Come `line.split(maxsplit=2)` in Python: spazi e tab ripetuti
+        // separano un campo solo, la risposta è il resto della riga
+        let Some((day, rest)) = next_field(line) else {
+            continue;
+        };
+        let Some((part, rest)) = next_field(rest) else {
+            continue;
+        };
+        let answer = rest.trim();
+        if answer.is_empty() {
+            continue;
+        }
+        if let (Ok(day), Ok(part)) = (day.parse::<u8>(), part.parse::<u8>()) {
+            answers.insert((day, part), answer.to_string());
+        }
+    }
+    Ok(answers)
+}
+
+/// Risposta accettata per year/day/part, se registrata.
+pub fn expected_answer(year: i32, day: u8, part: u8) -> io::Result<Option<String>> {
+    Ok(read_answers(year)?.remove(&(day, part)))
+}
+
+/// Stampa `Part {part}: {answer}` e, se la risposta è registrata,
+/// segnala su stderr un eventuale mismatch.
+pub fn report<T: Display>(year: i32, day: u8, part: u8, answer: T) {
+    let answer = answer.to_string();
+    println!("Part {}: {}", part, answer);
+    if let Ok(Some(expected)) = expected_answer(year, day, part) {
+        if expected != answer {
+            eprintln!("[MISMATCH] {} day {:02} part {}: atteso {}", year, day, part, expected);
+        }
+    }
+}
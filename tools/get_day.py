@@ -1,14 +1,30 @@
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
+from typing import Optional
 
 import requests
 from bs4 import BeautifulSoup
 from markdownify import markdownify as md
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Sovrascrivibile per i test con un server HTTP locale
+BASE_URL = os.getenv("AOC_BASE_URL", "https://adventofcode.com").rstrip("/")
+USER_AGENT = "AoC helper script (personal use)"
+
+FIRST_YEAR = 2015
+# Metadati HTTP (ETag / Last-Modified) per le richieste condizionali
+META_FILE = ".http_meta.json"
 
 
 def parse_args() -> argparse.Namespace:
@@ -25,9 +41,43 @@ def parse_args() -> argparse.Namespace:
         type=int,
         help="Giorno (1-25)"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Scarica tutti i giorni già pubblicati dell'anno -y"
+    )
+    parser.add_argument(
+        "--missing",
+        action="store_true",
+        help="Scarica solo i giorni a cui manca input o testo (di -y, o di tutti gli anni)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ricontrolla anche i file esistenti (richiesta condizionale ETag/Last-Modified)"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=4,
+        help="Download in parallelo in modalità bulk (default: 4)"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=1.0,
+        help="Richieste al secondo massime verso il server (default: 1.0)"
+    )
 
     args = parser.parse_args()
 
+    if args.all or args.missing:
+        if args.day is not None:
+            parser.error("--all/--missing non vanno usati insieme a -d/--day.")
+        if args.all and args.year is None:
+            parser.error("--all richiede -y/--year.")
+        return args
+
     # Se uno solo dei due è presente → errore
     if (args.year is None) ^ (args.day is None):  # XOR
         parser.error("Devi specificare *entrambi* -y/--year e -d/--day, oppure nessuno.")
@@ -54,26 +104,164 @@ def get_session_token() -> str:
     return token
 
 
+def make_session(token: str, pool_size: int = 4, retries: int = 5) -> requests.Session:
+    """
+    Sessione unica per tutti i download: connessioni riusate (pool) e
+    retry con backoff esponenziale su errori di rete, 429 e 5xx
+    (rispettando l'header Retry-After).
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=1.0,  # 1s, 2s, 4s, ...
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # Cookie di sessione AoC
+    session.cookies.set("session", token)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+class RateLimiter:
+    """Intervallo minimo tra due richieste, condiviso tra i thread."""
+
+    def __init__(self, per_second: float) -> None:
+        self.interval = 0.0 if per_second <= 0 else 1.0 / per_second
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 def ensure_day_dir(root: Path, year: int, day: int) -> Path:
     day_dir = root / "data" / str(year) / f"day_{day:02d}"
     day_dir.mkdir(parents=True, exist_ok=True)
     return day_dir
 
 
-def download_instructions(session: requests.Session, year: int, day: int, day_dir: Path) -> None:
-    instr_path = day_dir / "instructions.md"
-    if instr_path.exists():
-        print(f"[SKIP] {instr_path} esiste già.")
-        return
+def days_in_year(year: int) -> int:
+    # Dal 2025 Advent of Code ha 12 giorni
+    return 12 if year >= 2025 else 25
+
+
+def released_days(year: int, today: Optional[date] = None) -> list[int]:
+    """Giorni già pubblicati (per l'anno in corso solo fino a oggi, a dicembre)."""
+    today = today or date.today()
+    last = days_in_year(year)
+    if year > today.year or (year == today.year and today.month < 12):
+        return []
+    if year == today.year:
+        last = min(last, today.day)
+    return list(range(1, last + 1))
+
 
-    url = f"https://adventofcode.com/{year}/day/{day}"
+def is_missing(root: Path, year: int, day: int) -> bool:
+    day_dir = root / "data" / str(year) / f"day_{day:02d}"
+    return not (day_dir / "input_1.txt").exists() or not (day_dir / "instructions.md").exists()
+
+
+def _load_meta(day_dir: Path) -> dict[str, dict[str, str]]:
+    try:
+        return json.loads((day_dir / META_FILE).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Scrive su un file temporaneo nella stessa cartella e poi lo rinomina."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _get(
+    session: requests.Session,
+    url: str,
+    target: Path,
+    *,
+    refresh: bool,
+    limiter: Optional[RateLimiter],
+) -> Optional[requests.Response]:
+    """
+    GET con richiesta condizionale se il file esiste già.
+    Ritorna None se il file va lasciato com'è (SKIP o 304).
+    """
+    if target.exists() and not refresh:
+        print(f"[SKIP] {target} esiste già.")
+        return None
+
+    headers: dict[str, str] = {}
+    if target.exists():
+        meta = _load_meta(target.parent).get(target.name, {})
+        if "etag" in meta:
+            headers["If-None-Match"] = meta["etag"]
+        if "last_modified" in meta:
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    if limiter is not None:
+        limiter.wait()
     print(f"[GET] {url}")
-    resp = session.get(url)
+    resp = session.get(url, headers=headers, timeout=30)
+
+    if resp.status_code == 304:
+        print(f"[SKIP] {target} non modificato.")
+        return None
     if not resp.ok:
         print(
-            f"[ERRORE] Impossibile scaricare instructions (HTTP {resp.status_code}) da {url}",
+            f"[ERRORE] Impossibile scaricare {target.name} (HTTP {resp.status_code}) da {url}",
             file=sys.stderr,
         )
+        return None
+    return resp
+
+
+def _save(target: Path, text: str, resp: requests.Response) -> None:
+    write_atomic(target, text)
+
+    meta = _load_meta(target.parent)
+    entry = {}
+    if resp.headers.get("ETag"):
+        entry["etag"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified"):
+        entry["last_modified"] = resp.headers["Last-Modified"]
+    if entry:
+        meta[target.name] = entry
+        write_atomic(target.parent / META_FILE, json.dumps(meta, indent=2) + "\n")
+
+    print(f"[OK] Scritto {target}")
+
+
+def download_instructions(
+    session: requests.Session,
+    year: int,
+    day: int,
+    day_dir: Path,
+    *,
+    refresh: bool = False,
+    limiter: Optional[RateLimiter] = None,
+) -> None:
+    instr_path = day_dir / "instructions.md"
+    url = f"{BASE_URL}/{year}/day/{day}"
+    resp = _get(session, url, instr_path, refresh=refresh, limiter=limiter)
+    if resp is None:
         return
 
     soup = BeautifulSoup(resp.text, "html.parser")
@@ -88,24 +276,22 @@ def download_instructions(session: requests.Session, year: int, day: int, day_di
     parts = [md(a.decode_contents()) for a in articles]
     content = "\n\n".join(parts)
 
-    instr_path.write_text(content, encoding="utf-8")
-    print(f"[OK] Scritto {instr_path}")
+    _save(instr_path, content, resp)
 
 
-def download_input(session: requests.Session, year: int, day: int, day_dir: Path) -> None:
+def download_input(
+    session: requests.Session,
+    year: int,
+    day: int,
+    day_dir: Path,
+    *,
+    refresh: bool = False,
+    limiter: Optional[RateLimiter] = None,
+) -> None:
     input_path = day_dir / "input_1.txt"
-    if input_path.exists():
-        print(f"[SKIP] {input_path} esiste già.")
-        return
-
-    url = f"https://adventofcode.com/{year}/day/{day}/input"
-    print(f"[GET] {url}")
-    resp = session.get(url)
-    if not resp.ok:
-        print(
-            f"[ERRORE] Impossibile scaricare input (HTTP {resp.status_code}) da {url}",
-            file=sys.stderr,
-        )
+    url = f"{BASE_URL}/{year}/day/{day}/input"
+    resp = _get(session, url, input_path, refresh=refresh, limiter=limiter)
+    if resp is None:
         return
 
     # Mantengo una newline finale
@@ -113,8 +299,30 @@ def download_input(session: requests.Session, year: int, day: int, day_dir: Path
     if not text.endswith("\n"):
         text += "\n"
 
-    input_path.write_text(text, encoding="utf-8")
-    print(f"[OK] Scritto {input_path}")
+    _save(input_path, text, resp)
+
+
+def download_day(
+    session: requests.Session,
+    repo_root: Path,
+    year: int,
+    day: int,
+    *,
+    refresh: bool = False,
+    limiter: Optional[RateLimiter] = None,
+) -> None:
+    day_dir = ensure_day_dir(repo_root, year, day)
+    download_instructions(session, year, day, day_dir, refresh=refresh, limiter=limiter)
+    download_input(session, year, day, day_dir, refresh=refresh, limiter=limiter)
+
+
+def bulk_targets(repo_root: Path, args: argparse.Namespace) -> list[tuple[int, int]]:
+    today = date.today()
+    years = [args.year] if args.year is not None else list(range(FIRST_YEAR, today.year + 1))
+    targets = [(y, d) for y in years for d in released_days(y, today)]
+    if args.missing:
+        targets = [(y, d) for y, d in targets if is_missing(repo_root, y, d)]
+    return targets
 
 
 def main() -> None:
@@ -123,6 +331,30 @@ def main() -> None:
 
     # Argomenti
     args = parse_args()
+
+    token = get_session_token()
+
+    if args.all or args.missing:
+        targets = bulk_targets(repo_root, args)
+        if not targets:
+            print("[OK] Niente da scaricare.")
+            return
+        print(f"[BULK] {len(targets)} giorni, jobs={args.jobs}, max {args.rate:g} req/s")
+
+        limiter = RateLimiter(args.rate)
+        jobs = max(1, args.jobs)
+        with make_session(token, pool_size=jobs) as session, ThreadPoolExecutor(jobs) as pool:
+            futures = [
+                pool.submit(
+                    download_day, session, repo_root, year, day,
+                    refresh=args.refresh, limiter=limiter,
+                )
+                for year, day in targets
+            ]
+            for future in futures:
+                future.result()
+        return
+
     year = args.year
     day = args.day
 
@@ -132,19 +364,8 @@ def main() -> None:
             file=sys.stderr,
         )
 
-    token = get_session_token()
-
-    day_dir = ensure_day_dir(repo_root, year, day)
-
-    with requests.Session() as session:
-        # Cookie di sessione AoC
-        session.cookies.set("session", token)
-        session.headers.update(
-            {"User-Agent": "AoC helper script (personal use)"}
-        )
-
-        download_instructions(session, year, day, day_dir)
-        download_input(session, year, day, day_dir)
+    with make_session(token) as session:
+        download_day(session, repo_root, year, day, refresh=args.refresh)
 
 
 if __name__ == "__main__":
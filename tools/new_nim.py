@@ -6,7 +6,6 @@ import sys
 from datetime import date
 from pathlib import Path
 
-import requests
 import get_day
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -75,13 +74,7 @@ def ensure_day_data(repo_root: Path, year: int, day: int) -> None:
     day_dir = get_day.ensure_day_dir(repo_root, year, day)
 
     # Download instructions and input (idempotent: SKIP if they already exist)
-    with requests.Session() as session:
-        # AoC session cookie
-        session.cookies.set("session", token)
-        session.headers.update(
-            {"User-Agent": "AoC helper script (new_nim.py, personal use)"}
-        )
-
+    with get_day.make_session(token) as session:
         get_day.download_instructions(session, year, day, day_dir)
         get_day.download_input(session, year, day, day_dir)
 
@@ -5,7 +5,6 @@ import argparse
 import sys
 from datetime import date
 from pathlib import Path
-import requests
 
 import get_day  
 
@@ -53,13 +52,7 @@ def ensure_day_data(repo_root: Path, year: int, day: int) -> None:
 
     # Scarica instructions e input (idempotente: se esistono, fa SKIP)
 
-    with requests.Session() as session:
-        # Cookie di sessione AoC
-        session.cookies.set("session", token)
-        session.headers.update(
-            {"User-Agent": "AoC helper script (personal use)"}
-        )
-
+    with get_day.make_session(token) as session:
         get_day.download_instructions(session, year, day, day_dir)
         get_day.download_input(session, year, day, day_dir)
 